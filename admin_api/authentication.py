@@ -0,0 +1,37 @@
+from typing import Any, Optional, Tuple
+
+from redis.exceptions import RedisError
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+
+from admin_api.services.dashboard_events import consume_stream_token
+from user.models import CustomUser
+
+
+class StreamTokenAuthentication(BaseAuthentication):
+    """
+    ?token= 1회용 스트림 토큰 인증 (헤더를 보낼 수 없는 EventSource 용)
+    토큰이 없으면 다음 인증 클래스(JWT)로 넘어감
+    """
+
+    def authenticate(self, request: Request) -> Optional[Tuple[CustomUser, Any]]:
+        token = request.query_params.get("token")
+        if not token:
+            return None
+        try:
+            user_id = consume_stream_token(token)
+        except RedisError:
+            raise AuthenticationFailed("스트림 토큰을 확인할 수 없습니다.")
+        user = (
+            CustomUser.objects.filter(pk=user_id, is_active=True).first()
+            if user_id
+            else None
+        )
+        if user is None:
+            raise AuthenticationFailed("만료되었거나 이미 사용한 스트림 토큰입니다.")
+        return user, None
+
+    def authenticate_header(self, request: Request) -> str:
+        # 첫 번째 인증 클래스의 값이 WWW-Authenticate 로 쓰이므로 401 응답 유지
+        return "Bearer"
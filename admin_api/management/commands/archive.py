@@ -0,0 +1,56 @@
+from datetime import timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils.timezone import now
+
+from admin_api.services.archive_service import TARGETS, archive_target
+
+
+class Command(BaseCommand):
+    help = (
+        "오래된 로그인 로그 / 처리 완료 Tally / 환불 완료 이력 / 만료 토큰을 "
+        "gzip JSONL 파일로 옮기고 원본 테이블에서 삭제합니다."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            required=True,
+            help="이 일수보다 오래된 행을 아카이브",
+        )
+        parser.add_argument(
+            "--target",
+            action="append",
+            choices=list(TARGETS),
+            help="아카이브 대상 (여러 번 지정 가능, 기본 전체)",
+        )
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument("--delete-batch-size", type=int, default=500)
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.05,
+            help="삭제 배치 사이 대기 시간 (초)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="대상 건수만 출력")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["older_than"] <= 0:
+            raise CommandError("--older-than 은 1 이상이어야 합니다.")
+
+        cutoff = now() - timedelta(days=options["older_than"])
+        for name in options["target"] or TARGETS:
+            count = archive_target(
+                TARGETS[name],
+                cutoff,
+                chunk_size=options["chunk_size"],
+                delete_batch_size=options["delete_batch_size"],
+                pause=options["pause"],
+                dry_run=options["dry_run"],
+            )
+            verb = "아카이브 대상" if options["dry_run"] else "아카이브 완료"
+            self.stdout.write(f"{name}: {verb} {count}건")
+
+        self.stdout.write(self.style.SUCCESS("아카이브 작업 완료"))
@@ -0,0 +1,44 @@
+from datetime import date
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from dbre_BE.partitioning import (
+    DEFAULT_MONTHS_AHEAD,
+    PARTITIONED_TABLES,
+    detach_partitions_before,
+    ensure_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = "이력 테이블의 미래 월 파티션을 미리 생성하고, 필요 시 오래된 파티션을 분리합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=DEFAULT_MONTHS_AHEAD,
+            help="현재 월 이후 미리 만들 파티션 개월 수",
+        )
+        parser.add_argument(
+            "--detach-before",
+            help="이 월(YYYY-MM) 이전 파티션을 분리",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        detach_before = None
+        if options["detach_before"]:
+            try:
+                detach_before = date.fromisoformat(f"{options['detach_before']}-01")
+            except ValueError:
+                raise CommandError("--detach-before 는 YYYY-MM 형식이어야 합니다.")
+
+        for table in PARTITIONED_TABLES:
+            created = ensure_partitions(table, months_ahead=options["months_ahead"])
+            self.stdout.write(f"{table}: 파티션 {len(created)}개 생성 {created}")
+            if detach_before:
+                detached = detach_partitions_before(table, detach_before)
+                self.stdout.write(f"{table}: 파티션 {len(detached)}개 분리 {detached}")
+
+        self.stdout.write(self.style.SUCCESS("파티션 점검 완료"))
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.6 on 2026-10-19 08:12
+
+import django.utils.timezone
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_api", "0002_adminloginlog_email"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="adminloginlog",
+            name="login_datetime",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.6 on 2026-10-19 08:20
+
+from typing import Any
+
+from django.db import migrations
+
+from dbre_BE.partitioning import convert_to_partitioned
+
+
+def partition_admin_login_logs(apps: Any, schema_editor: Any) -> None:
+    convert_to_partitioned(schema_editor, "admin_login_logs")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_api", "0003_login_datetime_default"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_admin_login_logs, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,7 @@
 from typing import Any
 
 from django.db import models
+from django.utils import timezone
 
 from user.models import CustomUser
 
@@ -14,7 +15,8 @@ class AdminLoginLog(models.Model):
     )
     email = models.EmailField(null=True, blank=True)
     user_name = models.CharField(max_length=50)  # 사용자 이름 별도 저장
-    login_datetime = models.DateTimeField(auto_now_add=True)
+    # write-behind 로 bulk_create 될 때 실제 로그인 시각을 보존하기 위해 default 사용
+    login_datetime = models.DateTimeField(default=timezone.now)
     ip_address = models.GenericIPAddressField()
     user_agent = models.CharField(max_length=255)
 
@@ -15,6 +15,7 @@ from payment.services.payment_service import RefundService
 from subscription.models import SubHistories, Subs
 from tally.models import Tally
 from user.models import CustomUser
+from user.tokens import RefreshToken, issue_token_pair
 
 
 class UserInfoSerializer(serializers.ModelSerializer):
@@ -124,16 +125,17 @@ class SubscriptionHistorySerializer(serializers.ModelSerializer):
         """YYYY-MM-DD 형식으로 변환"""
         return obj.change_date.strftime("%Y-%m-%d")
 
+    STATUS_LABELS = {
+        "renewal": "결제",
+        "cancel": "구독 취소",
+        "pause": "일시 정지",
+        "restart": "재개",
+        "refund_pending": "환불 대기",
+    }
+
     def get_status(self, obj: SubHistories) -> str:
         """변경 상태를 한글로 변환"""
-        status_mapping = {
-            "renewal": "결제",
-            "cancel": "구독 취소",
-            "pause": "일시 정지",
-            "restart": "재개",
-            "refund_pending": "환불 대기",
-        }
-        return status_mapping.get(obj.status, "기타")
+        return self.STATUS_LABELS.get(obj.status, "기타")
 
     def get_amount(self, obj: SubHistories) -> str:
         """해당 변경 상태에 따라 결제 금액 반환"""
@@ -151,6 +153,30 @@ class SubscriptionHistorySerializer(serializers.ModelSerializer):
         return "-"
 
 
+class ArchivedSubscriptionHistorySerializer(serializers.Serializer):
+    """
+    아카이브 파일에서 읽은 구독 변경 이력 (환불 완료 건)
+    context["refunds"]: 구독 id 별 최근 환불 금액 (행마다 조회하지 않도록 미리 조회)
+    """
+
+    change_date = serializers.DateTimeField(format="%Y-%m-%d")
+    status = serializers.SerializerMethodField()
+    amount = serializers.SerializerMethodField()
+    archived = serializers.SerializerMethodField()
+
+    def get_status(self, obj: dict) -> str:
+        return SubscriptionHistorySerializer.STATUS_LABELS.get(obj["status"], "기타")
+
+    def get_amount(self, obj: dict) -> str:
+        refund_amount = self.context.get("refunds", {}).get(obj["sub_id"])
+        if obj["status"] == "cancel" and refund_amount:
+            return f"-{int(refund_amount):,}원"
+        return "-"
+
+    def get_archived(self, obj: dict) -> bool:
+        return True
+
+
 # class SubsCancelledSerializer(serializers.ModelSerializer):
 #     user_name = serializers.CharField(source="user.name", read_only=True)
 #     user_email = serializers.CharField(source="user.email", read_only=True)
@@ -175,6 +201,8 @@ class SubscriptionHistorySerializer(serializers.ModelSerializer):
 
 
 class AdminLoginSerializer(TokenObtainPairSerializer):
+    token_class = RefreshToken  # type: ignore[assignment]
+
     email = serializers.EmailField(
         required=True, help_text="관리자 이메일 (예: admin@example.com)"
     )
@@ -208,12 +236,13 @@ class AdminLoginSerializer(TokenObtainPairSerializer):
         except ObjectDoesNotExist:
             raise serializers.ValidationError("존재하지 않는 관리자 계정입니다.")
 
-        data = super().validate(attrs)
+        # 위에서 검증한 사용자로 바로 발급 (authenticate() 재실행 없음)
+        access_token, refresh_token = issue_token_pair(self.user)
 
         return {
             "message": "관리자 로그인이 완료되었습니다.",
-            "access_token": data["access"],
-            "refresh_token": data["refresh"],
+            "access_token": access_token,
+            "refresh_token": refresh_token,
             "is_superuser": self.user.is_superuser,
         }
 
@@ -398,6 +427,40 @@ class AdminCancelReasonSerializer(serializers.Serializer):
     count = serializers.IntegerField()
 
 
+class AdminCancelReasonTrendItemSerializer(serializers.Serializer):
+    period = serializers.DateField(help_text="기간 시작일 (day/week/month 단위)")
+    cancelled_reason = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class AdminOtherReasonSerializer(serializers.Serializer):
+    other_reason = serializers.CharField(help_text="정규화된 기타 사유")
+    count = serializers.IntegerField()
+
+
+class AdminCancelReasonTrendSerializer(serializers.Serializer):
+    granularity = serializers.CharField()
+    trend = AdminCancelReasonTrendItemSerializer(many=True)
+    other_reasons = AdminOtherReasonSerializer(many=True)
+
+
+class CohortMonthSerializer(serializers.Serializer):
+    month_offset = serializers.IntegerField(help_text="코호트 시작 후 경과 월")
+    active_count = serializers.IntegerField()
+    retention_rate = serializers.FloatField(help_text="유지율 (%)")
+
+
+class CohortRowSerializer(serializers.Serializer):
+    cohort_month = serializers.CharField(help_text="최초 결제 월 (YYYY-MM)")
+    cohort_size = serializers.IntegerField()
+    months = CohortMonthSerializer(many=True)
+
+
+class CohortRetentionSerializer(serializers.Serializer):
+    updated_at = serializers.DateTimeField(allow_null=True)
+    cohorts = CohortRowSerializer(many=True)
+
+
 class AdminTallySerializer(serializers.Serializer):
 
     user = serializers.SerializerMethodField()
@@ -431,50 +494,55 @@ class AdminTallyCompleteSerializer(serializers.Serializer):
     tally_id = serializers.IntegerField()
 
 
-class AdminSalesSerializer(serializers.ModelSerializer):
-    """결제 및 환불 내역 직렬화"""
+class AdminTallyBulkCompleteSerializer(serializers.Serializer):
+    tally_ids = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False, max_length=1000
+    )
+
 
+class BulkActionResultSerializer(serializers.Serializer):
+    """일괄 처리 ID별 결과"""
+
+    id = serializers.CharField()
+    result = serializers.CharField()
+
+
+class BulkActionResponseSerializer(serializers.Serializer):
+    updated = serializers.IntegerField(help_text="실제로 변경된 건수")
+    results = BulkActionResultSerializer(many=True)
+
+
+class AdminSalesSerializer(serializers.Serializer):
+    """거래 원장 행(결제 또는 환불) 직렬화"""
+
+    id = serializers.IntegerField(source="pay_id")
     transaction_date = serializers.SerializerMethodField()
     transaction_amount = serializers.SerializerMethodField()
     transaction_type = serializers.SerializerMethodField()
     user = serializers.SerializerMethodField()
 
-    class Meta:
-        model = Pays
-        fields = [
-            "id",
-            "transaction_date",
-            "transaction_amount",
-            "transaction_type",
-            "user",
-        ]
-
-    def get_transaction_date(self, obj: Pays) -> datetime.date:
-        return (
-            obj.refund_at.date()  # type: ignore
-            if self.context.get("is_refund")
-            else obj.paid_at.date()
-        )
+    def get_transaction_date(self, obj: dict) -> datetime.date:
+        event_at: datetime.datetime = obj["event_at"]
+        return event_at.date()
 
-    def get_transaction_amount(self, obj: Pays) -> str:
-        if self.context.get("is_refund"):  # 환불 내역일 경우
-            return f"-{int(obj.refund_amount):,} 원"  # type: ignore
-        return f"{int(obj.amount):,} 원"  # 결제 내역일 경우
+    def get_transaction_amount(self, obj: dict) -> str:
+        amount = int(obj["signed_amount"])
+        if amount < 0:  # 환불 내역일 경우
+            return f"-{-amount:,} 원"
+        return f"{amount:,} 원"
 
-    def get_transaction_type(self, obj: Pays) -> str:
-        if self.context.get("is_refund"):
-            return "구독취소"  # 환불이 있는 경우에만 "구독취소"
-        return "결제"  # 결제 내역은 항상 "결제"로 표시
+    def get_transaction_type(self, obj: dict) -> str:
+        if obj["transaction_type"] == "refund":
+            return "구독취소"
+        return "결제"
 
-    def get_user(self, obj: Pays) -> dict:
-        if obj.user:
-            return {
-                "id": obj.user.id,
-                "name": obj.user.name,
-                "email": obj.user.email,
-                "phone": obj.user.phone,
-            }
-        return {"id": None, "name": None, "email": None, "phone": None}
+    def get_user(self, obj: dict) -> dict:
+        return {
+            "id": obj["user_ref"],
+            "name": obj["user_name"],
+            "email": obj["user_email"],
+            "phone": obj["user_phone"],
+        }
 
 
 class AdminPasswordChangeSerializer(serializers.Serializer):
@@ -626,6 +694,12 @@ class ConfirmUserDeletionRequestSerializer(serializers.Serializer):
     user_id = serializers.CharField(required=True)
 
 
+class BulkUserIdsRequestSerializer(serializers.Serializer):
+    user_ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=1000
+    )
+
+
 # 응답을 위한 시리얼라이저
 class ConfirmUserDeletionResponseSerializer(serializers.Serializer):
     message = serializers.CharField()
@@ -657,3 +731,15 @@ class AdminLoginLogSerializer(serializers.ModelSerializer):
     class Meta:
         model = AdminLoginLog
         fields = "__all__"
+
+
+class ArchivedAdminLoginLogSerializer(serializers.Serializer):
+    """아카이브 파일에서 읽은 관리자 로그인 로그"""
+
+    id = serializers.IntegerField()
+    user = serializers.CharField(source="user_id", allow_null=True)
+    email = serializers.EmailField(allow_null=True)
+    user_name = serializers.CharField()
+    login_datetime = serializers.DateTimeField()
+    ip_address = serializers.IPAddressField()
+    user_agent = serializers.CharField()
@@ -0,0 +1,280 @@
+import datetime
+import decimal
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Q
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from admin_api.models import AdminLoginLog
+from dbre_BE.conditional import bump_table
+from subscription.models import SubHistories
+from tally.models import Tally
+
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveTarget:
+    """아카이브 대상 테이블 정의"""
+
+    def __init__(
+        self,
+        name: str,
+        model: type[models.Model],
+        date_field: str,
+        fields: List[str],
+        condition: Optional[Q] = None,
+        user_field: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.model = model
+        self.date_field = date_field
+        self.fields = fields
+        self.condition = condition or Q()
+        self.user_field = user_field
+
+    def cold_rows(self, cutoff: datetime.datetime) -> models.QuerySet:
+        return self.model._default_manager.filter(
+            self.condition, **{f"{self.date_field}__lt": cutoff}
+        )
+
+
+TARGETS: Dict[str, ArchiveTarget] = {
+    target.name: target
+    for target in [
+        ArchiveTarget(
+            "login_logs",
+            AdminLoginLog,
+            "login_datetime",
+            [
+                "id",
+                "user_id",
+                "email",
+                "user_name",
+                "login_datetime",
+                "ip_address",
+                "user_agent",
+            ],
+            user_field="user_id",
+        ),
+        ArchiveTarget(
+            "tally",
+            Tally,
+            "submitted_at",
+            [
+                "id",
+                "user_id",
+                "form_id",
+                "form_name",
+                "response_id",
+                "submitted_at",
+                "form_data",
+                "complete",
+                "created_at",
+            ],
+            # 처리 완료된 요청만
+            condition=Q(complete=True),
+            user_field="user_id",
+        ),
+        ArchiveTarget(
+            "sub_histories",
+            SubHistories,
+            "change_date",
+            [
+                "id",
+                "sub_id",
+                "user_id",
+                "plan_id",
+                "change_date",
+                "status",
+                "cancelled_reason",
+                "other_reason",
+            ],
+            # 환불까지 끝난 취소 이력만
+            condition=Q(status="cancel"),
+            user_field="user_id",
+        ),
+        ArchiveTarget(
+            "tokens",
+            OutstandingToken,
+            "expires_at",
+            [
+                "id",
+                "user_id",
+                "jti",
+                "created_at",
+                "expires_at",
+                "blacklistedtoken__blacklisted_at",
+            ],
+            user_field="user_id",
+        ),
+    ]
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    raise TypeError(f"직렬화할 수 없는 값: {value!r}")
+
+
+def _target_dir(target: ArchiveTarget) -> str:
+    path = os.path.join(settings.ARCHIVE_ROOT, target.name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _manifest_path(target: ArchiveTarget) -> str:
+    return os.path.join(_target_dir(target), "manifest.jsonl")
+
+
+def _write_chunk(target: ArchiveTarget, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """청크 하나를 gzip JSONL 파일로 기록하고 manifest 에 추가"""
+    filename = f"{target.name}_{datetime.datetime.now():%Y%m%d%H%M%S}_{rows[0]['id']}"
+    path = os.path.join(_target_dir(target), f"{filename}.jsonl.gz")
+    tmp_path = f"{path}.part"
+
+    digest = hashlib.sha256()
+    with gzip.open(tmp_path, "wb") as fp:
+        for row in rows:
+            line = json.dumps(row, default=_json_default, ensure_ascii=False)
+            data = f"{line}\n".encode()
+            digest.update(data)
+            fp.write(data)
+    os.replace(tmp_path, path)
+
+    dates = [row[target.date_field] for row in rows]
+    entry = {
+        "file": os.path.basename(path),
+        "rows": len(rows),
+        "min_id": rows[0]["id"],
+        "max_id": rows[-1]["id"],
+        "min_date": min(dates).isoformat(),
+        "max_date": max(dates).isoformat(),
+        "sha256": digest.hexdigest(),
+        "created_at": datetime.datetime.now().isoformat(),
+    }
+    # manifest 에 기록된 뒤에만 원본 삭제 (중간 실패 시 재실행으로 중복될 수 있어 읽을 때 id 로 제거)
+    with open(_manifest_path(target), "a") as manifest:
+        manifest.write(json.dumps(entry) + "\n")
+        manifest.flush()
+        os.fsync(manifest.fileno())
+    return entry
+
+
+def _delete_in_batches(
+    target: ArchiveTarget, ids: List[Any], batch_size: int, pause: float
+) -> None:
+    """짧은 트랜잭션으로 나누어 삭제 (잠금/WAL 폭증 방지)"""
+    for start in range(0, len(ids), batch_size):
+        with transaction.atomic():
+            target.model._default_manager.filter(
+                id__in=ids[start : start + batch_size]
+            ).delete()
+        if pause:
+            time.sleep(pause)
+
+
+def archive_target(
+    target: ArchiveTarget,
+    cutoff: datetime.datetime,
+    chunk_size: int = 5000,
+    delete_batch_size: int = 500,
+    pause: float = 0.05,
+    dry_run: bool = False,
+) -> int:
+    """cutoff 이전의 cold row 를 청크 단위로 파일에 옮기고 원본 삭제"""
+    queryset = target.cold_rows(cutoff)
+    if dry_run:
+        return queryset.count()
+
+    archived = 0
+    last_id: Any = None
+    while True:
+        chunk_qs = queryset.order_by("id")
+        if last_id is not None:
+            chunk_qs = chunk_qs.filter(id__gt=last_id)
+        rows = list(chunk_qs.values(*target.fields)[:chunk_size])
+        if not rows:
+            break
+
+        entry = _write_chunk(target, rows)
+        _delete_in_batches(
+            target, [row["id"] for row in rows], delete_batch_size, pause
+        )
+        bump_table(target.model)
+        archived += len(rows)
+        last_id = rows[-1]["id"]
+        logger.info(f"아카이브 {target.name}: {entry['file']} ({len(rows)}행)")
+    return archived
+
+
+def _manifest(target: ArchiveTarget) -> Iterator[Dict[str, Any]]:
+    path = os.path.join(settings.ARCHIVE_ROOT, target.name, "manifest.jsonl")
+    if not os.path.exists(path):
+        return
+    with open(path) as manifest:
+        for line in manifest:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_archived(
+    name: str,
+    user_id: Optional[Any] = None,
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+    predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    아카이브 파일에서 조건에 맞는 행 조회 (관리자 이력 조회용, on-demand)
+    manifest 의 기간 정보로 대상 파일을 먼저 거른다
+    limit 이 있으면 최신 파일부터 읽고 limit 행을 채운 파일에서 멈춘다
+    """
+    target = TARGETS[name]
+    entries = list(_manifest(target))
+    if limit is not None:
+        entries.reverse()
+    seen = set()
+    result: List[Dict[str, Any]] = []
+    for entry in entries:
+        if limit is not None and len(result) >= limit:
+            break
+        if start and entry["max_date"] < start.isoformat():
+            continue
+        if end and entry["min_date"] >= end.isoformat():
+            continue
+
+        path = os.path.join(settings.ARCHIVE_ROOT, target.name, entry["file"])
+        with gzip.open(path, "rt") as fp:
+            for line in fp:
+                row = json.loads(line)
+                if row["id"] in seen:
+                    continue
+                if user_id is not None and target.user_field:
+                    if row[target.user_field] != str(user_id):
+                        continue
+                value = row[target.date_field]
+                if (start and value < start.isoformat()) or (
+                    end and value >= end.isoformat()
+                ):
+                    continue
+                if predicate and not predicate(row):
+                    continue
+                seen.add(row["id"])
+                row[target.date_field] = datetime.datetime.fromisoformat(value)
+                result.append(row)
+    return result
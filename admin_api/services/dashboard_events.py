@@ -0,0 +1,108 @@
+"""
+관리자 대시보드 실시간 이벤트 (Redis pub/sub → SSE)
+
+모델 저장 시 카운터 증감(deltas)과 신규 항목 알림을 채널에 발행하고,
+SSE 스트림은 채널만 구독하므로 열려 있는 탭 수와 무관하게 DB 부하가 없다.
+
+브라우저 EventSource 는 Authorization 헤더를 보낼 수 없으므로, 관리자가 먼저
+1회용 스트림 토큰을 발급받아 ?token= 으로 연결한다 (StreamTokenAuthentication).
+토큰은 한 번만 쓸 수 있어 EventSource 자동 재연결은 401 로 거절되므로, 클라이언트는
+stream.reconnect 이벤트나 onerror 에서 연결을 닫고 새 토큰으로 다시 연결한다.
+"""
+
+import json
+import logging
+import secrets
+import time
+
+from typing import Any, Dict, Iterator, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "dashboard:events"
+STREAM_TOKEN_KEY = "dashboard:stream_token:{token}"
+
+
+def _channel() -> str:
+    return cache.make_key(CHANNEL)
+
+
+def publish(
+    event: str,
+    deltas: Optional[Dict[str, int]] = None,
+    item: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    대시보드 이벤트 발행 (트랜잭션 커밋 이후)
+    event: 이벤트 이름, deltas: DashboardView 카운터 증감, item: 신규 항목 요약
+    """
+    payload = json.dumps(
+        {"deltas": deltas or {}, "item": item, "at": time.time()},
+        default=str,
+        ensure_ascii=False,
+    )
+
+    def send() -> None:
+        try:
+            get_redis_connection("default").publish(
+                _channel(), json.dumps({"event": event, "data": payload})
+            )
+        except RedisError as e:
+            # 실시간 알림 유실은 대시보드 재조회로 보정되므로 요청은 실패시키지 않음
+            logger.warning(f"대시보드 이벤트 발행 실패 ({event}): {e}")
+
+    transaction.on_commit(send)
+
+
+def issue_stream_token(user_id: Any) -> str:
+    """SSE 연결용 1회용 토큰 발급 (SSE_TOKEN_TTL 초 안에 연결해야 함)"""
+    token = secrets.token_urlsafe(32)
+    get_redis_connection("default").set(
+        cache.make_key(STREAM_TOKEN_KEY.format(token=token)),
+        str(user_id),
+        ex=settings.SSE_TOKEN_TTL,
+    )
+    return token
+
+
+def consume_stream_token(token: str) -> Optional[str]:
+    """토큰을 사용 처리하고 사용자 id 반환 (없거나 이미 사용했으면 None)"""
+    user_id = get_redis_connection("default").getdel(
+        cache.make_key(STREAM_TOKEN_KEY.format(token=token))
+    )
+    return user_id.decode() if user_id else None
+
+
+def _format(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def stream_events() -> Iterator[str]:
+    """
+    채널을 구독하며 SSE 메시지를 생성
+    heartbeat 로 프록시 idle timeout 을 막고, 최대 연결 시간이 지나면
+    stream.reconnect 를 보내고 종료한다 (클라이언트는 새 토큰으로 재연결)
+    """
+    pubsub = get_redis_connection("default").pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(_channel())
+    deadline = time.monotonic() + settings.SSE_MAX_STREAM_SECONDS
+    try:
+        while time.monotonic() < deadline:
+            message = pubsub.get_message(timeout=settings.SSE_HEARTBEAT_INTERVAL)
+            if message is None:
+                yield ": ping\n\n"
+                continue
+            body = json.loads(message["data"])
+            yield _format(body["event"], body["data"])
+        yield _format("stream.reconnect", "{}")
+    except RedisError as e:
+        logger.warning(f"대시보드 이벤트 구독 종료: {e}")
+    finally:
+        pubsub.close()
@@ -0,0 +1,308 @@
+import csv
+import datetime
+import decimal
+import logging
+import os
+import time
+import uuid
+import zipfile
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.cache import cache
+
+from admin_api.services.ledger_service import REFUND, ledger_queryset
+from dbre_BE.background import submit
+from subscription.models import Subs
+from user.models import CustomUser
+
+
+logger = logging.getLogger(__name__)
+
+Row = Sequence[Any]
+
+
+def _sales_rows() -> Iterator[Row]:
+    """결제/환불 거래 원장 (관리자 매출 화면과 동일한 UNION 쿼리)"""
+    ledger = ledger_queryset().iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+    for row in ledger:
+        yield (
+            row["pay_id"],
+            row["event_at"],
+            "구독취소" if row["transaction_type"] == REFUND else "결제",
+            row["signed_amount"],
+            row["user_ref"],
+            row["user_name"],
+            row["user_email"],
+            row["user_phone"],
+        )
+
+
+def _user_rows() -> Iterator[Row]:
+    return (
+        CustomUser.objects.filter(is_staff=False)
+        .order_by("created_at")
+        .values_list(
+            "id",
+            "name",
+            "email",
+            "phone",
+            "provider",
+            "sub_status",
+            "is_active",
+            "created_at",
+            "last_login",
+            "deleted_at",
+        )
+        .iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+    )
+
+
+def _subscription_rows() -> Iterator[Row]:
+    return (
+        Subs.objects.order_by("id")
+        .values_list(
+            "id",
+            "user__name",
+            "user__email",
+            "user__phone",
+            "user__sub_status",
+            "plan__plan_name",
+            "start_date",
+            "end_date",
+            "next_bill_date",
+            "auto_renew",
+        )
+        .iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+    )
+
+
+# 내보내기 종류별 (헤더, 행 생성기)
+EXPORTS: Dict[str, tuple[List[str], Callable[[], Iterator[Row]]]] = {
+    "sales": (
+        ["결제ID", "거래일시", "구분", "금액", "회원ID", "이름", "이메일", "전화번호"],
+        _sales_rows,
+    ),
+    "users": (
+        [
+            "회원ID",
+            "이름",
+            "이메일",
+            "전화번호",
+            "가입경로",
+            "구독상태",
+            "활성",
+            "가입일",
+            "마지막 방문일",
+            "탈퇴 요청일",
+        ],
+        _user_rows,
+    ),
+    "subscriptions": (
+        [
+            "구독ID",
+            "이름",
+            "이메일",
+            "전화번호",
+            "구독상태",
+            "플랜",
+            "최근 결제일",
+            "만료일",
+            "다음 결제일",
+            "자동 갱신",
+        ],
+        _subscription_rows,
+    ),
+}
+
+
+def _format_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, decimal.Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def iter_rows(kind: str) -> Iterator[List[Any]]:
+    """헤더 포함 행 스트림 (서버 사이드 커서로 chunk 단위 조회)"""
+    header, rows = EXPORTS[kind]
+    yield header
+    for row in rows():
+        yield [_format_cell(value) for value in row]
+
+
+# 스프레드시트가 수식으로 해석하는 시작 문자 (CSV injection)
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _escape_formula(value: Any) -> Any:
+    """사용자 입력 문자열이 수식으로 실행되지 않도록 앞에 ' 추가 (숫자는 그대로)"""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+class _Echo:
+    """csv.writer 가 쓴 한 줄을 그대로 돌려주는 버퍼"""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def stream_csv(kind: str) -> Iterator[str]:
+    """StreamingHttpResponse 용 CSV 라인 생성기 (메모리 사용량 일정)"""
+    writer = csv.writer(_Echo())
+    yield "﻿"  # 엑셀에서 한글이 깨지지 않도록 BOM
+    for row in iter_rows(kind):
+        yield writer.writerow([_escape_formula(value) for value in row])
+
+
+def _column_name(index: int) -> str:
+    name = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(65 + remainder) + name
+    return name
+
+
+_XLSX_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
+<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>
+</Types>"""
+
+_XLSX_ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>"""
+
+_XLSX_WORKBOOK = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>
+</workbook>"""
+
+_XLSX_WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+
+_XLSX_STYLES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>
+<fills count="1"><fill><patternFill patternType="none"/></fill></fills>
+<borders count="1"><border/></borders>
+<cellStyleXfs count="1"><xf/></cellStyleXfs>
+<cellXfs count="1"><xf xfId="0"/></cellXfs>
+</styleSheet>"""
+
+
+def write_xlsx(path: str, sheet_name: str, rows: Iterable[List[Any]]) -> int:
+    """
+    행 스트림을 XLSX 로 기록 (inline string, 시트를 zip 에 스트리밍 기록)
+    반환값은 헤더를 제외한 행 수
+    """
+    count = -1
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+        zf.writestr("xl/workbook.xml", _XLSX_WORKBOOK.format(name=escape(sheet_name)))
+        zf.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+        zf.writestr("xl/styles.xml", _XLSX_STYLES)
+
+        with zf.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/'
+                b'spreadsheetml/2006/main"><sheetData>'
+            )
+            for count, row in enumerate(rows):
+                cells = []
+                for index, value in enumerate(row):
+                    ref = f"{_column_name(index)}{count + 1}"
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        cells.append(
+                            f'<c r="{ref}" t="inlineStr"><is><t>'
+                            f"{escape(str(value))}</t></is></c>"
+                        )
+                    else:
+                        cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+                sheet.write(f'<row r="{count + 1}">{"".join(cells)}</row>'.encode())
+            sheet.write(b"</sheetData></worksheet>")
+    return max(count, 0)
+
+
+def _job_key(job_id: str) -> str:
+    return f"export_job:{job_id}"
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    job: Optional[Dict[str, Any]] = cache.get(_job_key(job_id))
+    return job
+
+
+def _set_job(job_id: str, **fields: Any) -> None:
+    job = get_job(job_id) or {}
+    job.update(fields)
+    cache.set(_job_key(job_id), job, timeout=settings.EXPORT_FILE_TTL)
+
+
+def get_job_file_path(job_id: str) -> str:
+    return os.path.join(settings.EXPORT_ROOT, f"{job_id}.xlsx")
+
+
+def _cleanup_expired_files() -> None:
+    """보관 기간이 지난 내보내기 파일 삭제"""
+    expire_before = time.time() - settings.EXPORT_FILE_TTL
+    for entry in os.scandir(settings.EXPORT_ROOT):
+        if entry.is_file() and entry.stat().st_mtime < expire_before:
+            os.remove(entry.path)
+
+
+def run_xlsx_export(job_id: str, kind: str) -> None:
+    """프로세스 풀에서 실행되는 XLSX 생성 작업"""
+    path = get_job_file_path(job_id)
+    tmp_path = f"{path}.part"
+    _set_job(job_id, status="running")
+    started = time.monotonic()
+    try:
+        rows = write_xlsx(tmp_path, kind, iter_rows(kind))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.error(f"XLSX 내보내기 실패 ({kind}, {job_id}): {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        _set_job(job_id, status="failed", error=str(e))
+        return
+
+    elapsed = time.monotonic() - started
+    logger.info(f"XLSX 내보내기 완료 ({kind}, {rows}행, {elapsed:.1f}초)")
+    _set_job(job_id, status="done", rows=rows, elapsed=round(elapsed, 1))
+
+
+def start_xlsx_export(kind: str, requested_by: str) -> str:
+    """XLSX 생성 작업을 백그라운드 프로세스 풀에 등록하고 job_id 반환"""
+    os.makedirs(settings.EXPORT_ROOT, exist_ok=True)
+    _cleanup_expired_files()
+
+    job_id = uuid.uuid4().hex
+    _set_job(
+        job_id,
+        status="pending",
+        kind=kind,
+        requested_by=requested_by,
+        filename=f"{kind}_{datetime.date.today():%Y%m%d}.xlsx",
+    )
+    submit(run_xlsx_export, job_id, kind)
+    return job_id
@@ -0,0 +1,88 @@
+from datetime import date, datetime, time, timedelta
+from typing import Any, Optional
+from uuid import UUID
+
+from django.db.models import (
+    CharField,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    Q,
+    QuerySet,
+    Value,
+)
+
+from payment.models import Pays
+
+
+PAYMENT = "payment"
+REFUND = "refund"
+TRANSACTION_TYPES = (PAYMENT, REFUND)
+
+# UNION 양쪽의 컬럼 순서를 맞추기 위해 동일한 이름/순서로 annotate
+LEDGER_FIELDS = (
+    "pay_id",
+    "event_at",
+    "signed_amount",
+    "transaction_type",
+    "user_ref",
+    "user_name",
+    "user_email",
+    "user_phone",
+)
+
+
+def _ledger_side(
+    queryset: QuerySet[Pays], event_at: str, amount: Any, transaction_type: str
+) -> QuerySet[Any]:
+    ledger: QuerySet[Any] = queryset.annotate(
+        pay_id=F("id"),
+        event_at=F(event_at),
+        signed_amount=ExpressionWrapper(
+            amount, output_field=DecimalField(max_digits=10, decimal_places=2)
+        ),
+        transaction_type=Value(transaction_type, output_field=CharField()),
+        user_ref=F("user_id"),
+        user_name=F("user__name"),
+        user_email=F("user__email"),
+        user_phone=F("user__phone"),
+    ).values(*LEDGER_FIELDS)
+    return ledger
+
+
+def ledger_queryset(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    transaction_type: Optional[str] = None,
+    user_id: Optional[UUID] = None,
+) -> QuerySet[Any]:
+    """
+    결제 이벤트와 환불 이벤트를 UNION ALL 로 합친 거래 원장 (최신순)
+    결제 1건에서 환불이 있으면 결제/환불 두 줄이 생성됨
+    """
+    payments = Pays.objects.filter(Q(amount__gt=0) | Q(refund_amount__gt=0))
+    refunds = Pays.objects.filter(refund_amount__gt=0, refund_at__isnull=False)
+
+    if user_id:
+        payments = payments.filter(user_id=user_id)
+        refunds = refunds.filter(user_id=user_id)
+    # __date 조회는 컬럼을 ::date 로 변환해 인덱스를 못 타므로 반열린 시각 범위로 비교
+    if start_date:
+        start = datetime.combine(start_date, time.min)
+        payments = payments.filter(paid_at__gte=start)
+        refunds = refunds.filter(refund_at__gte=start)
+    if end_date:
+        end = datetime.combine(end_date + timedelta(days=1), time.min)
+        payments = payments.filter(paid_at__lt=end)
+        refunds = refunds.filter(refund_at__lt=end)
+
+    sides = []
+    if transaction_type in (None, PAYMENT):
+        sides.append(_ledger_side(payments, "paid_at", F("amount"), PAYMENT))
+    if transaction_type in (None, REFUND):
+        sides.append(_ledger_side(refunds, "refund_at", -F("refund_amount"), REFUND))
+
+    ledger = sides[0]
+    if len(sides) > 1:
+        ledger = ledger.union(*sides[1:], all=True)
+    return ledger.order_by("-event_at", "-pay_id")
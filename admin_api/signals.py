@@ -0,0 +1,88 @@
+from typing import Any
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from admin_api.services.dashboard_events import publish
+from reviews.models import Review
+from subscription.models import SubHistories, Subs
+from subscription.services.cancel_reason_service import CANCEL_STATUS
+from tally.models import Tally
+from user.models import CustomUser
+
+
+@receiver(post_save, sender=Tally)
+def publish_tally_event(
+    sender: type[Tally], instance: Tally, created: bool, **kwargs: Any
+) -> None:
+    if created:
+        publish(
+            "tally.created",
+            deltas={"new_request_today": 1, "request_incomplete": 1},
+            item={
+                "id": instance.id,
+                "form_name": instance.form_name,
+                "submitted_at": instance.submitted_at,
+            },
+        )
+        return
+
+    update_fields = kwargs.get("update_fields")
+    if instance.complete and update_fields and "complete" in update_fields:
+        publish(
+            "tally.completed",
+            deltas={"request_incomplete": -1, "request_complete": 1},
+            item={"id": instance.id},
+        )
+
+
+@receiver(post_save, sender=SubHistories)
+def publish_cancel_event(
+    sender: type[SubHistories], instance: SubHistories, created: bool, **kwargs: Any
+) -> None:
+    if created and instance.status == CANCEL_STATUS:
+        publish(
+            "subscription.cancelled",
+            deltas={"subs_cancel_all": 1, "subs_cancel_today": 1},
+            item={
+                "id": instance.id,
+                "user_id": instance.user_id,
+                "cancelled_reason": instance.cancelled_reason,
+            },
+        )
+
+
+@receiver(post_save, sender=Subs)
+def publish_subscription_event(
+    sender: type[Subs], instance: Subs, created: bool, **kwargs: Any
+) -> None:
+    if created:
+        publish(
+            "subscription.created",
+            deltas={"new_subscriptions_today": 1},
+            item={"id": instance.id, "user_id": instance.user_id},
+        )
+
+
+@receiver(post_save, sender=CustomUser)
+def publish_signup_event(
+    sender: type[CustomUser], instance: CustomUser, created: bool, **kwargs: Any
+) -> None:
+    if created and not instance.is_staff:
+        publish(
+            "user.created",
+            deltas={"total_customers": 1, "new_customers_today": 1},
+            item={"id": instance.id, "name": instance.name},
+        )
+
+
+@receiver(post_save, sender=Review)
+def publish_review_event(
+    sender: type[Review], instance: Review, created: bool, **kwargs: Any
+) -> None:
+    if created:
+        publish(
+            "review.created",
+            deltas={"all_reviews": 1, "new_reviews": 1},
+            item={"id": instance.id, "rating": instance.rating},
+        )
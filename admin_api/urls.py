@@ -4,14 +4,25 @@ from django.urls import path
 from admin_api.views.admin_views import (
     AdminLoginLogListView,
     AdminLoginView,
+    AdminTallyBulkCompleteView,
     AdminTallyCompleteView,
     AdminTallyView,
     AdminUserView,
+    DashboardStreamTokenView,
+    DashboardStreamView,
     DashboardView,
 )
+from admin_api.views.export_views import (
+    AdminCSVExportView,
+    AdminExportDownloadView,
+    AdminExportJobView,
+    AdminXLSXExportView,
+)
 from admin_api.views.pay_views import AdminSalesPayView
 from admin_api.views.subs_views import (
+    AdminCancelReasonTrendView,
     AdminCancelReasonView,
+    AdminCohortRetentionView,
     AdminRefundInfoView,
     AdminRefundPendingListView,
     AdminRefundView,
@@ -19,6 +30,8 @@ from admin_api.views.subs_views import (
     SubscriptionListView,
 )
 from admin_api.views.user_views import (
+    BulkDeleteUserConfirmView,
+    BulkUserRecoveryView,
     DeleteUserMangementView,
     UserManagementView,
     UserRecoveryView,
@@ -27,6 +40,12 @@ from admin_api.views.user_views import (
 
 admin_patterns = [
     path("dashboard/", DashboardView.as_view(), name="dashboard"),
+    path("dashboard/stream/", DashboardStreamView.as_view(), name="dashboard-stream"),
+    path(
+        "dashboard/stream/token/",
+        DashboardStreamTokenView.as_view(),
+        name="dashboard-stream-token",
+    ),
     path("admin/", AdminUserView.as_view(), name="create-admin"),
     path("subscriptions/", SubscriptionListView.as_view(), name="subscription-list"),
     path(
@@ -46,6 +65,16 @@ admin_patterns = [
         AdminCancelReasonView.as_view(),
         name="구독 취소 사유 count",
     ),
+    path(
+        "cancel-reasons/trend/",
+        AdminCancelReasonTrendView.as_view(),
+        name="구독 취소 사유 추이",
+    ),
+    path(
+        "subscriptions/cohorts/",
+        AdminCohortRetentionView.as_view(),
+        name="subscription-cohorts",
+    ),
     path(
         "admin/refund-info/<int:subs_id>/",
         AdminRefundInfoView.as_view(),
@@ -53,9 +82,36 @@ admin_patterns = [
     ),
     path("tally/", AdminTallyView.as_view(), name="탈리"),
     path("tally/complete/", AdminTallyCompleteView.as_view(), name="탈리 완료 처리"),
+    path(
+        "tally/complete/bulk/",
+        AdminTallyBulkCompleteView.as_view(),
+        name="탈리 일괄 완료 처리",
+    ),
     path("sales/", AdminSalesPayView.as_view(), name="매출 관리"),
     path("user/", UserManagementView.as_view(), name="user-management"),
     path("user-delete/", DeleteUserMangementView.as_view(), name="user-delete"),
+    path(
+        "user-delete/bulk/",
+        BulkDeleteUserConfirmView.as_view(),
+        name="user-delete-bulk",
+    ),
     path("user-recovery/", UserRecoveryView.as_view(), name="user-recovery"),
+    path(
+        "user-recovery/bulk/",
+        BulkUserRecoveryView.as_view(),
+        name="user-recovery-bulk",
+    ),
     path("login-log/", AdminLoginLogListView.as_view(), name="login-log"),
+    path("exports/<str:kind>/csv/", AdminCSVExportView.as_view(), name="export-csv"),
+    path("exports/<str:kind>/xlsx/", AdminXLSXExportView.as_view(), name="export-xlsx"),
+    path(
+        "exports/jobs/<str:job_id>/",
+        AdminExportJobView.as_view(),
+        name="export-job",
+    ),
+    path(
+        "exports/jobs/<str:job_id>/download/",
+        AdminExportDownloadView.as_view(),
+        name="export-download",
+    ),
 ]
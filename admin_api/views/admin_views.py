@@ -1,43 +1,63 @@
-from datetime import timedelta
-from typing import Any, cast
+from datetime import date, datetime, time, timedelta
+from typing import Any, Optional, cast
+from uuid import UUID
 
 from django.conf import settings
 from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
+from django.db import connection, transaction
 from django.db.models import QuerySet, Sum
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.timezone import now
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     OpenApiExample,
     OpenApiParameter,
     OpenApiResponse,
     extend_schema,
+    inline_serializer,
 )
 from rest_framework import generics, serializers, status
 from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from admin_api.authentication import StreamTokenAuthentication
 from admin_api.models import AdminLoginLog
 from admin_api.serializers import (
     AdminLoginLogSerializer,
     AdminLoginSerializer,
     AdminPasswordChangeSerializer,
+    AdminTallyBulkCompleteSerializer,
     AdminTallyCompleteSerializer,
     AdminTallySerializer,
     AdminUserListSerializer,
     AdminUserSerializer,
+    ArchivedAdminLoginLogSerializer,
+    BulkActionResponseSerializer,
     DashboardSerializer,
 )
+from admin_api.services.archive_service import read_archived
+from admin_api.services.dashboard_events import (
+    issue_stream_token,
+    publish,
+    stream_events,
+)
+from dbre_BE.conditional import bump_table, conditional_get
 from payment.models import Pays
 from reviews.models import Review
 from subscription.models import SubHistories, Subs
 from tally.models import Tally
+from user.authentication import CachedJWTAuthentication
 from user.models import CustomUser
+from user.services.login_events import record_admin_login
+from user.throttling import SLIDING_WINDOW_THROTTLES
 from user.utils import measure_time
 
 
@@ -50,6 +70,7 @@ class DashboardView(APIView):
     serializer_class = DashboardSerializer
 
     @extend_schema(tags=["admin"], summary="대시보드")
+    @conditional_get([Tally, Subs, SubHistories, Review, CustomUser, Pays])
     def get(self, request: Request) -> Response:
         """작업 요청 현황"""
         # 오늘 신규 요청
@@ -137,6 +158,68 @@ class DashboardView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+@extend_schema(
+    tags=["admin"],
+    summary="대시보드 실시간 이벤트 (SSE)",
+    description=(
+        "text/event-stream 으로 카운터 증감(deltas)과 신규 항목 알림을 전달합니다. "
+        "이벤트: tally.created, tally.completed, subscription.created, "
+        "subscription.cancelled, user.created, review.created. "
+        "EventSource 는 헤더를 보낼 수 없으므로 dashboard/stream/token/ 에서 받은 "
+        "1회용 토큰을 ?token= 으로 전달합니다. 토큰은 재사용할 수 없으므로 "
+        "stream.reconnect 이벤트를 받거나 연결이 끊기면(onerror) EventSource 를 "
+        "닫고 새 토큰을 발급받아 다시 연결합니다."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="token", description="1회용 스트림 토큰", type=OpenApiTypes.STR
+        )
+    ],
+    responses={200: OpenApiResponse(description="text/event-stream")},
+)
+class DashboardStreamView(APIView):
+    authentication_classes = [StreamTokenAuthentication, CachedJWTAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request) -> StreamingHttpResponse:
+        """대시보드 최초 값은 DashboardView 로 받고 이후 변경분만 구독"""
+        # 스트림은 DB 를 쓰지 않으므로 연결 유지 시간 동안 DB 연결을 잡고 있지 않음
+        connection.close()
+        response = StreamingHttpResponse(
+            stream_events(), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+class DashboardStreamTokenView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        tags=["admin"],
+        summary="대시보드 실시간 이벤트 연결 토큰 발급",
+        description="dashboard/stream/?token= 연결에 사용할 1회용 토큰을 발급합니다.",
+        responses={
+            200: inline_serializer(
+                name="DashboardStreamTokenResponse",
+                fields={
+                    "token": serializers.CharField(),
+                    "expires_in": serializers.IntegerField(),
+                },
+            )
+        },
+    )
+    def post(self, request: Request) -> Response:
+        return Response(
+            {
+                "token": issue_stream_token(request.user.pk),
+                "expires_in": settings.SSE_TOKEN_TTL,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class AdminUserView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -284,6 +367,9 @@ class AdminUserView(APIView):
 
 
 class AdminLoginView(TokenObtainPairView):
+    throttle_scope = "admin_login"
+    throttle_field = "email"
+    throttle_classes = SLIDING_WINDOW_THROTTLES
     serializer_class = AdminLoginSerializer  # type: ignore
 
     @staticmethod
@@ -334,9 +420,9 @@ class AdminLoginView(TokenObtainPairView):
                 f"Bearer {serializer.validated_data['access_token']}"
             )
 
-            # 관리자 로그인 로그 기록
-            AdminLoginLog.objects.create(
-                user=serializer.user,
+            # 관리자 로그인 로그 기록 (Redis 버퍼 → 주기적으로 bulk_create)
+            record_admin_login(
+                serializer.user,
                 ip_address=self.get_client_ip(request),
                 user_agent=request.META.get("HTTP_USER_AGENT"),
             )
@@ -369,6 +455,7 @@ class AdminTallyView(APIView):
     permission_classes = [IsAdminUser]
     serializer_class = AdminTallySerializer
 
+    @conditional_get([Tally, CustomUser])
     def get(self, request: Request) -> Response:
         """작업 요청 관리"""
         # 오늘 신규 요청
@@ -412,15 +499,191 @@ class AdminTallyCompleteView(APIView):
 
         tally_id = serializer.validated_data["tally_id"]
         tally = get_object_or_404(Tally, id=tally_id)
-        tally.complete = True
-        tally.save(update_fields=["complete"])
+        if not tally.complete:
+            # 이미 완료된 작업을 다시 저장하면 실시간 카운터가 중복 반영됨
+            tally.complete = True
+            tally.save(update_fields=["complete"])
         return Response({"complete": True}, status=status.HTTP_200_OK)
 
 
-@extend_schema(tags=["admin"])
+class AdminTallyBulkCompleteView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="작업 일괄 완료 처리",
+        tags=["admin"],
+        request=AdminTallyBulkCompleteSerializer,
+        responses={200: BulkActionResponseSerializer},
+    )
+    def post(self, request: Request) -> Response:
+        """작업 일괄 완료 처리 (단일 UPDATE)"""
+        serializer = AdminTallyBulkCompleteSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        tally_ids = list(dict.fromkeys(serializer.validated_data["tally_ids"]))
+
+        with transaction.atomic():
+            current = dict(
+                Tally.objects.select_for_update()
+                .filter(id__in=tally_ids)
+                .values_list("id", "complete")
+            )
+            updated = Tally.objects.filter(
+                id__in=[tally_id for tally_id, done in current.items() if not done]
+            ).update(complete=True)
+            bump_table(Tally)
+            if updated:
+                publish(
+                    "tally.completed",
+                    deltas={
+                        "request_incomplete": -updated,
+                        "request_complete": updated,
+                    },
+                )
+
+        results = [
+            {
+                "id": tally_id,
+                "result": (
+                    "not_found"
+                    if tally_id not in current
+                    else "already_completed" if current[tally_id] else "completed"
+                ),
+            }
+            for tally_id in tally_ids
+        ]
+        return Response(
+            BulkActionResponseSerializer({"updated": updated, "results": results}).data,
+            status=status.HTTP_200_OK,
+        )
+
+
+class ArchivedLoginLogPagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
+@extend_schema(
+    tags=["admin"],
+    parameters=[
+        OpenApiParameter(
+            name="include_archived",
+            type=bool,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description=(
+                "아카이브된 과거 로그 포함 여부 (기본 false). true 이면 기간 또는 "
+                "user_id 가 필요하며 결과는 페이지 단위로 반환됩니다."
+            ),
+        ),
+        OpenApiParameter(
+            name="start_date",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="조회 시작일 (YYYY-MM-DD, include_archived 사용 시)",
+        ),
+        OpenApiParameter(
+            name="end_date",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="조회 종료일 (YYYY-MM-DD, include_archived 사용 시)",
+        ),
+        OpenApiParameter(
+            name="user_id",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="사용자 ID (include_archived 사용 시)",
+        ),
+        OpenApiParameter(
+            name="page", type=int, location=OpenApiParameter.QUERY, required=False
+        ),
+        OpenApiParameter(
+            name="page_size",
+            type=int,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="페이지 크기 (기본 50, 최대 500)",
+        ),
+    ],
+)
 class AdminLoginLogListView(generics.ListAPIView):
     serializer_class = AdminLoginLogSerializer
     permission_classes = [IsAdminUser]
 
     def get_queryset(self) -> QuerySet[AdminLoginLog]:
         return AdminLoginLog.objects.all().order_by("-login_datetime")
+
+    @conditional_get([AdminLoginLog])
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        if request.query_params.get("include_archived") != "true":
+            return super().list(request, *args, **kwargs)
+
+        try:
+            start_date = request.query_params.get("start_date")
+            end_date = request.query_params.get("end_date")
+            user_id = request.query_params.get("user_id")
+            start_day = date.fromisoformat(start_date) if start_date else None
+            end_day = date.fromisoformat(end_date) if end_date else None
+            user_uuid = UUID(user_id) if user_id else None
+        except ValueError:
+            return Response(
+                {"error": "잘못된 조회 조건입니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if user_uuid is None and (start_day is None or end_day is None):
+            return Response(
+                {
+                    "error": (
+                        "아카이브 조회에는 기간(start_date, end_date) 또는 "
+                        "user_id가 필요합니다."
+                    )
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if (
+            start_day
+            and end_day
+            and not 0 <= (end_day - start_day).days < settings.ARCHIVE_QUERY_MAX_DAYS
+        ):
+            return Response(
+                {
+                    "error": f"조회 기간은 최대 {settings.ARCHIVE_QUERY_MAX_DAYS}일입니다."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        start: Optional[datetime] = (
+            datetime.combine(start_day, time.min) if start_day else None
+        )
+        end: Optional[datetime] = (
+            datetime.combine(end_day + timedelta(days=1), time.min) if end_day else None
+        )
+        logs = self.get_queryset()
+        if user_uuid:
+            logs = logs.filter(user_id=user_uuid)
+        if start:
+            logs = logs.filter(login_datetime__gte=start)
+        if end:
+            logs = logs.filter(login_datetime__lt=end)
+
+        # 아카이브 로그는 요청 시에만 파일에서 읽어 최신 로그 뒤에 붙이고 행 수를 제한
+        limit = settings.ARCHIVE_QUERY_MAX_ROWS
+        rows = list(AdminLoginLogSerializer(logs[:limit], many=True).data)
+        if len(rows) < limit:
+            archived = sorted(
+                read_archived(
+                    "login_logs", user_id=user_uuid, start=start, end=end, limit=limit
+                ),
+                key=lambda row: row["login_datetime"],
+                reverse=True,
+            )[: limit - len(rows)]
+            rows += ArchivedAdminLoginLogSerializer(archived, many=True).data
+
+        paginator = ArchivedLoginLogPagination()
+        page = paginator.paginate_queryset(rows, request, view=self)
+        return paginator.get_paginated_response(page)
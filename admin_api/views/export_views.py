@@ -0,0 +1,125 @@
+import datetime
+import os
+
+from django.http import FileResponse, StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from admin_api.services.export_service import (
+    EXPORTS,
+    get_job,
+    get_job_file_path,
+    start_xlsx_export,
+    stream_csv,
+)
+
+
+def _unknown_kind_response(kind: str) -> Response:
+    return Response(
+        {"error": f"지원하지 않는 내보내기 종류입니다: {kind}"},
+        status=status.HTTP_404_NOT_FOUND,
+    )
+
+
+@extend_schema(
+    tags=["admin"],
+    summary="관리자 목록 CSV 내보내기 (sales / users / subscriptions)",
+    responses={200: OpenApiResponse(response=OpenApiTypes.BINARY)},
+)
+class AdminCSVExportView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request, kind: str) -> StreamingHttpResponse | Response:
+        """CSV 를 chunk 단위로 스트리밍 (워커 메모리 사용량 일정)"""
+        if kind not in EXPORTS:
+            return _unknown_kind_response(kind)
+
+        filename = f"{kind}_{datetime.date.today():%Y%m%d}.csv"
+        response = StreamingHttpResponse(
+            stream_csv(kind), content_type="text/csv; charset=utf-8"
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        # nginx 가 응답 전체를 버퍼링하지 않도록 설정
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+@extend_schema(
+    tags=["admin"],
+    summary="관리자 목록 XLSX 내보내기 작업 생성",
+    request=None,
+    responses={202: OpenApiTypes.OBJECT},
+)
+class AdminXLSXExportView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def post(self, request: Request, kind: str) -> Response:
+        """XLSX 생성은 백그라운드 프로세스에서 수행하고 job_id 반환"""
+        if kind not in EXPORTS:
+            return _unknown_kind_response(kind)
+
+        job_id = start_xlsx_export(kind, requested_by=request.user.email)
+        return Response(
+            {"message": "XLSX 생성 작업이 등록되었습니다.", "job_id": job_id},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+@extend_schema(
+    tags=["admin"],
+    summary="XLSX 내보내기 작업 상태 조회",
+    responses={200: OpenApiTypes.OBJECT},
+)
+class AdminExportJobView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request, job_id: str) -> Response:
+        """작업 상태 (pending / running / done / failed) 조회"""
+        job = get_job(job_id)
+        if job is None:
+            return Response(
+                {"error": "작업을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND
+            )
+        return Response({"job_id": job_id, **job}, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["admin"],
+    summary="XLSX 내보내기 파일 다운로드",
+    responses={200: OpenApiResponse(response=OpenApiTypes.BINARY)},
+)
+class AdminExportDownloadView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request, job_id: str) -> FileResponse | Response:
+        """완료된 XLSX 파일 다운로드"""
+        job = get_job(job_id)
+        if job is None:
+            return Response(
+                {"error": "작업을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND
+            )
+        if job.get("status") != "done":
+            return Response(
+                {"error": "파일이 아직 준비되지 않았습니다.", "status": job["status"]},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        path = get_job_file_path(job_id)
+        if not os.path.exists(path):
+            return Response(
+                {"error": "파일이 만료되었습니다."}, status=status.HTTP_410_GONE
+            )
+
+        return FileResponse(
+            open(path, "rb"),
+            as_attachment=True,
+            filename=job["filename"],
+            content_type=(
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            ),
+        )
@@ -1,23 +1,104 @@
-from django.db.models import Q, Sum
+from datetime import date
+from uuid import UUID
+
+from django.db.models import Sum
 from django.utils.timezone import now
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAdminUser
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from admin_api.serializers import AdminSalesSerializer
+from admin_api.services.ledger_service import TRANSACTION_TYPES, ledger_queryset
+from dbre_BE.conditional import conditional_get
 from payment.models import Pays
+from user.models import CustomUser
+
+
+class LedgerPagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
 
 
-@extend_schema(tags=["admin"], summary="관리자 결제 및 환불 내역 조회")
+@extend_schema(
+    tags=["admin"],
+    summary="관리자 결제 및 환불 내역 조회",
+    parameters=[
+        OpenApiParameter(
+            name="start_date",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="조회 시작일 (YYYY-MM-DD)",
+        ),
+        OpenApiParameter(
+            name="end_date",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="조회 종료일 (YYYY-MM-DD)",
+        ),
+        OpenApiParameter(
+            name="type",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            enum=list(TRANSACTION_TYPES),
+            description="거래 구분 (payment: 결제, refund: 구독취소)",
+        ),
+        OpenApiParameter(
+            name="user_id",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="사용자 ID",
+        ),
+        OpenApiParameter(
+            name="page", type=int, location=OpenApiParameter.QUERY, required=False
+        ),
+        OpenApiParameter(
+            name="page_size",
+            type=int,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="페이지 크기 (기본 50, 최대 500)",
+        ),
+    ],
+)
 class AdminSalesPayView(APIView):
     permission_classes = [IsAdminUser]
     serializer_class = AdminSalesSerializer
+    pagination_class = LedgerPagination
 
+    @conditional_get([Pays, CustomUser])
     def get(self, request: Request) -> Response:
         """관리자 결제 및 환불 내역 조회 API"""
+        transaction_type = request.query_params.get("type")
+        if transaction_type and transaction_type not in TRANSACTION_TYPES:
+            return Response(
+                {"error": "type은 payment 또는 refund 여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            start_date = request.query_params.get("start_date")
+            end_date = request.query_params.get("end_date")
+            user_id = request.query_params.get("user_id")
+            transactions = ledger_queryset(
+                start_date=date.fromisoformat(start_date) if start_date else None,
+                end_date=date.fromisoformat(end_date) if end_date else None,
+                transaction_type=transaction_type,
+                user_id=UUID(user_id) if user_id else None,
+            )
+        except ValueError:
+            return Response(
+                {"error": "잘못된 조회 조건입니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         monthly_sales = (
             Pays.objects.filter(paid_at__month=now().date().month).aggregate(
                 total_amount=Sum("amount")
@@ -32,25 +113,10 @@ class AdminSalesPayView(APIView):
         )
         monthly_total_sales = monthly_sales - monthly_refunds
 
-        transactions = (
-            Pays.objects.select_related("user")
-            .filter(Q(amount__gt=0) | Q(refund_amount__gt=0))  # 결제 or 환불 내역 존재
-            .order_by("-paid_at")
-        )
-
-        # 결제 & 환불 내역을 따로 처리하여 한 개의 결제 ID에서 두 개의 레코드 반환
-        serialized_transactions = []
-        for transaction in transactions:
-            # 결제 내역 추가 (환불이 있어도 "결제"로 표시됨)
-            serialized_transactions.append(
-                AdminSalesSerializer(transaction, context={"is_refund": False}).data
-            )
-
-            # 환불 내역이 있으면 추가 (이때는 "구독취소"로 표시)
-            if transaction.refund_amount:
-                serialized_transactions.append(
-                    AdminSalesSerializer(transaction, context={"is_refund": True}).data
-                )
+        # 결제/환불 원장은 DB 에서 UNION 으로 만들고 현재 페이지만 직렬화
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(transactions, request, view=self)
+        serializer = AdminSalesSerializer(page, many=True)
 
         return Response(
             {
@@ -59,7 +125,10 @@ class AdminSalesPayView(APIView):
                     "monthly_refunds": monthly_refunds,
                     "monthly_total_sales": monthly_total_sales,
                 },
-                "transactions": serialized_transactions,
+                "count": paginator.page.paginator.count,
+                "next": paginator.get_next_link(),
+                "previous": paginator.get_previous_link(),
+                "transactions": serializer.data,
             },
             status=status.HTTP_200_OK,
         )
@@ -1,12 +1,15 @@
 import logging
 
-from typing import Any
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List
 
+from django.conf import settings
 from django.db.models import Count, Max, Min, OuterRef, Q, Subquery
 from django.utils import timezone
 from django.utils.timezone import now
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAdminUser
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -14,15 +17,29 @@ from rest_framework.views import APIView
 
 from admin_api.serializers import (
     AdminCancelReasonSerializer,
+    AdminCancelReasonTrendSerializer,
     AdminRefundInfoSerializer,
     AdminRefundSerializer,
+    ArchivedSubscriptionHistorySerializer,
+    CohortRetentionSerializer,
     SubsCancelSerializer,
     SubscriptionHistorySerializer,
     SubscriptionSerializer,
 )
+from admin_api.services.archive_service import read_archived
+from dbre_BE.conditional import conditional_get
 from payment.models import Pays
 from payment.services.payment_service import RefundService
+from plan.models import Plans
 from subscription.models import SubHistories, Subs
+from subscription.services.cancel_reason_service import (
+    GRANULARITIES,
+    count_by_reason,
+    reason_trend,
+    top_other_reasons,
+)
+from subscription.services.cohort_service import get_retention_triangle
+from user.models import CustomUser
 
 
 logger = logging.getLogger(__name__)
@@ -35,6 +52,7 @@ class SubscriptionListView(APIView):
     permission_classes = [IsAdminUser]
     serializer_class = SubscriptionSerializer
 
+    @conditional_get([Subs, SubHistories, CustomUser, Pays, Plans])
     def get(self, request: Request) -> Response:
         # 전체 구독자 수
         total_subscriptions = Subs.objects.filter(user__sub_status="active").count()
@@ -108,6 +126,12 @@ class SubscriptionListView(APIView):
         )
 
 
+class ArchivedHistoryPagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
 @extend_schema(
     tags=["admin"],
     summary="특정 사용자 구독 변경 이력 조회",
@@ -119,7 +143,41 @@ class SubscriptionListView(APIView):
             location=OpenApiParameter.QUERY,
             required=True,
             description="조회할 사용자의 ID",
-        )
+        ),
+        OpenApiParameter(
+            name="include_archived",
+            type=bool,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description=(
+                "아카이브된 환불 완료 이력 포함 여부 (기본 false). true 이면 기간이 "
+                "필요하며 결과는 페이지 단위로 반환됩니다."
+            ),
+        ),
+        OpenApiParameter(
+            name="start_date",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="조회 시작일 (YYYY-MM-DD, include_archived 사용 시)",
+        ),
+        OpenApiParameter(
+            name="end_date",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="조회 종료일 (YYYY-MM-DD, include_archived 사용 시)",
+        ),
+        OpenApiParameter(
+            name="page", type=int, location=OpenApiParameter.QUERY, required=False
+        ),
+        OpenApiParameter(
+            name="page_size",
+            type=int,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="페이지 크기 (기본 50, 최대 500)",
+        ),
     ],
 )
 class SubscriptionHistoryListView(APIView):
@@ -136,9 +194,68 @@ class SubscriptionHistoryListView(APIView):
         histories = SubHistories.objects.filter(sub__user_id=user_id).order_by(
             "-change_date"
         )
-        serializer = SubscriptionHistorySerializer(histories, many=True)
+        if request.query_params.get("include_archived") != "true":
+            serializer = SubscriptionHistorySerializer(histories, many=True)
+            return Response({"history": serializer.data})
 
-        return Response({"history": serializer.data})
+        try:
+            start_day = date.fromisoformat(request.query_params["start_date"])
+            end_day = date.fromisoformat(request.query_params["end_date"])
+        except (KeyError, ValueError):
+            return Response(
+                {"error": "아카이브 조회에는 기간(start_date, end_date)이 필요합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not 0 <= (end_day - start_day).days < settings.ARCHIVE_QUERY_MAX_DAYS:
+            return Response(
+                {
+                    "error": f"조회 기간은 최대 {settings.ARCHIVE_QUERY_MAX_DAYS}일입니다."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        start = datetime.combine(start_day, time.min)
+        end = datetime.combine(end_day + timedelta(days=1), time.min)
+
+        # 아카이브 이력은 요청 시에만 파일에서 읽어 최신 이력 뒤에 붙이고 행 수를 제한
+        limit = settings.ARCHIVE_QUERY_MAX_ROWS
+        histories = histories.filter(change_date__gte=start, change_date__lt=end)
+        history = list(SubscriptionHistorySerializer(histories[:limit], many=True).data)
+        if len(history) < limit:
+            archived = sorted(
+                read_archived(
+                    "sub_histories", user_id=user_id, start=start, end=end, limit=limit
+                ),
+                key=lambda row: row["change_date"],
+                reverse=True,
+            )[: limit - len(history)]
+            history += ArchivedSubscriptionHistorySerializer(
+                archived, many=True, context={"refunds": self._refunds(archived)}
+            ).data
+
+        paginator = ArchivedHistoryPagination()
+        page = paginator.paginate_queryset(history, request, view=self)
+        return Response(
+            {
+                "count": paginator.page.paginator.count,
+                "next": paginator.get_next_link(),
+                "previous": paginator.get_previous_link(),
+                "history": page,
+            }
+        )
+
+    @staticmethod
+    def _refunds(archived: List[Dict[str, Any]]) -> Dict[Any, Any]:
+        """아카이브 이력의 구독별 최근 환불 금액 (한 번에 조회)"""
+        sub_ids = {row["sub_id"] for row in archived if row["sub_id"] is not None}
+        refunds: Dict[Any, Any] = {}
+        rows = (
+            Pays.objects.filter(subs_id__in=sub_ids, status="REFUNDED")
+            .order_by("subs_id", "-refund_at")
+            .values_list("subs_id", "refund_amount")
+        )
+        for subs_id, refund_amount in rows:
+            refunds.setdefault(subs_id, refund_amount)
+        return refunds
 
 
 @extend_schema(tags=["admin"], summary="구독 취소 및 환불 리스트")
@@ -267,21 +384,148 @@ class AdminRefundView(APIView):
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
-@extend_schema(summary="취소 사유 카운트", tags=["admin"])
+CANCEL_REASON_FILTER_PARAMETERS = [
+    OpenApiParameter(
+        name="start_date",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="조회 시작일 (YYYY-MM-DD)",
+    ),
+    OpenApiParameter(
+        name="end_date",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="조회 종료일 (YYYY-MM-DD)",
+    ),
+    OpenApiParameter(
+        name="plan_id",
+        type=int,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="플랜 ID",
+    ),
+]
+
+
+def parse_cancel_reason_filters(request: Request) -> dict[str, Any]:
+    """취소 사유 조회 공통 쿼리 파라미터 파싱 (잘못된 값은 ValueError)"""
+    start_date = request.query_params.get("start_date")
+    end_date = request.query_params.get("end_date")
+    plan_id = request.query_params.get("plan_id")
+    return {
+        "start_date": date.fromisoformat(start_date) if start_date else None,
+        "end_date": date.fromisoformat(end_date) if end_date else None,
+        "plan_id": int(plan_id) if plan_id else None,
+    }
+
+
+@extend_schema(
+    summary="취소 사유 카운트",
+    tags=["admin"],
+    parameters=CANCEL_REASON_FILTER_PARAMETERS,
+)
 class AdminCancelReasonView(APIView):
     permission_classes = [IsAdminUser]
     serializer_class = AdminCancelReasonSerializer
 
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        """구독 취소 사유 카운트 조회"""
-        cancel_count = (
-            SubHistories.objects.filter(status="refund_pending")
-            .values("cancelled_reason")
-            .annotate(count=Count("id"))
-            .order_by("-count")
+        """구독 취소 사유 카운트 조회 (일별 집계 테이블 기준)"""
+        try:
+            filters = parse_cancel_reason_filters(request)
+        except ValueError:
+            return Response(
+                {"error": "잘못된 조회 조건입니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = AdminCancelReasonSerializer(count_by_reason(**filters), many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    summary="취소 사유 추이",
+    tags=["admin"],
+    responses=AdminCancelReasonTrendSerializer,
+    parameters=[
+        *CANCEL_REASON_FILTER_PARAMETERS,
+        OpenApiParameter(
+            name="granularity",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            enum=list(GRANULARITIES),
+            description="집계 단위 (기본 day)",
+        ),
+    ],
+)
+class AdminCancelReasonTrendView(APIView):
+    permission_classes = [IsAdminUser]
+    serializer_class = AdminCancelReasonTrendSerializer
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """기간 단위별 취소 사유 추이 및 기타 사유 묶음 조회"""
+        granularity = request.query_params.get("granularity", "day")
+        if granularity not in GRANULARITIES:
+            return Response(
+                {"error": "granularity는 day, week, month 중 하나여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            filters = parse_cancel_reason_filters(request)
+        except ValueError:
+            return Response(
+                {"error": "잘못된 조회 조건입니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = AdminCancelReasonTrendSerializer(
+            {
+                "granularity": granularity,
+                "trend": reason_trend(granularity, **filters),
+                "other_reasons": top_other_reasons(**filters),
+            }
         )
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["admin"],
+    summary="월별 구독 코호트 유지율",
+    responses=CohortRetentionSerializer,
+    parameters=[
+        OpenApiParameter(
+            name="months",
+            type=int,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="최근 N개월 코호트만 조회 (기본 12)",
+        )
+    ],
+)
+class AdminCohortRetentionView(APIView):
+    """코호트 집계 테이블에서 유지율 삼각형 반환"""
+
+    permission_classes = [IsAdminUser]
+    serializer_class = CohortRetentionSerializer
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        try:
+            months = int(request.query_params.get("months", 12))
+        except ValueError:
+            return Response(
+                {"error": "months는 정수여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        today = now().date()
+        since = None
+        if months > 0:
+            index = today.year * 12 + today.month - months
+            since = date(index // 12, index % 12 + 1, 1)
 
-        serializer = AdminCancelReasonSerializer(cancel_count, many=True)
+        serializer = CohortRetentionSerializer(get_retention_triangle(since))
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
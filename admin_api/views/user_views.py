@@ -1,4 +1,15 @@
-from django.db.models import Case, CharField, Count, OuterRef, Q, Subquery, Value, When
+from django.db import transaction
+from django.db.models import (
+    Case,
+    CharField,
+    Count,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema
@@ -11,6 +22,8 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from admin_api.serializers import (
+    BulkActionResponseSerializer,
+    BulkUserIdsRequestSerializer,
     ConfirmUserDeletionRequestSerializer,
     ConfirmUserDeletionResponseSerializer,
     DeletedUserSerializer,
@@ -20,9 +33,9 @@ from admin_api.serializers import (
     UserRecoveryRequestSerializer,
     UserRecoveryResponseSerializer,
 )
-from payment.models import Pays
-from subscription.models import Subs
-from user.models import Agreements, CustomUser, WithdrawalReason
+from dbre_BE.conditional import bump_table, conditional_get
+from user.authentication import invalidate_users
+from user.models import CustomUser, UserAccountSummary, WithdrawalReason
 
 
 # 현재 pagination 프론트에서 관리
@@ -58,6 +71,7 @@ class UserManagementView(APIView):
         # ],
         responses={200: UserManagementResponseSerializer},
     )
+    @conditional_get([CustomUser, UserAccountSummary])
     def get(self, request: Request) -> Response:
         # order_by = request.query_params.get("order_by", "name")
         # order_direction = request.query_params.get("order_direction", "asc")
@@ -83,31 +97,21 @@ class UserManagementView(APIView):
 
         today = timezone.now().date()
 
-        # 서브쿼리 최적화
-        latest_sub = Subs.objects.filter(user=OuterRef("pk")).order_by("-start_date")
-        latest_payment = Pays.objects.filter(user=OuterRef("pk")).order_by("-paid_at")
-
+        # 구독/결제/마케팅 동의는 계정 요약 테이블에서 PK 조인 하나로 읽음
         users = (
-            CustomUser.objects.filter(is_active=True, is_staff=False)
-            .annotate(
+            CustomUser.objects.filter(is_active=True, is_staff=False).annotate(
                 is_subscribed=Case(
                     When(sub_status__in=["active", "paused"], then=Value("구독중")),
                     default=Value("미구독"),
                     output_field=CharField(),
                 ),
                 marketing_consent=Coalesce(
-                    Subquery(
-                        Agreements.objects.filter(user=OuterRef("pk")).values(
-                            "marketing"
-                        )[:1]
-                    ),
-                    Value(False),
+                    F("account_summary__marketing_consent"), Value(False)
                 ),
-                start_date=Subquery(latest_sub.values("start_date")[:1]),
-                end_date=Subquery(latest_sub.values("end_date")[:1]),
-                latest_paid_at=Subquery(latest_payment.values("paid_at")[:1]),
+                start_date=F("account_summary__start_date"),
+                end_date=F("account_summary__end_date"),
+                latest_paid_at=F("account_summary__latest_paid_at"),
             )
-            .prefetch_related("agreements_set")  # agreements_set으로 변경
             # .order_by(order_field)
         )
 
@@ -214,6 +218,55 @@ class DeleteUserMangementView(APIView):
             )
 
 
+class BulkDeleteUserConfirmView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        tags=["admin"],
+        summary="Admin page 탈퇴 요청 일괄 승인",
+        description="여러 회원의 탈퇴 요청을 한 번에 승인합니다. 회원별 결과(confirmed, already_confirmed, not_found)를 반환합니다.",
+        request=BulkUserIdsRequestSerializer,
+        responses={200: BulkActionResponseSerializer, 400: ErrorResponseSerializer},
+    )
+    def post(self, request: Request) -> Response:
+        serializer = BulkUserIdsRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                ErrorResponseSerializer({"error": serializer.errors}).data,
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        user_ids = list(dict.fromkeys(serializer.validated_data["user_ids"]))
+
+        with transaction.atomic():
+            current = dict(
+                CustomUser.objects.select_for_update()
+                .filter(id__in=user_ids, deleted_at__isnull=False)
+                .values_list("id", "is_deletion_confirmed")
+            )
+            updated = CustomUser.objects.filter(
+                id__in=[user_id for user_id, done in current.items() if not done]
+            ).update(is_deletion_confirmed=True, updated_at=timezone.now())
+            bump_table(CustomUser, user_ids=current)
+            invalidate_users(current)
+
+        results = [
+            {
+                "id": user_id,
+                "result": (
+                    "not_found"
+                    if user_id not in current
+                    else "already_confirmed" if current[user_id] else "confirmed"
+                ),
+            }
+            for user_id in user_ids
+        ]
+        return Response(
+            BulkActionResponseSerializer({"updated": updated, "results": results}).data,
+            status=status.HTTP_200_OK,
+        )
+
+
 class UserRecoveryView(APIView):
     permission_classes = [IsAdminUser]
 
@@ -259,3 +312,57 @@ class UserRecoveryView(APIView):
                 {"error": "해당 사용자를 찾을 수 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+
+
+class BulkUserRecoveryView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        tags=["admin"],
+        summary="탈퇴 처리된 회원 일괄 복구",
+        description="여러 회원을 한 번에 복구합니다. 회원별 결과(recovered, not_withdrawn, not_found)를 반환합니다.",
+        request=BulkUserIdsRequestSerializer,
+        responses={200: BulkActionResponseSerializer, 400: ErrorResponseSerializer},
+    )
+    def post(self, request: Request) -> Response:
+        serializer = BulkUserIdsRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                ErrorResponseSerializer({"error": serializer.errors}).data,
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        user_ids = list(dict.fromkeys(serializer.validated_data["user_ids"]))
+
+        with transaction.atomic():
+            current = dict(
+                CustomUser.objects.select_for_update()
+                .filter(id__in=user_ids, deleted_at__isnull=False)
+                .values_list("id", "is_active")
+            )
+            updated = CustomUser.objects.filter(
+                id__in=[user_id for user_id, active in current.items() if not active]
+            ).update(
+                is_deletion_confirmed=False,
+                is_active=True,
+                deleted_at=None,
+                updated_at=timezone.now(),
+            )
+            bump_table(CustomUser, user_ids=current)
+            invalidate_users(current)
+
+        results = [
+            {
+                "id": user_id,
+                "result": (
+                    "not_found"
+                    if user_id not in current
+                    else "not_withdrawn" if current[user_id] else "recovered"
+                ),
+            }
+            for user_id in user_ids
+        ]
+        return Response(
+            BulkActionResponseSerializer({"updated": updated, "results": results}).data,
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,80 @@
+import atexit
+import logging
+import os
+import sys
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 풀 자식에서 django.setup() 시 스케줄러 등이 중복 기동되지 않도록 표시
+BACKGROUND_WORKER_ENV = "DBRE_BACKGROUND_WORKER"
+
+# 스케줄러를 띄우는 manage.py 명령 (migrate 등 일회성 명령에서는 띄우지 않음)
+SCHEDULER_COMMANDS = ("runserver",)
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def is_background_worker() -> bool:
+    """현재 프로세스가 백그라운드 프로세스 풀의 자식인지 여부"""
+    return os.environ.get(BACKGROUND_WORKER_ENV) == "1"
+
+
+def is_server_process() -> bool:
+    """웹 서버(gunicorn / runserver) 프로세스인지 여부 (관리 명령, mypy 플러그인 등 제외)"""
+    program = sys.argv[0] if sys.argv else ""
+    if os.path.basename(program) in ("manage.py", "django-admin"):
+        return len(sys.argv) > 1 and sys.argv[1] in SCHEDULER_COMMANDS
+    return "gunicorn" in program
+
+
+def should_start_scheduler() -> bool:
+    """
+    스케줄러 기동 여부
+    웹 서버 프로세스에서만 띄우고 프로세스 풀 자식 및 RUN_SCHEDULER=false 인 서비스 제외
+    """
+    return (
+        bool(settings.RUN_SCHEDULER)
+        and not is_background_worker()
+        and is_server_process()
+    )
+
+
+def _init_worker() -> None:
+    """spawn 된 자식 프로세스에서 Django 초기화"""
+    import django
+
+    os.environ[BACKGROUND_WORKER_ENV] = "1"
+    django.setup()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """CPU/장시간 작업용 공용 프로세스 풀 (웹 워커당 1개, 지연 생성)"""
+    global _pool
+    if _pool is None:
+        # fork 시 부모의 DB 소켓을 공유하게 되므로 spawn 사용
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.BACKGROUND_PROCESS_WORKERS,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+        )
+        atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+    return _pool
+
+
+def submit(func: Callable[..., Any], *args: Any) -> Future[Any]:
+    """함수를 프로세스 풀에서 실행 (func 는 모듈 최상위 함수여야 함)"""
+    future = get_process_pool().submit(func, *args)
+    future.add_done_callback(_log_failure)
+    return future
+
+
+def _log_failure(future: Future[Any]) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"백그라운드 작업 실패: {future.exception()}")
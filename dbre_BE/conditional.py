@@ -0,0 +1,143 @@
+"""
+조건부 GET (ETag / Last-Modified) 지원
+
+리소스(테이블 또는 사용자) 단위 버전 스탬프를 Redis 에 보관하고,
+저장/삭제 시 버전을 올린다. 뷰는 버전만 읽어 ETag 를 계산하므로
+변경이 없으면 메인 쿼리와 serializer 를 실행하지 않고 304 를 돌려준다.
+"""
+
+import hashlib
+import time
+
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from django.utils.timezone import now
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+VERSION_KEY = "version:{scope}"
+
+
+def table_scope(model: type[models.Model]) -> str:
+    return f"table:{model._meta.label_lower}"
+
+
+def user_scope(user_id: Any) -> str:
+    return f"user:{user_id}"
+
+
+def bump(*scopes: str) -> None:
+    """버전 스탬프 갱신 (나노초 시각 → 단조 증가 + Last-Modified 로 사용)"""
+    version = time.time_ns()
+    cache.set_many(
+        {VERSION_KEY.format(scope=scope): version for scope in scopes}, timeout=None
+    )
+
+
+def bump_on_commit(*scopes: str) -> None:
+    """커밋 이후에 버전을 올려 변경 전 데이터가 새 ETag 로 캐시되지 않게 함"""
+    transaction.on_commit(lambda: bump(*scopes))
+
+
+def bump_table(model: type[models.Model], user_ids: Iterable[Any] = ()) -> None:
+    """QuerySet.update()/bulk_* 처럼 시그널이 없는 경로에서 명시적으로 호출"""
+    bump_on_commit(table_scope(model), *(user_scope(user_id) for user_id in user_ids))
+
+
+def get_versions(scopes: Sequence[str]) -> Dict[str, int]:
+    keys = {VERSION_KEY.format(scope=scope): scope for scope in scopes}
+    versions = cache.get_many(list(keys))
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        # 키가 없으면(최초/유실) 현재 시각으로 초기화 → 클라이언트는 한 번 새로 받음
+        initial = time.time_ns()
+        for key in missing:
+            cache.add(key, initial, timeout=None)
+        versions.update(cache.get_many(missing))
+    return {keys[key]: int(value) for key, value in versions.items()}
+
+
+def track_model(model: type[models.Model], user_field: Optional[str] = None) -> None:
+    """모델 저장/삭제 시 테이블 (및 소유 사용자) 버전 갱신"""
+
+    def handler(sender: Any, instance: models.Model, **kwargs: Any) -> None:
+        scopes = [table_scope(model)]
+        user_id = getattr(instance, user_field) if user_field else None
+        if user_id is not None:
+            scopes.append(user_scope(user_id))
+        bump_on_commit(*scopes)
+
+    uid = f"conditional:{model._meta.label_lower}"
+    post_save.connect(handler, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(handler, sender=model, weak=False, dispatch_uid=uid)
+
+
+def conditional_get(
+    tables: Sequence[type[models.Model]] = (), per_user: bool = False
+) -> Callable[[Callable[..., Response]], Callable[..., Response]]:
+    """
+    APIView.get 용 데코레이터
+    tables: 응답이 의존하는 모델 목록, per_user: 요청 사용자 단위 버전 포함 여부
+    """
+
+    def decorator(view_method: Callable[..., Response]) -> Callable[..., Response]:
+        @wraps(view_method)
+        def wrapper(self: Any, request: Request, *args: Any, **kwargs: Any) -> Any:
+            scopes: List[str] = [table_scope(model) for model in tables]
+            user_id = request.user.pk if request.user.is_authenticated else None
+            if per_user and user_id is not None:
+                scopes.append(user_scope(user_id))
+            versions = get_versions(scopes)
+
+            # 같은 버전이라도 사용자/쿼리/날짜(오늘 기준 통계)가 다르면 다른 응답
+            source = "|".join(
+                [
+                    request.get_full_path(),
+                    str(user_id),
+                    now().date().isoformat(),
+                    *(f"{scope}={versions[scope]}" for scope in scopes),
+                ]
+            )
+            etag = f'"{hashlib.sha1(source.encode()).hexdigest()}"'
+            # 날짜가 바뀌면 If-Modified-Since 로도 다시 받도록 오늘 0시를 하한으로 사용
+            today = now().replace(hour=0, minute=0, second=0, microsecond=0)
+            last_modified = max(
+                max(versions.values(), default=0) // 1_000_000_000,
+                int(today.timestamp()),
+            )
+
+            if _not_modified(request, etag, last_modified):
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            else:
+                response = view_method(self, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(last_modified)
+            # 브라우저 캐시는 항상 재검증하도록
+            response["Cache-Control"] = "private, no-cache"
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _not_modified(request: Request, etag: str, last_modified: int) -> bool:
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        # If-None-Match 가 있으면 If-Modified-Since 는 무시 (RFC 9110)
+        return if_none_match.strip() == "*" or etag in parse_etags(if_none_match)
+
+    if_modified_since = parse_http_date_safe(
+        request.headers.get("If-Modified-Since", "")
+    )
+    return bool(if_modified_since and last_modified <= if_modified_since)
@@ -0,0 +1,176 @@
+"""
+외부 연동(Google OAuth, Twilio) 공용 HTTP 클라이언트
+
+연동별로 프로세스당 하나의 requests.Session 을 두어 호스트별 keep-alive 풀을
+재사용하고, 모든 요청에 연결/읽기 timeout 을 강제한다. 재시도는 연결 실패와
+멱등 메서드(GET 등)의 일시적 오류에만 jitter 가 섞인 백오프로 수행한다.
+연동별 요청 수/오류 수/지연 분포는 Redis 해시 http_metrics:{연동} 에 누적된다.
+
+    response = request("google", "GET", url, headers=headers)
+"""
+
+import logging
+import threading
+import time
+
+from typing import Any, Dict, Optional, Tuple, cast
+
+import requests
+
+from django.conf import settings
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from requests.adapters import HTTPAdapter
+from twilio.http.http_client import TwilioHttpClient
+from twilio.http.response import Response as TwilioResponse
+from urllib3.util.retry import Retry
+
+
+logger = logging.getLogger(__name__)
+
+METRICS_KEY = "http_metrics:{integration}"
+# 지연 분포 구간 (ms)
+LATENCY_BUCKETS = (100, 300, 1000, 3000)
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _config(integration: str) -> Dict[str, Any]:
+    integrations = cast(Dict[str, Dict[str, Any]], settings.OUTBOUND_HTTP)
+    return {**integrations["default"], **integrations.get(integration, {})}
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """timeout 을 지정하지 않은 요청에도 기본 (연결, 읽기) timeout 적용"""
+
+    def __init__(self, timeout: Tuple[float, float], **kwargs: Any) -> None:
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def build_session(integration: str) -> requests.Session:
+    config = _config(integration)
+    retry = Retry(
+        total=config["retries"],
+        connect=config["retries"],
+        read=config["retries"],
+        status=config["retries"],
+        # POST 등 비멱등 요청은 전송 전 실패(연결 오류)만 재시도
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        status_forcelist=(429, 502, 503, 504),
+        backoff_factor=config["backoff_factor"],
+        backoff_jitter=config["backoff_jitter"],
+        backoff_max=config["backoff_max"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = TimeoutHTTPAdapter(
+        timeout=(config["connect_timeout"], config["read_timeout"]),
+        pool_connections=config["pool_connections"],
+        pool_maxsize=config["pool_maxsize"],
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(integration: str) -> requests.Session:
+    """연동별 공유 세션 (프로세스당 1개, 스레드 간 공유)"""
+    session = _sessions.get(integration)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(integration)
+            if session is None:
+                session = _sessions[integration] = build_session(integration)
+    return session
+
+
+def record(
+    integration: str, elapsed: float, status_code: Optional[int], error: bool
+) -> None:
+    """연동별 요청 지표 누적 (Redis 장애가 요청 처리에 영향을 주지 않게 함)"""
+    elapsed_ms = int(elapsed * 1000)
+    bucket = next(
+        (f"le_{bound}ms" for bound in LATENCY_BUCKETS if elapsed_ms <= bound),
+        "gt_3000ms",
+    )
+    key = cache.make_key(METRICS_KEY.format(integration=integration))
+    try:
+        pipe = get_redis_connection("default").pipeline(transaction=False)
+        pipe.hincrby(key, "requests", 1)
+        pipe.hincrby(key, "latency_ms_sum", elapsed_ms)
+        pipe.hincrby(key, bucket, 1)
+        if error:
+            pipe.hincrby(key, "errors", 1)
+        if status_code is not None:
+            pipe.hincrby(key, f"status_{status_code // 100}xx", 1)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"외부 연동 지표 기록 실패 ({integration}): {e}")
+
+    if error or elapsed > _config(integration)["slow_threshold"]:
+        logger.warning(
+            f"외부 연동 응답 지연/오류 ({integration}): "
+            f"{elapsed_ms}ms, status={status_code}"
+        )
+
+
+def get_metrics(integration: str) -> Dict[str, int]:
+    key = cache.make_key(METRICS_KEY.format(integration=integration))
+    raw = get_redis_connection("default").hgetall(key)
+    return {field.decode(): int(value) for field, value in raw.items()}
+
+
+def request(
+    integration: str, method: str, url: str, **kwargs: Any
+) -> requests.Response:
+    """공유 세션으로 요청하고 지표 기록 (timeout/연결 오류는 그대로 전파)"""
+    started = time.monotonic()
+    try:
+        response = get_session(integration).request(method, url, **kwargs)
+    except requests.RequestException:
+        record(integration, time.monotonic() - started, None, error=True)
+        raise
+    record(
+        integration,
+        time.monotonic() - started,
+        response.status_code,
+        error=response.status_code >= 500,
+    )
+    return response
+
+
+class InstrumentedTwilioHttpClient(TwilioHttpClient):
+    """Twilio SDK 요청도 공유 세션(풀/timeout/재시도)과 지표를 사용"""
+
+    integration = "twilio"
+
+    def __init__(self) -> None:
+        super().__init__(pool_connections=True, logger=logger)
+        self.session = get_session(self.integration)
+
+    def request(self, *args: Any, **kwargs: Any) -> TwilioResponse:
+        started = time.monotonic()
+        try:
+            response = super().request(*args, **kwargs)
+        except requests.RequestException:
+            record(self.integration, time.monotonic() - started, None, error=True)
+            raise
+        record(
+            self.integration,
+            time.monotonic() - started,
+            response.status_code,
+            error=response.status_code >= 500,
+        )
+        return response
@@ -0,0 +1,278 @@
+"""
+메일 발송 outbox (Redis 큐 + 별도 발송 프로세스)
+
+요청 처리 중에는 렌더링된 메일을 큐에 넣기만 하고, send_mail_outbox 명령이
+하나의 SMTP 연결을 유지한 채 배치 단위로 발송한다. 실패한 메일은 지수 백오프로
+재시도하고, 최대 횟수를 넘기면 dead 목록으로 옮긴다.
+
+메일 본문(임시 비밀번호 등 포함)은 MAIL_OUTBOX_MESSAGE_TTL 이 지나면 사라지는
+별도 키에만 두고 큐에는 id 만 넣는다. 발송기는 id 를 processing 목록으로 옮겨
+(LMOVE) 가져오고 발송/재시도 예약이 끝난 뒤에만 지우므로, 발송 중 종료되어도
+다음 시작 시 processing 에 남은 메일을 outbox 로 되돌려 다시 보낸다.
+dead 목록에는 본문 없이 수신자/제목/오류만 남기고 이것도 기간/개수를 제한한다.
+"""
+
+import json
+import logging
+import smtplib
+import time
+import uuid
+
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_KEY = "mail:outbox"  # list, 메일 id
+PROCESSING_KEY = "mail:processing"  # list, 발송기가 가져간 메일 id
+RETRY_KEY = "mail:retry"  # sorted set, 메일 id, score = 다음 시도 시각
+MESSAGE_KEY = "mail:message:{id}"  # 메일 내용 (TTL)
+DEAD_KEY = "mail:dead"
+STATS_KEY = "mail:stats"
+
+
+def _key(name: str) -> str:
+    return cache.make_key(name)
+
+
+def _message_key(message_id: str) -> str:
+    return _key(MESSAGE_KEY.format(id=message_id))
+
+
+def _build(
+    message: Dict[str, Any], connection: Optional[BaseEmailBackend] = None
+) -> EmailMultiAlternatives:
+    email = EmailMultiAlternatives(
+        subject=message["subject"],
+        body=message["body"],
+        from_email=message["from_email"],
+        to=message["to"],
+        connection=connection,
+    )
+    if message.get("html"):
+        email.attach_alternative(message["html"], "text/html")
+    return email
+
+
+def enqueue_email(
+    subject: str,
+    to: List[str],
+    html_message: Optional[str] = None,
+    body: str = "",
+    from_email: Optional[str] = None,
+) -> str:
+    """메일을 outbox 에 넣고 id 반환 (Redis 장애 시 즉시 발송)"""
+    message = {
+        "id": uuid.uuid4().hex,
+        "subject": subject,
+        "body": body,
+        "html": html_message,
+        "from_email": from_email or settings.EMAIL_HOST_USER,
+        "to": to,
+        "attempts": 0,
+        "queued_at": time.time(),
+    }
+    try:
+        pipe = get_redis_connection("default").pipeline(transaction=True)
+        pipe.set(
+            _message_key(str(message["id"])),
+            json.dumps(message),
+            ex=settings.MAIL_OUTBOX_MESSAGE_TTL,
+        )
+        pipe.rpush(_key(OUTBOX_KEY), message["id"])
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"메일 outbox 적재 실패, 즉시 발송: {e}")
+        _build(message).send(fail_silently=False)
+    return str(message["id"])
+
+
+class OutboxSender:
+    """outbox 를 비우는 발송기 (SMTP 연결을 배치 사이에도 재사용)"""
+
+    def __init__(self, batch_size: int, idle_close: float) -> None:
+        self.redis = get_redis_connection("default")
+        self.batch_size = batch_size
+        self.idle_close = idle_close
+        self.connection: Optional[BaseEmailBackend] = None
+        self.last_used = 0.0
+        self.sent = 0
+        self.failed = 0
+        self.dead = 0
+
+    def _open(self) -> BaseEmailBackend:
+        if self.connection is None:
+            self.connection = get_connection(fail_silently=False)
+            self.connection.open()
+        self.last_used = time.monotonic()
+        return self.connection
+
+    def close(self) -> None:
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.connection = None
+
+    def close_if_idle(self) -> None:
+        if self.connection and time.monotonic() - self.last_used > self.idle_close:
+            self.close()
+
+    def promote_retries(self) -> int:
+        """재시도 시각이 된 메일을 outbox 로 되돌림"""
+        now = time.time()
+        key = _key(RETRY_KEY)
+        due = self.redis.zrangebyscore(key, 0, now)
+        if not due:
+            return 0
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zremrangebyscore(key, 0, now)
+        pipe.rpush(_key(OUTBOX_KEY), *due)
+        pipe.execute()
+        return len(due)
+
+    def recover(self) -> int:
+        """이전 발송기가 처리 중에 종료되어 processing 에 남은 메일을 outbox 앞으로 되돌림"""
+        recovered = 0
+        while self.redis.lmove(_key(PROCESSING_KEY), _key(OUTBOX_KEY), "RIGHT", "LEFT"):
+            recovered += 1
+        if recovered:
+            logger.warning(f"발송 중 중단된 메일 {recovered}건을 다시 발송합니다.")
+        return recovered
+
+    def next_batch(self, wait: float = 0) -> List[Dict[str, Any]]:
+        """outbox 의 메일 id 를 processing 으로 옮기며 가져옴 (발송 완료 시 _done)"""
+        outbox, processing = _key(OUTBOX_KEY), _key(PROCESSING_KEY)
+        ids: List[bytes] = []
+        if wait:
+            # 큐가 비어 있으면 첫 메일이 들어올 때까지 대기
+            first = self.redis.blmove(outbox, processing, wait, "LEFT", "RIGHT")
+            if first is None:
+                return []
+            ids.append(first)
+        while len(ids) < self.batch_size:
+            message_id = self.redis.lmove(outbox, processing, "LEFT", "RIGHT")
+            if message_id is None:
+                break
+            ids.append(message_id)
+        if not ids:
+            return []
+
+        messages = []
+        payloads = self.redis.mget([_message_key(i.decode()) for i in ids])
+        for message_id, payload in zip(ids, payloads):
+            if payload is None:
+                # 보관 기간(TTL)이 지난 메일은 발송하지 않음
+                logger.warning(f"만료된 메일 건너뜀 ({message_id.decode()})")
+                self.redis.lrem(processing, 1, message_id)
+                continue
+            messages.append(json.loads(payload))
+        return messages
+
+    def _done(self, message: Dict[str, Any], delete: bool = True) -> None:
+        pipe = self.redis.pipeline(transaction=True)
+        if delete:
+            pipe.delete(_message_key(message["id"]))
+        pipe.lrem(_key(PROCESSING_KEY), 1, message["id"])
+        pipe.execute()
+
+    def send_batch(self, messages: List[Dict[str, Any]]) -> int:
+        """배치 발송, 성공 건수 반환"""
+        started = time.monotonic()
+        sent = 0
+        for message in messages:
+            try:
+                self._send(message)
+            except Exception as e:
+                # 한 메일의 실패(SMTP 오류, 잘못된 주소 등)로 발송기가 멈추지 않게 함
+                self._retry_later(message, e)
+                continue
+            self._done(message)
+            sent += 1
+
+        elapsed = time.monotonic() - started
+        self.sent += sent
+        if messages:
+            rate = sent / elapsed if elapsed else float(sent)
+            self.redis.hset(
+                _key(STATS_KEY),
+                mapping={
+                    "last_batch_size": len(messages),
+                    "last_batch_sent": sent,
+                    "last_batch_seconds": round(elapsed, 3),
+                    "last_batch_rate": round(rate, 2),
+                    "updated_at": time.time(),
+                },
+            )
+            self.redis.hincrby(_key(STATS_KEY), "sent", sent)
+            logger.info(
+                f"메일 발송 {sent}/{len(messages)}건, {elapsed:.2f}초 ({rate:.1f}건/초)"
+            )
+        return sent
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        try:
+            _build(message, self._open()).send(fail_silently=False)
+        except smtplib.SMTPServerDisconnected:
+            # 유휴 중 서버가 연결을 끊은 경우 한 번 재연결
+            self.close()
+            _build(message, self._open()).send(fail_silently=False)
+
+    def _retry_later(self, message: Dict[str, Any], error: Exception) -> None:
+        self.close()
+        message["attempts"] += 1
+        message["last_error"] = str(error)[:500]
+        self.failed += 1
+        self.redis.hincrby(_key(STATS_KEY), "failed", 1)
+
+        if message["attempts"] >= settings.MAIL_OUTBOX_MAX_ATTEMPTS:
+            self.dead += 1
+            # 본문은 버리고 확인용 정보만 기간/개수를 제한해 보관
+            dead = {
+                key: message.get(key)
+                for key in ("id", "to", "subject", "attempts", "last_error")
+            }
+            dead["failed_at"] = time.time()
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.rpush(_key(DEAD_KEY), json.dumps(dead))
+            pipe.ltrim(_key(DEAD_KEY), -settings.MAIL_OUTBOX_DEAD_MAX, -1)
+            pipe.expire(_key(DEAD_KEY), settings.MAIL_OUTBOX_DEAD_TTL)
+            pipe.hincrby(_key(STATS_KEY), "dead", 1)
+            pipe.execute()
+            self._done(message)
+            logger.error(f"메일 발송 포기 ({message['id']}, {message['to']}): {error}")
+            return
+
+        delay = min(
+            settings.MAIL_OUTBOX_BACKOFF_BASE * 2 ** (message["attempts"] - 1),
+            settings.MAIL_OUTBOX_BACKOFF_MAX,
+        )
+        pipe = self.redis.pipeline(transaction=True)
+        # 재시도해도 처음 적재 시 정한 보관 기한은 늘리지 않음
+        pipe.set(_message_key(message["id"]), json.dumps(message), keepttl=True)
+        pipe.zadd(_key(RETRY_KEY), {message["id"]: time.time() + delay})
+        pipe.execute()
+        self._done(message, delete=False)
+        logger.warning(
+            f"메일 발송 실패 ({message['id']}), {delay}초 후 재시도 "
+            f"({message['attempts']}/{settings.MAIL_OUTBOX_MAX_ATTEMPTS}): {error}"
+        )
+
+    def drain(self) -> int:
+        """현재 큐에 있는 메일을 모두 발송 (재시도 대기 중인 것은 제외)"""
+        total = 0
+        self.recover()
+        self.promote_retries()
+        while True:
+            messages = self.next_batch()
+            if not messages:
+                return total
+            total += self.send_batch(messages)
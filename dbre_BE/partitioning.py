@@ -0,0 +1,214 @@
+"""
+PostgreSQL 월 단위 range 파티셔닝 유틸
+
+append-only 이력 테이블을 파티션 키(시간 컬럼) 기준 월별 파티션으로 나눈다.
+파티션 테이블은 PK 에 파티션 키가 포함되어야 하므로 DB 상 PK 는 (id, 파티션 키)
+이지만, Django 모델은 기존처럼 id 를 pk 로 사용한다.
+"""
+
+import logging
+import re
+
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from django.db import connection, transaction
+
+
+logger = logging.getLogger(__name__)
+
+# 파티셔닝된 테이블 → 파티션 키 컬럼
+PARTITIONED_TABLES: Dict[str, str] = {
+    "subscription_subhistories": "change_date",
+    "admin_login_logs": "login_datetime",
+}
+
+# 미리 만들어 둘 미래 파티션 개월 수
+DEFAULT_MONTHS_AHEAD = 3
+
+
+def month_start(value: date | datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def _qn(name: str) -> str:
+    return connection.ops.quote_name(name)
+
+
+def is_partitioned(cursor: Any, table: str) -> bool:
+    cursor.execute(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p "
+        "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = %s)",
+        [table],
+    )
+    return bool(cursor.fetchone()[0])
+
+
+def list_partitions(cursor: Any, table: str) -> List[str]:
+    cursor.execute(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = %s ORDER BY c.relname",
+        [table],
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def create_month_partition(cursor: Any, table: str, month: date) -> bool:
+    """
+    월 파티션 생성 (이미 있으면 False)
+    default 파티션에 해당 월 데이터가 들어와 있으면 새 파티션으로 옮긴 뒤 attach
+    """
+    name = partition_name(table, month)
+    cursor.execute("SELECT to_regclass(%s)", [name])
+    if cursor.fetchone()[0] is not None:
+        return False
+
+    column = PARTITIONED_TABLES[table]
+    lower = month.isoformat()
+    upper = add_months(month, 1).isoformat()
+    default = default_partition_name(table)
+
+    cursor.execute(
+        f"CREATE TABLE {_qn(name)} "
+        f"(LIKE {_qn(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    cursor.execute("SELECT to_regclass(%s)", [default])
+    if cursor.fetchone()[0] is not None:
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {_qn(default)} "
+            f"WHERE {_qn(column)} >= %s AND {_qn(column)} < %s RETURNING *) "
+            f"INSERT INTO {_qn(name)} SELECT * FROM moved",
+            [lower, upper],
+        )
+    cursor.execute(
+        f"ALTER TABLE {_qn(table)} ATTACH PARTITION {_qn(name)} "
+        f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    )
+    logger.info(f"파티션 생성: {name}")
+    return True
+
+
+def ensure_partitions(
+    table: str,
+    start: Optional[date] = None,
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+) -> List[str]:
+    """start 월부터 (현재 + months_ahead) 월까지 누락된 파티션 생성"""
+    current = month_start(datetime.now())
+    month = month_start(start) if start else current
+    created: List[str] = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        if not is_partitioned(cursor, table):
+            return created
+        while month <= add_months(current, months_ahead):
+            if create_month_partition(cursor, table, month):
+                created.append(partition_name(table, month))
+            month = add_months(month, 1)
+    return created
+
+
+def detach_partitions_before(table: str, before: date) -> List[str]:
+    """before 월 이전의 월 파티션을 분리 (데이터는 독립 테이블로 남음)"""
+    detached = []
+    limit = partition_name(table, month_start(before))
+    pattern = re.compile(rf"^{re.escape(table)}_p\d{{6}}$")
+    with transaction.atomic(), connection.cursor() as cursor:
+        for name in list_partitions(cursor, table):
+            if pattern.match(name) and name < limit:
+                cursor.execute(f"ALTER TABLE {_qn(table)} DETACH PARTITION {_qn(name)}")
+                detached.append(name)
+                logger.info(f"파티션 분리: {name}")
+    return detached
+
+
+def convert_to_partitioned(schema_editor: Any, table: str) -> None:
+    """
+    기존 일반 테이블을 월 단위 파티션 테이블로 변환 (마이그레이션에서 사용)
+    인덱스와 FK 는 기존 정의를 그대로 다시 생성하고 id 시퀀스는 이어서 사용
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    column = PARTITIONED_TABLES[table]
+    old = f"{table}_old"
+    with schema_editor.connection.cursor() as cursor:
+        if is_partitioned(cursor, table):
+            return
+
+        cursor.execute(f"LOCK TABLE {_qn(table)} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(
+            "SELECT pg_get_constraintdef(oid), conname FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [table],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            "SELECT indexdef FROM pg_indexes i "
+            "JOIN pg_class c ON c.relname = i.indexname "
+            "JOIN pg_index x ON x.indexrelid = c.oid "
+            "WHERE i.tablename = %s AND NOT x.indisprimary AND NOT x.indisunique",
+            [table],
+        )
+        index_defs = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute(f"ALTER TABLE {_qn(table)} RENAME TO {_qn(old)}")
+        cursor.execute(
+            f"CREATE TABLE {_qn(table)} "
+            f"(LIKE {_qn(old)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE ({_qn(column)})"
+        )
+        # identity/serial 은 복사되지 않으므로 아래에서 새 시퀀스를 연결
+        cursor.execute(f"ALTER TABLE {_qn(table)} ALTER COLUMN id DROP DEFAULT")
+        cursor.execute(
+            f"CREATE TABLE {_qn(default_partition_name(table))} "
+            f"PARTITION OF {_qn(table)} DEFAULT"
+        )
+
+        cursor.execute(f"SELECT MIN({_qn(column)}), MAX(id) FROM {_qn(old)}")
+        first, max_id = cursor.fetchone()
+        current = month_start(datetime.now())
+        month = month_start(first) if first else current
+        while month <= add_months(current, DEFAULT_MONTHS_AHEAD):
+            create_month_partition(cursor, table, month)
+            month = add_months(month, 1)
+
+        cursor.execute(f"INSERT INTO {_qn(table)} SELECT * FROM {_qn(old)}")
+        cursor.execute(f"DROP TABLE {_qn(old)}")
+
+        # 기존 PK/인덱스 이름은 이전 테이블 삭제 후 재사용
+        # (indexdef 는 rename 전에 조회했으므로 새 테이블 이름을 가리킴)
+        cursor.execute(
+            f"ALTER TABLE {_qn(table)} ADD CONSTRAINT {_qn(f'{table}_pkey')} "
+            f"PRIMARY KEY (id, {_qn(column)})"
+        )
+        for index_def in index_defs:
+            cursor.execute(index_def)
+        for definition, name in foreign_keys:
+            cursor.execute(
+                f"ALTER TABLE {_qn(table)} ADD CONSTRAINT {_qn(name)} {definition}"
+            )
+
+        sequence = f"{table}_id_seq"
+        cursor.execute(
+            f"CREATE SEQUENCE {_qn(sequence)} AS integer "
+            f"START WITH {(max_id or 0) + 1} OWNED BY {_qn(table)}.id"
+        )
+        cursor.execute(
+            f"ALTER TABLE {_qn(table)} ALTER COLUMN id "
+            f"SET DEFAULT nextval('{sequence}'::regclass)"
+        )
@@ -35,6 +35,46 @@ FPROD_GOOGLE_REDIRECT_URI = os.getenv("FPROD_GOOGLE_REDIRECT_URI")
 TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
 TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
 TWILIO_VERIFY_SERVICE_SID = os.getenv("TWILIO_VERIFY_SERVICE_SID")
+TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER")
+
+# 탈퇴 확정 사용자 정리 (user.services.user_purge)
+USER_PURGE_RETENTION_DAYS = int(os.getenv("USER_PURGE_RETENTION_DAYS", 30))
+USER_PURGE_BATCH_SIZE = 100
+USER_PURGE_PAUSE = 0.5
+USER_PURGE_LOCK_TIMEOUT = 2000  # ms
+USER_PURGE_WINDOW = (3, 6)  # 스케줄러 실행 시간대 (시), 트래픽이 적은 새벽
+
+# 가입 이메일/전화번호 Bloom filter (user.services.user_bloom), 2MB / 약 170만 건 기준 오탐 1%
+USER_BLOOM_BITS = 1 << 24
+USER_BLOOM_HASHES = 7
+USER_BLOOM_REBUILD_INTERVAL = 60 * 60 * 24
+
+# 휴대폰 인증번호 (user.services.otp)
+OTP_SMS_TRANSPORT = os.getenv(
+    "OTP_SMS_TRANSPORT", "user.services.otp.TwilioSMSTransport"
+)
+OTP_LENGTH = 6
+OTP_TTL = 300
+OTP_MAX_ATTEMPTS = 5
+OTP_RESEND_INTERVAL = 60
+OTP_MAX_SENDS_PER_HOUR = 5
+
+# 외부 연동 HTTP 클라이언트 (dbre_BE.http_client), 연동별 값이 default 를 덮어씀
+OUTBOUND_HTTP = {
+    "default": {
+        "connect_timeout": 3.05,
+        "read_timeout": 10,
+        "retries": 2,
+        "backoff_factor": 0.2,
+        "backoff_jitter": 0.3,
+        "backoff_max": 2,
+        "pool_connections": 4,
+        "pool_maxsize": 10,
+        "slow_threshold": 2,
+    },
+    "google": {"read_timeout": 5},
+    "twilio": {"read_timeout": 8},
+}
 
 NCP_ACCESS_KEY = os.environ.get("NCP_ACCESS_KEY")
 NCP_SECRET_KEY = os.environ.get("NCP_SECRET_KEY")
@@ -42,6 +82,15 @@ NCP_ENDPOINT_URL = "https://kr.object.ncloudstorage.com"
 NCP_BUCKET_NAME = os.environ.get("NCP_BUCKET_NAME")
 NCP_BUCKET_URL = f"https://{NCP_BUCKET_NAME}.kr.object.ncloudstorage.com"
 
+# 프로필 이미지 직접 업로드 (user.services.profile_images)
+PROFILE_IMAGE_UPLOAD_EXPIRES = 300
+PROFILE_IMAGE_MAX_SIZE = 10 * 1024 * 1024
+PROFILE_IMAGE_CONTENT_TYPES = ["image/jpeg", "image/png", "image/gif", "image/webp"]
+# 업로드 후 백그라운드에서 생성하는 리사이즈 이미지 (긴 변 기준 px)
+PROFILE_IMAGE_VARIANTS = {"thumbnail": 64, "small": 160, "medium": 480}
+PROFILE_IMAGE_WEBP_QUALITY = 80
+PROFILE_IMAGE_JPEG_QUALITY = 82
+
 TALLY_SIGNING_SECRET = os.getenv("TALLY_SIGNING_SECRET")
 
 INSTALLED_APPS = [
@@ -54,7 +103,7 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "rest_framework",
     "rest_framework_simplejwt",
-    "rest_framework_simplejwt.token_blacklist",
+    "rest_framework_simplejwt.token_blacklist",  # 기존 행 정리용, 블랙리스트는 Redis
     "drf_spectacular",
     "corsheaders",
     "payment",
@@ -75,9 +124,28 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",  # OpenAPI 스키마 자동화
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("user.authentication.CachedJWTAuthentication",),
+    # X-Forwarded-For 에서 nginx 가 추가한 클라이언트 IP 사용 (프록시 없이 실행 시 0)
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", "1")),
+    # user.throttling.SLIDING_WINDOW_THROTTLES 요청 제한 ("{scope}_{ip|identity|global}")
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": "20/m",
+        "login_identity": "10/10m",
+        # 관리자 로그인은 사용자 로그인과 카운터를 공유하지 않고 더 엄격하게 제한
+        "admin_login_ip": "10/m",
+        "admin_login_identity": "5/10m",
+        "email_check_ip": "30/m",
+        "phone_check_ip": "20/m",
+        "phone_check_identity": "10/10m",
+        "otp_ip": "10/h",
+        "otp_identity": "5/h",
+        "otp_global": "300/m",
+        "otp_verify_ip": "30/10m",
+        "otp_verify_identity": "10/10m",
+        "password_reset_ip": "5/h",
+        "password_reset_identity": "3/h",
+        "password_reset_global": "100/m",
+    },
 }
 
 MIDDLEWARE = [
@@ -186,6 +254,41 @@ CACHES = {
     }
 }
 
+# 로그인 이벤트(last_login, 관리자 로그인 로그) write-behind 설정
+LOGIN_BUFFER_FLUSH_INTERVAL = 5  # 초, 장애 시 최대 유실 구간
+LOGIN_BUFFER_BATCH_SIZE = 500
+
+# 관리자 내보내기(CSV/XLSX) 설정
+EXPORT_ROOT = os.path.join(BASE_DIR, "exports")
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FILE_TTL = 60 * 60 * 24  # 생성된 파일 보관 시간 (초)
+
+# JWT 인증 캐시 (user.authentication.CachedJWTAuthentication)
+AUTH_CACHE_LOCAL_SIZE = 2048  # 프로세스 내 LRU 항목 수
+AUTH_USER_CACHE_TIMEOUT = 60 * 5  # 사용자 레코드 캐시 시간 (초)
+
+# 리프레시 토큰 single-flight 회전 (user.tokens.refresh_single_flight)
+TOKEN_REFRESH_GRACE_SECONDS = 30  # 회전 결과를 중복 요청에 재사용하는 시간
+TOKEN_REFRESH_LOCK_TIMEOUT = 10  # 회전 잠금 최대 보유 시간
+TOKEN_REFRESH_WAIT_SECONDS = 5  # 다른 요청의 회전을 기다리는 최대 시간
+
+# APScheduler 기동 여부 (web-stream 등 보조 서비스에서는 false)
+RUN_SCHEDULER = os.getenv("RUN_SCHEDULER", "true").lower() == "true"
+
+# 관리자 대시보드 SSE 설정 (web-stream 서비스에서 처리)
+SSE_HEARTBEAT_INTERVAL = 15  # 초, 프록시 idle timeout 보다 짧게
+SSE_MAX_STREAM_SECONDS = 60 * 10  # 연결 최대 유지 시간, 이후 클라이언트 재연결
+SSE_TOKEN_TTL = 60  # 초, 1회용 스트림 토큰 유효 시간
+
+# cold row 아카이브 파일 위치 (manage.py archive)
+ARCHIVE_ROOT = os.getenv("ARCHIVE_ROOT", os.path.join(BASE_DIR, "archive"))
+# 관리자 화면 아카이브 조회 범위/행 수 제한
+ARCHIVE_QUERY_MAX_DAYS = 93
+ARCHIVE_QUERY_MAX_ROWS = 1000
+
+# 장시간 작업용 프로세스 풀 크기 (gunicorn 워커당)
+BACKGROUND_PROCESS_WORKERS = int(os.getenv("BACKGROUND_PROCESS_WORKERS", "2"))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "DBre_BE",
     "DESCRIPTION": "DBre project BackEnd part",
@@ -295,3 +398,15 @@ EMAIL_PORT = 587
 EMAIL_USE_TLS = True
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
+EMAIL_TIMEOUT = 10
+
+# 메일 outbox 발송 (manage.py send_mail_outbox)
+MAIL_OUTBOX_BATCH_SIZE = 50
+MAIL_OUTBOX_POLL_INTERVAL = 5  # 초, 큐 대기 (BLMOVE timeout)
+MAIL_OUTBOX_IDLE_CLOSE = 60  # 초, 유휴 SMTP 연결 종료
+MAIL_OUTBOX_MAX_ATTEMPTS = 5
+MAIL_OUTBOX_BACKOFF_BASE = 30  # 초, 재시도마다 2배
+MAIL_OUTBOX_BACKOFF_MAX = 60 * 30
+MAIL_OUTBOX_MESSAGE_TTL = 60 * 60 * 6  # 초, 본문(임시 비밀번호 등) 보관 기한
+MAIL_OUTBOX_DEAD_TTL = 60 * 60 * 24 * 7
+MAIL_OUTBOX_DEAD_MAX = 1000
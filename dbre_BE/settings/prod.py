@@ -17,9 +17,9 @@ CSRF_COOKIE_SECURE = False
 SECURE_SSL_REDIRECT = False
 SESSION_COOKIE_SECURE = False
 
-# 파일 업로드 제한 설정(nginx에도 10MB 제한되어 있음)
-DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB (10 * 1024 * 1024)
-FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
+# 요청 본문 제한 (프로필 이미지는 버킷에 직접 업로드하므로 기본값 사용, nginx 1MB)
+DATA_UPLOAD_MAX_MEMORY_SIZE = 1048576  # 1MB
+FILE_UPLOAD_MAX_MEMORY_SIZE = 1048576  # 1MB
 
 # INSTALLED_APPS에서 제거
 if "debug_toolbar" in INSTALLED_APPS:
@@ -21,6 +21,7 @@ from payment.views import (
 )
 from plan.views import (
     PlanActivateView,
+    PlanBulkToggleView,
     PlanDeleteView,
     PlanDetailView,
     PlanListCreateView,
@@ -54,6 +55,7 @@ payment_patterns = [
 # plan 관련 URL 패턴
 plan_patterns = [
     path("", PlanListCreateView.as_view(), name="plan-list-create"),
+    path("bulk-active/", PlanBulkToggleView.as_view(), name="plan-bulk-active"),
     path("<int:plan_id>/", PlanDetailView.as_view(), name="plan-detail"),
     path("<int:plan_id>/delete/", PlanDeleteView.as_view(), name="plan-delete"),
     path("<int:plan_id>/active/", PlanActivateView.as_view(), name="plan-active"),
@@ -11,7 +11,17 @@ class PaymentConfig(AppConfig):
     name = "payment"
 
     def ready(self) -> None:
+        from dbre_BE.background import should_start_scheduler
+        from dbre_BE.conditional import track_model
+        from payment.models import BillingKey, Pays
         from payment.scheduler import start
 
+        track_model(Pays, user_field="user_id")
+        track_model(BillingKey, user_field="user_id")
+
+        # 백그라운드 프로세스 풀 자식 / SSE 전용 서비스에서는 스케줄러를 띄우지 않음
+        if not should_start_scheduler():
+            return
+
         logger.info("PaymentConfig.ready() 실행됨")
         start()
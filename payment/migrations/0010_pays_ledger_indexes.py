@@ -0,0 +1,21 @@
+# Generated by Django 5.1.6 on 2026-10-19 08:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payment", "0009_alter_pays_subs_alter_pays_user"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="pays",
+            index=models.Index(fields=["paid_at"], name="pays_paid_at_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="pays",
+            index=models.Index(fields=["refund_at"], name="pays_refund_at_idx"),
+        ),
+    ]
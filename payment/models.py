@@ -24,6 +24,13 @@ class Pays(models.Model):
     paid_at = models.DateTimeField(auto_now_add=True)
     refund_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        # 거래 원장(UNION) 의 최신순 정렬/기간 필터용
+        indexes = [
+            models.Index(fields=["paid_at"], name="pays_paid_at_idx"),
+            models.Index(fields=["refund_at"], name="pays_refund_at_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.amount} {self.status}"
 
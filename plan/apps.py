@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class PlanConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "plan"
+
+    def ready(self) -> None:
+        from dbre_BE.conditional import track_model
+        from plan.models import Plans
+
+        track_model(Plans)
@@ -15,3 +15,20 @@ class PlanSerializer(serializers.ModelSerializer):
         if value <= 0:
             raise serializers.ValidationError("가격은 0보다 커야 합니다.")
         return float(value)
+
+
+class PlanBulkToggleSerializer(serializers.Serializer):
+    """플랜 일괄 활성/비활성 요청"""
+
+    plan_ids = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False, max_length=1000
+    )
+    is_active = serializers.BooleanField()
+
+    def validate(self, data: dict) -> dict:
+        # 활성 플랜은 하나만 유지 (PlanActivateView 와 같은 규칙)
+        if data["is_active"] and len(set(data["plan_ids"])) > 1:
+            raise serializers.ValidationError(
+                "활성화는 한 번에 하나의 플랜만 가능합니다."
+            )
+        return data
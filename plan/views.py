@@ -1,5 +1,6 @@
 from typing import List
 
+from django.db import transaction
 from django.db.models import Q
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
@@ -7,11 +8,13 @@ from django.views.decorators.csrf import csrf_exempt
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticatedOrReadOnly
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from dbre_BE.conditional import bump_table, conditional_get
 from plan.models import Plans
-from plan.serializers import PlanSerializer
+from plan.serializers import PlanBulkToggleSerializer, PlanSerializer
 
 
 # @csrf_exempt
@@ -41,6 +44,7 @@ class PlanListCreateView(APIView):
         responses={200: PlanSerializer(many=True)},
         summary="구독 플랜 목록 조회",
     )
+    @conditional_get([Plans])
     def get(self, request: PlanSerializer) -> Response:
         """구독 플랜 목록 조회"""
         plans = Plans.objects.all()
@@ -77,6 +81,7 @@ class PlanDetailView(APIView):
         responses={200: PlanSerializer(many=True)},
         summary="구독 플랜 개별 조회",
     )
+    @conditional_get([Plans])
     def get(self, request: PlanSerializer, plan_id: int) -> Response:
         """구독 플랜 개별 조회"""
         plan = get_object_or_404(Plans, id=plan_id)
@@ -137,6 +142,65 @@ class PlanActivateView(APIView):
         )
 
 
+@extend_schema(tags=["plan"])
+class PlanBulkToggleView(APIView):
+    """
+    여러 플랜의 활성 상태를 한 번에 변경
+    """
+
+    permission_classes = [IsAdminUser]
+    serializer_class = PlanBulkToggleSerializer
+
+    @extend_schema(
+        request=PlanBulkToggleSerializer,
+        summary="구독 플랜 일괄 활성/비활성",
+        description="플랜별 결과(updated, unchanged, not_found)를 반환합니다.",
+    )
+    def post(self, request: Request) -> Response:
+        """플랜 일괄 활성/비활성 (단일 UPDATE)"""
+        serializer = PlanBulkToggleSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        plan_ids = list(dict.fromkeys(serializer.validated_data["plan_ids"]))
+        is_active = serializer.validated_data["is_active"]
+
+        with transaction.atomic():
+            current = dict(
+                Plans.objects.select_for_update()
+                .filter(id__in=plan_ids)
+                .values_list("id", "is_active")
+            )
+            updated = Plans.objects.filter(
+                id__in=[
+                    plan_id
+                    for plan_id, active in current.items()
+                    if active != is_active
+                ]
+            ).update(is_active=is_active)
+            if is_active and current:
+                # 나머지 활성 플랜은 같은 트랜잭션에서 비활성화
+                Plans.objects.filter(~Q(id__in=current), is_active=True).update(
+                    is_active=False
+                )
+            bump_table(Plans)
+
+        results = [
+            {
+                "id": plan_id,
+                "result": (
+                    "not_found"
+                    if plan_id not in current
+                    else "unchanged" if current[plan_id] == is_active else "updated"
+                ),
+            }
+            for plan_id in plan_ids
+        ]
+        return Response(
+            {"updated": updated, "results": results}, status=status.HTTP_200_OK
+        )
+
+
 @extend_schema(tags=["plan"])
 class PlanDeleteView(APIView):
     """
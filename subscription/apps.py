@@ -4,3 +4,20 @@ from django.apps import AppConfig
 class SubscriptionConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "subscription"
+
+    def ready(self) -> None:
+        import subscription.signals  # noqa
+
+        from dbre_BE.background import should_start_scheduler
+        from dbre_BE.conditional import track_model
+        from subscription.models import SubHistories, Subs
+        from subscription.scheduler import start
+
+        track_model(Subs, user_field="user_id")
+        track_model(SubHistories, user_field="user_id")
+
+        # 백그라운드 프로세스 풀 자식 / SSE 전용 서비스에서는 스케줄러를 띄우지 않음
+        if not should_start_scheduler():
+            return
+
+        start()
@@ -0,0 +1,25 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from subscription.services.cohort_service import CohortRetentionService
+
+
+class Command(BaseCommand):
+    help = "구독 코호트 유지율 집계를 새 이력만큼 갱신합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="집계 테이블을 비우고 전체 이력으로 다시 계산",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        service = CohortRetentionService(batch_size=options["batch_size"])
+        if options["rebuild"]:
+            processed = service.rebuild()
+        else:
+            processed = service.refresh()
+        self.stdout.write(self.style.SUCCESS(f"{processed}건의 구독 이력 반영 완료"))
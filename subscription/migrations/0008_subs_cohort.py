@@ -0,0 +1,103 @@
+# Generated by Django 5.1.6 on 2026-10-19 08:05
+
+import django.db.models.deletion
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "subscription",
+            "0007_alter_subhistories_plan_alter_subhistories_sub_and_more",
+        ),
+        ("user", "0012_customuser_is_deletion_confirmed"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SubsCohortCheckpoint",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=50, primary_key=True, serialize=False),
+                ),
+                ("last_history_id", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="SubsCohortMember",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("cohort_month", models.DateField(db_index=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="SubsCohortCell",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("cohort_month", models.DateField()),
+                ("month_offset", models.PositiveSmallIntegerField()),
+                ("active_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["cohort_month", "month_offset"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("cohort_month", "month_offset"),
+                        name="unique_cohort_cell",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="SubsCohortActivity",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("month", models.DateField()),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "month"),
+                        name="unique_cohort_activity_user_month",
+                    )
+                ],
+            },
+        ),
+    ]
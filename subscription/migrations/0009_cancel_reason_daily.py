@@ -0,0 +1,67 @@
+# Generated by Django 5.1.6 on 2026-10-19 08:07
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("plan", "0002_alter_plans_is_active"),
+        ("subscription", "0008_subs_cohort"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CancelReasonDaily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                (
+                    "cancelled_reason",
+                    models.CharField(blank=True, default="", max_length=50),
+                ),
+                (
+                    "other_reason",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=255,
+                        verbose_name="기타 사유 (정규화)",
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "plan",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="plan.plans",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["day", "plan"], name="subscriptio_day_8391b2_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "plan", "cancelled_reason", "other_reason"),
+                        name="unique_cancel_reason_daily",
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+    ]
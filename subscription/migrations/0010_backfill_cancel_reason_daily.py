@@ -0,0 +1,53 @@
+# Generated by Django 5.1.6 on 2026-10-19 08:10
+
+import re
+
+from collections import Counter
+from typing import Any
+
+from django.db import migrations
+
+
+def backfill(apps: Any, schema_editor: Any) -> None:
+    """기존 취소 이력을 일별 집계로 채움"""
+    SubHistories = apps.get_model("subscription", "SubHistories")
+    CancelReasonDaily = apps.get_model("subscription", "CancelReasonDaily")
+
+    counts: Counter = Counter()
+    rows = (
+        SubHistories.objects.filter(status="refund_pending")
+        .values_list("change_date", "plan_id", "cancelled_reason", "other_reason")
+        .iterator(chunk_size=5000)
+    )
+    for change_date, plan_id, cancelled_reason, other_reason in rows:
+        other = re.sub(r"\s+", " ", other_reason or "").strip().lower()[:255]
+        counts[(change_date.date(), plan_id, cancelled_reason or "", other)] += 1
+
+    CancelReasonDaily.objects.bulk_create(
+        [
+            CancelReasonDaily(
+                day=day,
+                plan_id=plan_id,
+                cancelled_reason=cancelled_reason,
+                other_reason=other_reason,
+                count=count,
+            )
+            for (day, plan_id, cancelled_reason, other_reason), count in counts.items()
+        ],
+        batch_size=1000,
+    )
+
+
+def clear(apps: Any, schema_editor: Any) -> None:
+    apps.get_model("subscription", "CancelReasonDaily").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("subscription", "0009_cancel_reason_daily"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, clear),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.6 on 2026-10-19 08:20
+
+from typing import Any
+
+from django.db import migrations
+
+from dbre_BE.partitioning import convert_to_partitioned
+
+
+def partition_subhistories(apps: Any, schema_editor: Any) -> None:
+    convert_to_partitioned(schema_editor, "subscription_subhistories")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("subscription", "0010_backfill_cancel_reason_daily"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_subhistories, migrations.RunPython.noop),
+    ]
@@ -85,3 +85,74 @@ class SubHistories(models.Model):
         return (
             f"SubscriptionHistory {self.id} - {self.user.email if self.user else None}"
         )
+
+
+class SubsCohortCheckpoint(models.Model):
+    """코호트 집계가 마지막으로 반영한 SubHistories id"""
+
+    name = models.CharField(max_length=50, primary_key=True)
+    last_history_id = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.name} - {self.last_history_id}"
+
+
+class SubsCohortMember(models.Model):
+    """사용자별 코호트 (최초 결제 월)"""
+
+    user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, primary_key=True)
+    cohort_month = models.DateField(db_index=True)
+
+
+class SubsCohortActivity(models.Model):
+    """사용자가 구독을 유지(결제/재개)한 월"""
+
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
+    month = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "month"], name="unique_cohort_activity_user_month"
+            )
+        ]
+
+
+class SubsCohortCell(models.Model):
+    """코호트 × 경과 월 유지 사용자 수"""
+
+    cohort_month = models.DateField()
+    month_offset = models.PositiveSmallIntegerField()
+    active_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["cohort_month", "month_offset"],
+                name="unique_cohort_cell",
+            )
+        ]
+        ordering = ["cohort_month", "month_offset"]
+
+
+class CancelReasonDaily(models.Model):
+    """일별 · 플랜별 구독 취소 사유 집계 (SubHistories 저장 시 갱신)"""
+
+    day = models.DateField()
+    plan = models.ForeignKey(Plans, on_delete=models.SET_NULL, null=True)
+    cancelled_reason = models.CharField(max_length=50, blank=True, default="")
+    other_reason = models.CharField(
+        max_length=255, blank=True, default="", verbose_name="기타 사유 (정규화)"
+    )
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "plan", "cancelled_reason", "other_reason"],
+                name="unique_cancel_reason_daily",
+                nulls_distinct=False,
+            )
+        ]
+        indexes = [models.Index(fields=["day", "plan"])]
@@ -0,0 +1,55 @@
+import logging
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from dbre_BE.partitioning import PARTITIONED_TABLES, ensure_partitions
+from subscription.services.cohort_service import CohortRetentionService
+
+
+logger = logging.getLogger(__name__)
+
+PARTITION_LOCK_KEY = "partitions:lock"
+
+
+def refresh_cohort_retention() -> None:
+    """전날까지의 구독 이력을 코호트 집계에 반영"""
+    try:
+        CohortRetentionService().refresh()
+    except Exception as e:
+        logger.error(f"코호트 집계 갱신 실패: {e}")
+
+
+def create_future_partitions() -> None:
+    """이력 테이블의 다음 달 파티션을 미리 생성 (워커 간 잠금, 한 워커만 실행)"""
+    try:
+        lock = get_redis_connection("default").lock(
+            cache.make_key(PARTITION_LOCK_KEY), timeout=10 * 60, blocking_timeout=0
+        )
+        if not lock.acquire():
+            return
+    except RedisError as e:
+        logger.error(f"파티션 생성 잠금 실패: {e}")
+        return
+    try:
+        for table in PARTITIONED_TABLES:
+            try:
+                ensure_partitions(table)
+            except Exception as e:
+                logger.error(f"{table} 파티션 생성 실패: {e}")
+    finally:
+        try:
+            lock.release()
+        except RedisError:
+            pass
+
+
+def start() -> None:
+    """APScheduler 실행"""
+    scheduler = BackgroundScheduler()
+    scheduler.add_job(refresh_cohort_retention, trigger=CronTrigger(hour=4, minute=0))
+    scheduler.add_job(create_future_partitions, trigger=CronTrigger(day=1, hour=3))
+    scheduler.start()
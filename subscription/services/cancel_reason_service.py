@@ -0,0 +1,126 @@
+import re
+
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, QuerySet, Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+
+from subscription.models import CancelReasonDaily, SubHistories
+
+
+# 사용자가 직접 구독을 취소할 때 기록되는 이력 상태
+CANCEL_STATUS = "refund_pending"
+
+GRANULARITIES = {"day": TruncDay, "week": TruncWeek, "month": TruncMonth}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_other_reason(value: Optional[str]) -> str:
+    """기타 사유 자유 입력을 묶어서 집계할 수 있도록 정규화"""
+    if not value:
+        return ""
+    return _WHITESPACE.sub(" ", value).strip().lower()[:255]
+
+
+def record_cancellation(history: SubHistories) -> None:
+    """취소 이력 1건을 일별 집계에 반영 (이력 저장과 같은 트랜잭션)"""
+    key = {
+        "day": history.change_date.date(),
+        "plan_id": history.plan_id,
+        "cancelled_reason": history.cancelled_reason or "",
+        "other_reason": normalize_other_reason(history.other_reason),
+    }
+    if CancelReasonDaily.objects.filter(**key).update(count=F("count") + 1):
+        return
+    try:
+        with transaction.atomic():
+            CancelReasonDaily.objects.create(count=1, **key)
+    except IntegrityError:
+        # 동시에 같은 행을 만든 경우
+        CancelReasonDaily.objects.filter(**key).update(count=F("count") + 1)
+
+
+def merge_plan_counts(plan_id: int) -> None:
+    """
+    삭제되는 플랜의 집계를 플랜 없음(NULL) 집계에 합산 (플랜 삭제와 같은 트랜잭션)
+    FK 가 SET_NULL 로 비워지면 기존 NULL 행과 유일 제약이 충돌하므로 먼저 합친다
+    """
+    rows = CancelReasonDaily.objects.select_for_update().filter(plan_id=plan_id)
+    for row in rows:
+        key = {
+            "day": row.day,
+            "plan_id": None,
+            "cancelled_reason": row.cancelled_reason,
+            "other_reason": row.other_reason,
+        }
+        if not CancelReasonDaily.objects.filter(**key).update(
+            count=F("count") + row.count
+        ):
+            CancelReasonDaily.objects.create(count=row.count, **key)
+    rows.delete()
+
+
+def _filtered(
+    start_date: Optional[date], end_date: Optional[date], plan_id: Optional[int]
+) -> QuerySet[CancelReasonDaily]:
+    queryset = CancelReasonDaily.objects.all()
+    if start_date:
+        queryset = queryset.filter(day__gte=start_date)
+    if end_date:
+        queryset = queryset.filter(day__lte=end_date)
+    if plan_id:
+        queryset = queryset.filter(plan_id=plan_id)
+    return queryset
+
+
+def count_by_reason(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    plan_id: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """기간 · 플랜별 취소 사유 카운트"""
+    rows = (
+        _filtered(start_date, end_date, plan_id)
+        .values("cancelled_reason")
+        .annotate(count=Sum("count"))
+        .order_by("-count")
+    )
+    return [dict(row) for row in rows]
+
+
+def reason_trend(
+    granularity: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    plan_id: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """기간 단위(day/week/month)별 취소 사유 추이"""
+    trunc = GRANULARITIES[granularity]
+    rows = (
+        _filtered(start_date, end_date, plan_id)
+        .annotate(period=trunc("day"))
+        .values("period", "cancelled_reason")
+        .annotate(count=Sum("count"))
+        .order_by("period", "-count")
+    )
+    return [dict(row) for row in rows]
+
+
+def top_other_reasons(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    plan_id: Optional[int] = None,
+    limit: int = 20,
+) -> List[Dict[str, Any]]:
+    """정규화된 기타 사유 문구별 카운트"""
+    rows = (
+        _filtered(start_date, end_date, plan_id)
+        .exclude(other_reason="")
+        .values("other_reason")
+        .annotate(count=Sum("count"))
+        .order_by("-count")[:limit]
+    )
+    return [dict(row) for row in rows]
@@ -0,0 +1,202 @@
+import logging
+
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import F
+from django.utils.timezone import now
+
+from subscription.models import (
+    SubHistories,
+    SubsCohortActivity,
+    SubsCohortCell,
+    SubsCohortCheckpoint,
+    SubsCohortMember,
+)
+
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_NAME = "subs_retention"
+
+# 해당 월에 구독을 유지한 것으로 보는 이력 상태 (결제 갱신 / 재개)
+ACTIVE_STATUSES = ("renewal", "restart", "restarted")
+
+# 아직 커밋되지 않은 이전 id 를 건너뛰지 않도록 최근 이력은 다음 실행에 반영
+# (SubHistories 를 쓰는 트랜잭션은 이 시간보다 짧아야 함)
+COMMIT_LAG = timedelta(minutes=5)
+
+
+def month_start(value: datetime | date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def month_offset(cohort_month: date, month: date) -> int:
+    return (month.year - cohort_month.year) * 12 + month.month - cohort_month.month
+
+
+class CohortRetentionService:
+    """SubHistories 를 체크포인트 이후분만 읽어 코호트 × 월 집계를 갱신"""
+
+    def __init__(self, batch_size: int = 5000) -> None:
+        self.batch_size = batch_size
+
+    def refresh(self) -> int:
+        """새 이력을 모두 반영하고 처리한 이력 수 반환"""
+        cutoff = now() - COMMIT_LAG
+        processed = 0
+        while True:
+            count = self._process_batch(cutoff)
+            processed += count
+            if count < self.batch_size:
+                break
+        logger.info(f"코호트 집계 갱신 완료: {processed}건 반영")
+        return processed
+
+    def rebuild(self) -> int:
+        """집계 테이블을 비우고 처음부터 다시 계산"""
+        with transaction.atomic():
+            SubsCohortCell.objects.all().delete()
+            SubsCohortActivity.objects.all().delete()
+            SubsCohortMember.objects.all().delete()
+            SubsCohortCheckpoint.objects.filter(name=CHECKPOINT_NAME).delete()
+        return self.refresh()
+
+    @transaction.atomic
+    def _process_batch(self, cutoff: datetime) -> int:
+        # 체크포인트 행 잠금으로 동시 실행 직렬화
+        checkpoint, _ = SubsCohortCheckpoint.objects.select_for_update().get_or_create(
+            name=CHECKPOINT_NAME
+        )
+        rows = list(
+            SubHistories.objects.filter(id__gt=checkpoint.last_history_id)
+            .order_by("id")
+            .values_list("id", "user_id", "status", "change_date")[: self.batch_size]
+        )
+        # 체크포인트가 id 기준이므로 최근 이력을 만나면 그 앞까지만 반영하고 멈춤
+        # (걸러내고 뒤의 id 를 처리하면 체크포인트가 건너뛴 이력을 지나쳐 버림)
+        for index, row in enumerate(rows):
+            if row[3] >= cutoff:
+                rows = rows[:index]
+                break
+        if not rows:
+            return 0
+
+        # 배치 내 (사용자, 월) 활동 목록 (id 순서 유지)
+        events: List[Tuple[UUID, date]] = []
+        for _, user_id, history_status, change_date in rows:
+            if user_id is not None and history_status in ACTIVE_STATUSES:
+                events.append((user_id, month_start(change_date)))
+
+        if events:
+            self._apply(events)
+
+        checkpoint.last_history_id = rows[-1][0]
+        checkpoint.save(update_fields=["last_history_id", "updated_at"])
+        return len(rows)
+
+    def _apply(self, events: List[Tuple[UUID, date]]) -> None:
+        user_ids = {user_id for user_id, _ in events}
+        cohorts: Dict[UUID, date] = dict(
+            SubsCohortMember.objects.filter(user_id__in=user_ids).values_list(
+                "user_id", "cohort_month"
+            )
+        )
+
+        # 처음 보는 사용자는 첫 활동 월을 코호트로 지정
+        new_members: Dict[UUID, date] = {}
+        for user_id, month in events:
+            if user_id not in cohorts and user_id not in new_members:
+                new_members[user_id] = month
+        SubsCohortMember.objects.bulk_create(
+            [
+                SubsCohortMember(user_id=user_id, cohort_month=month)
+                for user_id, month in new_members.items()
+            ]
+        )
+        cohorts.update(new_members)
+
+        months = {month for _, month in events}
+        seen: Set[Tuple[UUID, date]] = set(
+            SubsCohortActivity.objects.filter(
+                user_id__in=user_ids, month__in=months
+            ).values_list("user_id", "month")
+        )
+
+        new_activities: List[SubsCohortActivity] = []
+        increments: Counter[Tuple[date, int]] = Counter()
+        for user_id, month in events:
+            if (user_id, month) in seen:
+                continue
+            seen.add((user_id, month))
+            offset = month_offset(cohorts[user_id], month)
+            if offset < 0:
+                continue
+            new_activities.append(SubsCohortActivity(user_id=user_id, month=month))
+            increments[(cohorts[user_id], offset)] += 1
+        SubsCohortActivity.objects.bulk_create(new_activities)
+
+        self._increment_cells(increments)
+
+    def _increment_cells(self, increments: Counter[Tuple[date, int]]) -> None:
+        if not increments:
+            return
+        existing = set(
+            SubsCohortCell.objects.filter(
+                cohort_month__in={cohort for cohort, _ in increments}
+            ).values_list("cohort_month", "month_offset")
+        )
+        missing = []
+        for (cohort, offset), count in increments.items():
+            if (cohort, offset) in existing:
+                SubsCohortCell.objects.filter(
+                    cohort_month=cohort, month_offset=offset
+                ).update(active_count=F("active_count") + count)
+            else:
+                missing.append(
+                    SubsCohortCell(
+                        cohort_month=cohort, month_offset=offset, active_count=count
+                    )
+                )
+        SubsCohortCell.objects.bulk_create(missing)
+
+
+def get_retention_triangle(since: Optional[date] = None) -> Dict[str, Any]:
+    """집계 테이블에서 코호트 유지율 삼각형 구성"""
+    cells = SubsCohortCell.objects.all()
+    if since:
+        cells = cells.filter(cohort_month__gte=since)
+
+    cohorts: Dict[date, List[Dict[str, Any]]] = {}
+    for cohort_month, offset, active_count in cells.values_list(
+        "cohort_month", "month_offset", "active_count"
+    ):
+        cohorts.setdefault(cohort_month, []).append(
+            {"month_offset": offset, "active_count": active_count}
+        )
+
+    result = []
+    for cohort_month, row in cohorts.items():
+        size = next(
+            (cell["active_count"] for cell in row if cell["month_offset"] == 0), 0
+        )
+        for cell in row:
+            cell["retention_rate"] = (
+                round(cell["active_count"] / size * 100, 1) if size else 0.0
+            )
+        result.append(
+            {
+                "cohort_month": cohort_month.strftime("%Y-%m"),
+                "cohort_size": size,
+                "months": row,
+            }
+        )
+
+    checkpoint = SubsCohortCheckpoint.objects.filter(name=CHECKPOINT_NAME).first()
+    return {
+        "updated_at": checkpoint.updated_at if checkpoint else None,
+        "cohorts": result,
+    }
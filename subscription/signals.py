@@ -0,0 +1,29 @@
+from typing import Any
+
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from plan.models import Plans
+from subscription.models import SubHistories
+from subscription.services.cancel_reason_service import (
+    CANCEL_STATUS,
+    merge_plan_counts,
+    record_cancellation,
+)
+
+
+@receiver(post_save, sender=SubHistories)
+def update_cancel_reason_daily(
+    sender: type[SubHistories], instance: SubHistories, created: bool, **kwargs: Any
+) -> None:
+    """취소 이력이 생성되면 일별 취소 사유 집계 갱신"""
+    if created and instance.status == CANCEL_STATUS:
+        record_cancellation(instance)
+
+
+@receiver(pre_delete, sender=Plans)
+def merge_cancel_reason_daily(
+    sender: type[Plans], instance: Plans, **kwargs: Any
+) -> None:
+    """플랜 삭제 전 해당 플랜의 취소 사유 집계를 플랜 없음 집계로 합산"""
+    merge_plan_counts(instance.pk)
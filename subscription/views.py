@@ -6,6 +6,8 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from dbre_BE.conditional import conditional_get
+from plan.models import Plans
 from subscription.models import SubHistories, Subs
 from subscription.serializers import SubHistorySerializer, SubsSerializer
 
@@ -30,6 +32,7 @@ class SubscriptionView(APIView):
         request=None,
         parameters=[],
     )
+    @conditional_get([Plans], per_user=True)
     def get(self, request: Request) -> Response:
         subs = Subs.objects.filter(user_id=request.user.id)
 
@@ -57,6 +60,7 @@ class SusHistoryView(APIView):
         },
         summary="구독 이력 조회",
     )
+    @conditional_get(per_user=True)
     def get(self, request: Request) -> Response:
         subs_history = SubHistories.objects.filter(user_id=request.user.id)
         if not subs_history.exists():
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class TallyConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "tally"
+
+    def ready(self) -> None:
+        from dbre_BE.conditional import track_model
+        from tally.models import Tally
+
+        track_model(Tally, user_field="user_id")
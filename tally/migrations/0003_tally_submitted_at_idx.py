@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-19 08:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tally", "0002_tally_complete_tally_created_at_tally_form_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="tally",
+            index=models.Index(fields=["submitted_at"], name="tally_submitted_at_idx"),
+        ),
+    ]
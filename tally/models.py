@@ -15,3 +15,7 @@ class Tally(models.Model):
     form_data = models.JSONField()
     complete = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        # response_id 전역 UNIQUE 때문에 파티셔닝 대신 기간 조회용 인덱스 사용
+        indexes = [models.Index(fields=["submitted_at"], name="tally_submitted_at_idx")]
@@ -2,7 +2,6 @@ import hashlib
 import hmac
 import json
 import logging
-import re
 
 from typing import Any
 
@@ -21,22 +20,12 @@ from rest_framework.views import APIView
 from tally.models import Tally
 from tally.serializers import TallyWebhookSerializer
 from user.models import CustomUser
+from user.phone import InvalidPhoneNumber, to_display
 
 
 logger = logging.getLogger(__name__)
 
 
-def format_phone_number(phone: str) -> str:
-    """
-    국제 형식(+821012345678)을 한국 표준 전화번호 형식(010-1234-5678)으로 변환
-    """
-    if phone.startswith("+82"):
-        phone = "0" + phone[3:]
-
-    phone = re.sub(r"(\d{3})(\d{4})(\d{4})", r"\1-\2-\3", phone)
-    return phone
-
-
 @extend_schema(tags=["tally"], summary="탈리 웹훅")
 @method_decorator(csrf_exempt, name="dispatch")
 class TallyWebhookAPIView(APIView):
@@ -99,7 +88,11 @@ class TallyWebhookAPIView(APIView):
             elif "성함" in label or "이름" in label:
                 name = value
             elif "연락처" in label or "phone" in label:
-                phone = format_phone_number(value)  # 전화번호 변환
+                # 국제 형식(+821012345678) 등 표기와 관계없이 010-1234-5678 로 변환
+                try:
+                    phone = to_display(value)
+                except InvalidPhoneNumber:
+                    logger.warning(f"Invalid phone number: {value}")
             else:
                 additional_data[label] = value  # 기타 필드는 추가 정보로 저장
 
@@ -114,7 +107,7 @@ class TallyWebhookAPIView(APIView):
         # 유저 존재 여부 확인 (전화번호 or 이메일 기준)
         user = None
         if phone:
-            user = CustomUser.objects.filter(phone=phone).first()
+            user = CustomUser.objects.by_phone(phone).first()
         if not user and email:
             user, created = CustomUser.objects.get_or_create(
                 email=email,
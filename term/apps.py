@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class TermConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "term"
+
+    def ready(self) -> None:
+        from dbre_BE.conditional import track_model
+        from term.models import Terms
+
+        track_model(Terms)
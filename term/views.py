@@ -8,6 +8,8 @@ from rest_framework.generics import GenericAPIView, ListCreateAPIView, RetrieveA
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from dbre_BE.conditional import conditional_get
+
 from .models import Terms
 from .serializers import TermsModelSerializer
 
@@ -31,6 +33,10 @@ class CreateTermAPI(ListCreateAPIView):
     queryset = Terms.objects.all()
     serializer_class = TermsModelSerializer
 
+    @conditional_get([Terms])
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Response:
+        return super().get(request, *args, **kwargs)
+
 
 class LatestTermsAPI(GenericAPIView):
     serializer_class = TermsModelSerializer
@@ -42,6 +48,7 @@ class LatestTermsAPI(GenericAPIView):
         description="Fetch the most recently created Terms entry.",
         responses={200: TermsModelSerializer},  # 상태 코드와 함께 응답 타입 지정
     )
+    @conditional_get([Terms])
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Response:
         latest_term = Terms.objects.latest("created_at")
         serializer = self.get_serializer(latest_term)
@@ -59,3 +66,7 @@ class TermsDetailAPI(RetrieveAPIView):
     queryset = Terms.objects.all()
     serializer_class = TermsModelSerializer
     lookup_field = "id"  # URL에서 id를 기준으로 조회
+
+    @conditional_get([Terms])
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Response:
+        return super().get(request, *args, **kwargs)
@@ -7,3 +7,18 @@ class UserConfig(AppConfig):
 
     def ready(self) -> None:
         import user.signals  # noqa
+
+        from dbre_BE.background import should_start_scheduler
+        from dbre_BE.conditional import track_model
+        from user.models import Agreements, CustomUser, UserAccountSummary
+        from user.scheduler import start
+
+        track_model(CustomUser, user_field="pk")
+        track_model(Agreements, user_field="user_id")
+        track_model(UserAccountSummary, user_field="user_id")
+
+        # 백그라운드 프로세스 풀 자식 / SSE 전용 서비스에서는 스케줄러를 띄우지 않음
+        if not should_start_scheduler():
+            return
+
+        start()
@@ -0,0 +1,220 @@
+"""
+캐시 기반 JWT 인증
+
+JWTAuthentication 은 요청마다 토큰 서명 검증 후 email 로 user_users 를 조회한다.
+검증된 토큰(해시)과 사용자 레코드를 프로세스 내 LRU + Redis 에 보관하여
+핫 경로에서는 사용자 버전 키 조회(Redis 1회) 외에 DB 쿼리 없이 인증한다.
+사용자 버전은 프로필/상태/비밀번호 변경(저장 시)과 로그아웃 시 갱신된다.
+"""
+
+import hashlib
+import logging
+import pickle
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from redis.exceptions import RedisError
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from user.models import CustomUser
+
+
+logger = logging.getLogger(__name__)
+
+TOKEN_KEY = "auth:token:{digest}"
+USER_REF_KEY = "auth:user_ref:{claim}"
+USER_VERSION_KEY = "auth:user_version:{pk}"
+USER_KEY = "auth:user:{pk}:{version}"
+
+
+class LocalLRU:
+    """만료 시각을 갖는 스레드 안전 LRU (gthread 워커 대비)"""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+_local = LocalLRU(settings.AUTH_CACHE_LOCAL_SIZE)
+
+
+def _user_version_key(pk: Any) -> str:
+    return USER_VERSION_KEY.format(pk=pk)
+
+
+def bump_user_version(*pks: Any) -> None:
+    """사용자 캐시 무효화 (다른 프로세스의 로컬 LRU 도 버전 불일치로 무효화됨)"""
+    if not pks:
+        return
+    version = time.time_ns()
+    try:
+        cache.set_many({_user_version_key(pk): version for pk in pks}, timeout=None)
+    except RedisError as e:
+        logger.error(f"사용자 인증 캐시 무효화 실패 ({len(pks)}명): {e}")
+
+
+def invalidate_users(pks: Iterable[Any]) -> None:
+    """커밋 이후 사용자 캐시 무효화 (커밋 전 값이 새 버전으로 캐시되는 것 방지)"""
+    pks = list(pks)
+    transaction.on_commit(lambda: bump_user_version(*pks))
+
+
+def _get_user_version(pk: Any) -> int:
+    key = _user_version_key(pk)
+    version = cache.get(key)
+    if version is None:
+        # 키가 없으면(최초/Redis 초기화) 새 버전으로 시작하여 이전 로컬 캐시를 무시
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return int(version)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        key = TOKEN_KEY.format(digest=hashlib.sha256(raw_token).hexdigest())
+        cached: Optional[Token] = _local.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            index = cache.get(key)
+        except RedisError:
+            index = None
+        token: Token
+        if index is not None:
+            # 서명/만료는 캐시에 넣을 때 검증했으므로 디코딩만 수행
+            token = api_settings.AUTH_TOKEN_CLASSES[index](raw_token, verify=False)
+        else:
+            token = super().get_validated_token(raw_token)
+            index = [cls.__name__ for cls in api_settings.AUTH_TOKEN_CLASSES].index(
+                type(token).__name__
+            )
+            ttl = int(token["exp"]) - int(time.time())
+            if ttl > 0:
+                try:
+                    cache.set(key, index, timeout=ttl)
+                except RedisError as e:
+                    logger.warning(f"토큰 캐시 저장 실패: {e}")
+
+        _local.set(key, token, expires_at=float(token["exp"]))
+        return token
+
+    def get_user(self, validated_token: Token) -> CustomUser:  # type: ignore[override]
+        try:
+            claim = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                str(_("Token contained no recognizable user identification"))
+            )
+
+        try:
+            user = self._get_user(claim)
+        except RedisError as e:
+            logger.warning(f"사용자 인증 캐시 조회 실패, DB 조회로 대체: {e}")
+            user = self._query_user(**{api_settings.USER_ID_FIELD: claim})
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
+
+    def _get_user(self, claim: Any) -> CustomUser:
+        ref_key = USER_REF_KEY.format(claim=claim)
+        pk = _local.get(ref_key) or cache.get(ref_key)
+        if pk is None:
+            # 최초 조회: email 로 조회 후 pk 매핑 저장
+            user = self._query_user(**{api_settings.USER_ID_FIELD: claim})
+            self._store(claim, user, _get_user_version(user.pk))
+            return user
+
+        # DB 조회 전에 버전을 읽어, 조회 중 변경이 생기면 이 캐시는 이전 버전으로 남게 함
+        version = _get_user_version(pk)
+        user_key = USER_KEY.format(pk=pk, version=version)
+        data = _local.get(user_key) or cache.get(user_key)
+        if data is None:
+            user = self._query_user(pk=pk)
+        else:
+            # 뷰에서 request.user 를 수정해도 캐시에 영향이 없도록 매번 새 인스턴스로 복원
+            user = pickle.loads(data)
+
+        if getattr(user, api_settings.USER_ID_FIELD) != claim:
+            # 이메일 변경 등으로 매핑이 달라진 경우 email 로 다시 조회
+            _local.delete(ref_key)
+            user = self._query_user(**{api_settings.USER_ID_FIELD: claim})
+            self._store(claim, user, _get_user_version(user.pk))
+            return user
+
+        if data is None:
+            self._store(claim, user, version)
+        else:
+            expires_at = time.time() + settings.AUTH_USER_CACHE_TIMEOUT
+            _local.set(ref_key, pk, expires_at=expires_at)
+            _local.set(user_key, data, expires_at=expires_at)
+        return user
+
+    def _query_user(self, **lookup: Any) -> CustomUser:
+        try:
+            return self.user_model.objects.get(**lookup)
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+    def _store(self, claim: Any, user: CustomUser, version: int) -> None:
+        ref_key = USER_REF_KEY.format(claim=claim)
+        user_key = USER_KEY.format(pk=user.pk, version=version)
+        data = pickle.dumps(user)
+        timeout = settings.AUTH_USER_CACHE_TIMEOUT
+        cache.set_many({ref_key: user.pk, user_key: data}, timeout=timeout)
+        expires_at = time.time() + timeout
+        _local.set(ref_key, user.pk, expires_at=expires_at)
+        _local.set(user_key, data, expires_at=expires_at)
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """OpenAPI 문서에서 기존 jwtAuth(Bearer) 스킴으로 표시"""
+
+    target_class = "user.authentication.CachedJWTAuthentication"
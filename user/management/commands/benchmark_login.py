@@ -0,0 +1,83 @@
+import time
+import uuid
+
+from typing import Any, Callable, Tuple
+
+from django.contrib.auth import authenticate
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from user.models import CustomUser
+from user.serializers import LoginSerializer
+from user.tokens import RefreshToken
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "로그인 처리량 측정: 기존 방식(조회+check_password 후 authenticate() 재실행)과 "
+        "단일 검증 방식의 워커 1개 기준 초당 로그인 수를 비교합니다. "
+        "임시 사용자는 측정 후 롤백됩니다."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--iterations", type=int, default=20)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        iterations = options["iterations"]
+        email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+        password = uuid.uuid4().hex
+
+        try:
+            with transaction.atomic():
+                CustomUser.objects.create_user(
+                    email=email,
+                    password=password,
+                    name="bench",
+                    phone=f"010{uuid.uuid4().int % 10**8:08d}",
+                )
+
+                def legacy() -> None:
+                    user = CustomUser.objects.get(email=email)
+                    user.check_password(password)
+                    authenticated = authenticate(email=email, password=password)
+                    refresh = RefreshToken.for_user(authenticated or user)
+                    str(refresh.access_token), str(refresh)
+
+                def single_pass() -> None:
+                    serializer = LoginSerializer(
+                        data={"email": email, "password": password}
+                    )
+                    serializer.is_valid(raise_exception=True)
+
+                results = [
+                    ("기존", self.measure(legacy, iterations)),
+                    ("단일 검증", self.measure(single_pass, iterations)),
+                ]
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        for label, (rate, queries) in results:
+            self.stdout.write(
+                f"{label}: {rate:.1f} 로그인/초, 로그인당 쿼리 {queries}회"
+            )
+        before, after = results[0][1][0], results[1][1][0]
+        self.stdout.write(self.style.SUCCESS(f"처리량 {after / before:.2f}배"))
+
+    @staticmethod
+    def measure(login: Callable[[], None], iterations: int) -> Tuple[float, int]:
+        login()  # 워밍업
+        with CaptureQueriesContext(connection) as ctx:
+            login()
+        queries = len(ctx.captured_queries)
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            login()
+        elapsed = time.perf_counter() - started
+        return iterations / elapsed, queries
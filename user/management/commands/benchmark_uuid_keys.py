@@ -0,0 +1,81 @@
+import time
+import uuid
+
+from typing import Any, Callable, Dict, Tuple
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+
+from dbre_BE.ids import uuid7
+
+
+class Command(BaseCommand):
+    help = (
+        "uuid4 / uuid7 기본 키 비교: 임시 테이블에 같은 수의 행을 넣어 삽입 처리량과 "
+        "PK/FK 인덱스 크기를 측정합니다. (PostgreSQL, 임시 테이블은 세션 종료 시 삭제)"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if connection.vendor != "postgresql":
+            raise CommandError("PostgreSQL 에서만 실행할 수 있습니다.")
+
+        generators: Dict[str, Callable[[], uuid.UUID]] = {
+            "uuid4": uuid.uuid4,
+            "uuid7": uuid7,
+        }
+        for label, generate in generators.items():
+            rate, sizes = self.measure(
+                label, generate, options["rows"], options["batch_size"]
+            )
+            self.stdout.write(
+                f"{label}: {rate:,.0f} 행/초, PK 인덱스 {sizes['pk']:,}B, "
+                f"FK 인덱스 {sizes['fk']:,}B, 테이블 {sizes['table']:,}B"
+            )
+
+    def measure(
+        self,
+        label: str,
+        generate: Callable[[], uuid.UUID],
+        rows: int,
+        batch_size: int,
+    ) -> Tuple[float, Dict[str, int]]:
+        table = f"bench_keys_{label}"
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            # user_id 는 Subs/Pays 등의 사용자 FK 인덱스를 흉내냄 (최근 가입자 위주 참조)
+            cursor.execute(
+                f"CREATE TEMP TABLE {table} ("
+                "id uuid PRIMARY KEY, user_id uuid NOT NULL, created_at timestamp"
+                ")"
+            )
+            cursor.execute(f"CREATE INDEX {table}_user_id ON {table} (user_id)")
+
+            started = time.perf_counter()
+            inserted = 0
+            while inserted < rows:
+                size = min(batch_size, rows - inserted)
+                params = []
+                for _ in range(size):
+                    key = str(generate())
+                    params += [key, key]
+                cursor.execute(
+                    f"INSERT INTO {table} (id, user_id, created_at) VALUES "
+                    + ",".join(["(%s, %s, now())"] * size),
+                    params,
+                )
+                inserted += size
+            elapsed = time.perf_counter() - started
+
+            cursor.execute(
+                "SELECT pg_relation_size(%s), pg_relation_size(%s), "
+                "pg_relation_size(%s)",
+                [f"{table}_pkey", f"{table}_user_id", table],
+            )
+            pk_size, fk_size, table_size = cursor.fetchone()
+            cursor.execute(f"DROP TABLE {table}")
+
+        return rows / elapsed, {"pk": pk_size, "fk": fk_size, "table": table_size}
@@ -0,0 +1,64 @@
+from typing import Any, List
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from dbre_BE.conditional import bump_table
+from user.models import CustomUser
+from user.phone import duplicate_phones
+
+
+class Command(BaseCommand):
+    help = (
+        "표기만 다른 같은 휴대폰 번호를 가진 계정을 출력합니다. --apply 를 주면 가장 "
+        "먼저 가입한 계정만 번호를 유지하고 나머지 계정의 phone 을 비웁니다. "
+        "(user 0014 마이그레이션 전 정리용, 먼저 출력 결과를 검토)"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--apply", action="store_true", help="중복 계정의 phone 삭제 (기본: 출력만)"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # phone_e164 컬럼이 아직 없을 수 있으므로 필요한 컬럼만 조회
+        users = CustomUser.objects.exclude(phone__isnull=True).exclude(phone="")
+        rows = users.order_by("created_at").values_list("id", "phone")
+        duplicates = duplicate_phones(rows.iterator(chunk_size=2000))
+        if not duplicates:
+            self.stdout.write(self.style.SUCCESS("중복 전화번호 없음"))
+            return
+
+        details = {
+            row[0]: row
+            for row in CustomUser.objects.filter(
+                pk__in=[user_id for ids in duplicates.values() for user_id in ids]
+            ).values_list("id", "email", "phone", "created_at")
+        }
+        cleared: List[Any] = []
+        for phone_e164, ids in duplicates.items():
+            self.stdout.write(f"{phone_e164}")
+            for index, user_id in enumerate(ids):
+                _, email, phone, created_at = details[user_id]
+                label = "유지" if index == 0 else "삭제"
+                self.stdout.write(
+                    f"  [{label}] {user_id} {email} {phone} (가입 {created_at:%Y-%m-%d})"
+                )
+            cleared += ids[1:]
+
+        if not options["apply"]:
+            self.stdout.write(
+                f"중복 {len(duplicates)}건, phone 삭제 대상 {len(cleared)}명 "
+                "(--apply 로 적용)"
+            )
+            return
+
+        with transaction.atomic():
+            for start in range(0, len(cleared), 1000):
+                CustomUser.objects.filter(pk__in=cleared[start : start + 1000]).update(
+                    phone=None
+                )
+            bump_table(CustomUser, user_ids=cleared)
+        self.stdout.write(
+            self.style.SUCCESS(f"중복 계정 {len(cleared)}명의 phone 삭제 완료")
+        )
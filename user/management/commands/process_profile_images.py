@@ -0,0 +1,37 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from user.models import CustomUser
+from user.services.profile_images import key_from_url, process_profile_image
+
+
+class Command(BaseCommand):
+    help = "리사이즈 이미지가 없는 기존 프로필 이미지(버킷 이미지)의 리사이즈 이미지를 생성합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--limit", type=int, default=None)
+        parser.add_argument("--dry-run", action="store_true", help="대상 건수만 출력")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        targets = (
+            CustomUser.objects.filter(
+                img_url__startswith=f"{settings.NCP_BUCKET_URL}/", img_variants={}
+            )
+            .order_by("created_at")
+            .values_list("id", "img_url")
+        )
+        if options["dry_run"]:
+            self.stdout.write(f"대상: {targets.count()}명")
+            return
+        if options["limit"]:
+            targets = targets[: options["limit"]]
+
+        processed = 0
+        for user_id, img_url in targets.iterator():
+            key = key_from_url(img_url)
+            if key:
+                process_profile_image(str(user_id), key)
+                processed += 1
+        self.stdout.write(self.style.SUCCESS(f"{processed}명 처리 완료"))
@@ -0,0 +1,46 @@
+import time
+
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from user.services.user_purge import purge_deleted_users
+
+
+class Command(BaseCommand):
+    help = (
+        "보관 기간이 지난 탈퇴 확정 사용자를 배치 단위로 정리합니다. "
+        "(결제/구독 이력은 익명화하여 보관, 나머지 사용자 데이터는 삭제)"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=settings.USER_PURGE_RETENTION_DAYS,
+            help="탈퇴 후 보관 일수",
+        )
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--pause", type=float, default=0.5, help="배치 사이 대기 시간 (초)"
+        )
+        parser.add_argument(
+            "--max-seconds", type=int, default=None, help="최대 실행 시간 (초)"
+        )
+        parser.add_argument("--dry-run", action="store_true", help="대상 인원만 출력")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        deadline: Optional[float] = None
+        if options["max_seconds"]:
+            deadline = time.monotonic() + options["max_seconds"]
+
+        count = purge_deleted_users(
+            options["retention_days"],
+            batch_size=options["batch_size"],
+            pause=options["pause"],
+            should_stop=lambda: deadline is not None and time.monotonic() > deadline,
+            dry_run=options["dry_run"],
+        )
+        verb = "정리 대상" if options["dry_run"] else "정리 완료"
+        self.stdout.write(self.style.SUCCESS(f"탈퇴 사용자 {verb}: {count}명"))
@@ -0,0 +1,81 @@
+import time
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.utils.timezone import now
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from user.tokens import blacklist_many
+
+
+class Command(BaseCommand):
+    help = (
+        "simplejwt token_blacklist 테이블의 유효한 블랙리스트를 Redis 로 옮기고 "
+        "OutstandingToken / BlacklistedToken 행을 배치 단위로 삭제합니다."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.05,
+            help="삭제 배치 사이 대기 시간 (초)",
+        )
+        parser.add_argument(
+            "--expired-only",
+            action="store_true",
+            help="만료된 토큰 행만 삭제 (기본: Redis 이전 후 전체 삭제)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="대상 건수만 출력")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+        current = now()
+
+        # 1. 아직 만료되지 않은 블랙리스트를 Redis 로 이전
+        active = BlacklistedToken.objects.filter(token__expires_at__gt=current)
+        targets = OutstandingToken.objects.all()
+        if options["expired_only"]:
+            targets = targets.filter(expires_at__lte=current)
+
+        if options["dry_run"]:
+            self.stdout.write(f"Redis 이전 대상 블랙리스트: {active.count()}건")
+            self.stdout.write(f"삭제 대상 OutstandingToken: {targets.count()}건")
+            return
+
+        migrated = 0
+        last_id = 0
+        while True:
+            chunk = list(
+                active.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", "token__jti", "token__expires_at")[:batch_size]
+            )
+            if not chunk:
+                break
+            migrated += blacklist_many(
+                {jti: int(expires_at.timestamp()) for _, jti, expires_at in chunk}
+            )
+            last_id = chunk[-1][0]
+        self.stdout.write(f"Redis 블랙리스트 이전: {migrated}건")
+
+        # 2. 짧은 트랜잭션으로 나누어 삭제 (BlacklistedToken 은 CASCADE 로 함께 삭제)
+        deleted = 0
+        while True:
+            ids = list(targets.order_by("id").values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            with transaction.atomic():
+                OutstandingToken.objects.filter(id__in=ids).delete()
+            deleted += len(ids)
+            if options["pause"]:
+                time.sleep(options["pause"])
+        self.stdout.write(f"OutstandingToken 삭제: {deleted}건")
+
+        self.stdout.write(self.style.SUCCESS("토큰 블랙리스트 정리 완료"))
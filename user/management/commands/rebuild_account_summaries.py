@@ -0,0 +1,19 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from user.services.account_summary import rebuild_account_summaries
+
+
+class Command(BaseCommand):
+    help = (
+        "사용자 계정 요약(구독/결제/마케팅 동의/카드)을 원본 테이블 기준으로 다시 "
+        "계산합니다. (시그널을 거치지 않은 변경 후 정합성 복구용)"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = rebuild_account_summaries(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"계정 요약 재계산 완료: {count}명"))
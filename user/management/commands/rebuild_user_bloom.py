@@ -0,0 +1,19 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from user.services.user_bloom import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "가입된 이메일/전화번호 Bloom filter 를 DB 기준으로 새로 만들어 교체합니다. "
+        "(탈퇴/변경으로 남은 오탐 정리)"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Bloom filter 재생성 완료: 값 {count}개"))
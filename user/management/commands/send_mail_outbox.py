@@ -0,0 +1,56 @@
+import time
+
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from dbre_BE.mail_outbox import OutboxSender
+
+
+class Command(BaseCommand):
+    help = (
+        "메일 outbox 를 SMTP 연결 하나로 배치 발송합니다. "
+        "기본은 상주 실행, --once 는 현재 큐만 비우고 종료합니다."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.MAIL_OUTBOX_BATCH_SIZE
+        )
+        parser.add_argument(
+            "--idle-close",
+            type=float,
+            default=settings.MAIL_OUTBOX_IDLE_CLOSE,
+            help="이 시간(초) 동안 보낼 메일이 없으면 SMTP 연결 종료",
+        )
+        parser.add_argument("--once", action="store_true", help="큐를 비우고 종료")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        sender = OutboxSender(options["batch_size"], options["idle_close"])
+        started = time.monotonic()
+        try:
+            if options["once"]:
+                sender.drain()
+            else:
+                self._run_forever(sender)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            sender.close()
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                f"발송 {sender.sent}건, 실패 {sender.failed}건 (포기 {sender.dead}건), "
+                f"{elapsed:.1f}초, 평균 {sender.sent / elapsed if elapsed else 0:.1f}건/초"
+            )
+
+    def _run_forever(self, sender: OutboxSender) -> None:
+        sender.recover()
+        while True:
+            sender.promote_retries()
+            # 첫 메일은 BLMOVE 로 기다리고 나머지는 배치로 가져옴
+            messages = sender.next_batch(wait=settings.MAIL_OUTBOX_POLL_INTERVAL)
+            if messages:
+                sender.send_batch(messages)
+            else:
+                sender.close_if_idle()
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-19 08:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0012_customuser_is_deletion_confirmed"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="img_variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
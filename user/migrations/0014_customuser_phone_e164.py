@@ -0,0 +1,79 @@
+import logging
+
+from typing import Any, List, Tuple
+
+from django.db import migrations, models
+
+from user.phone import duplicate_phones, to_display, to_e164
+
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_phone_e164(apps: Any, schema_editor: Any) -> None:
+    """
+    기존 phone 으로 phone_e164 채우기 (phone 도 010-1234-5678 형식으로 통일)
+
+    표기만 다른 같은 번호가 여러 명이면 유일 인덱스를 만들 수 없으므로 목록과 함께
+    중단한다. 어느 계정의 번호를 남길지는 dedupe_phones 명령으로 확인 후 정리한다.
+    """
+    CustomUser = apps.get_model("user", "CustomUser")
+    queryset = (
+        CustomUser.objects.exclude(phone__isnull=True)
+        .exclude(phone="")
+        .order_by("created_at")
+        .values_list("id", "phone")
+    )
+    duplicates = duplicate_phones(queryset.iterator(chunk_size=2000))
+    if duplicates:
+        examples = ", ".join(
+            f"{phone_e164}: {[str(user_id) for user_id in ids]}"
+            for phone_e164, ids in list(duplicates.items())[:20]
+        )
+        raise RuntimeError(
+            f"표기만 다른 중복 전화번호 {len(duplicates)}건이 있어 phone_e164 를 "
+            f"만들 수 없습니다. `python manage.py dedupe_phones` 로 확인/정리 후 "
+            f"다시 migrate 하세요. ({examples})"
+        )
+
+    rows: List[Tuple[Any, str, str]] = []
+    for user_id, phone in queryset.iterator(chunk_size=2000):
+        phone_e164 = to_e164(phone)
+        if phone_e164 is None:
+            logger.warning(f"phone_e164 변환 불가 ({user_id}): {phone}")
+            continue
+        rows.append((user_id, phone_e164, to_display(phone)))
+
+    for start in range(0, len(rows), 2000):
+        CustomUser.objects.bulk_update(
+            [
+                CustomUser(id=user_id, phone=display, phone_e164=phone_e164)
+                for user_id, phone_e164, display in rows[start : start + 2000]
+            ],
+            ["phone", "phone_e164"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0013_customuser_img_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="phone_e164",
+            field=models.CharField(
+                blank=True, editable=False, max_length=16, null=True
+            ),
+        ),
+        migrations.RunPython(backfill_phone_e164, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="customuser",
+            name="phone_e164",
+            field=models.CharField(
+                blank=True, editable=False, max_length=16, null=True, unique=True
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.6 on 2026-10-19 08:56
+
+from django.db import migrations, models
+
+import dbre_BE.ids
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0014_customuser_phone_e164"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="customuser",
+            name="id",
+            field=models.UUIDField(
+                default=dbre_BE.ids.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.6 on 2026-10-19 08:58
+
+import django.db.models.deletion
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("plan", "0002_alter_plans_is_active"),
+        ("user", "0015_customuser_id_uuid7"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserAccountSummary",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="account_summary",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("start_date", models.DateTimeField(null=True)),
+                ("end_date", models.DateTimeField(null=True)),
+                ("next_bill_date", models.DateTimeField(null=True)),
+                ("remaining_bill_date", models.DurationField(null=True)),
+                ("latest_paid_at", models.DateTimeField(null=True)),
+                (
+                    "latest_paid_amount",
+                    models.DecimalField(decimal_places=2, max_digits=10, null=True),
+                ),
+                ("latest_pay_status", models.CharField(max_length=10, null=True)),
+                ("marketing_consent", models.BooleanField(default=False)),
+                ("card_name", models.CharField(max_length=20, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "plan",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="plan.plans",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "user_account_summaries",
+            },
+        ),
+    ]
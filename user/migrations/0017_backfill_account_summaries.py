@@ -0,0 +1,84 @@
+from typing import Any
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill(apps: Any, schema_editor: Any) -> None:
+    """기존 사용자 계정 요약 채우기 (user.services.account_summary 와 같은 기준)"""
+    CustomUser = apps.get_model("user", "CustomUser")
+    UserAccountSummary = apps.get_model("user", "UserAccountSummary")
+    Agreements = apps.get_model("user", "Agreements")
+    Subs = apps.get_model("subscription", "Subs")
+    Pays = apps.get_model("payment", "Pays")
+    BillingKey = apps.get_model("payment", "BillingKey")
+
+    latest_sub = Subs.objects.filter(user=OuterRef("pk")).order_by("-start_date", "-id")
+    latest_pay = Pays.objects.filter(user=OuterRef("pk")).order_by("-paid_at", "-id")
+    agreement = Agreements.objects.filter(user=OuterRef("pk")).order_by("-id")
+    billing_key = BillingKey.objects.filter(user=OuterRef("pk"))
+
+    rows = CustomUser.objects.annotate(
+        s_plan_id=Subquery(latest_sub.values("plan_id")[:1]),
+        s_start_date=Subquery(latest_sub.values("start_date")[:1]),
+        s_end_date=Subquery(latest_sub.values("end_date")[:1]),
+        s_next_bill_date=Subquery(latest_sub.values("next_bill_date")[:1]),
+        s_remaining_bill_date=Subquery(latest_sub.values("remaining_bill_date")[:1]),
+        s_paid_at=Subquery(latest_pay.values("paid_at")[:1]),
+        s_paid_amount=Subquery(latest_pay.values("amount")[:1]),
+        s_pay_status=Subquery(latest_pay.values("status")[:1]),
+        s_marketing=Subquery(agreement.values("marketing")[:1]),
+        s_card_name=Subquery(billing_key.values("card_name")[:1]),
+    ).values(
+        "pk",
+        "s_plan_id",
+        "s_start_date",
+        "s_end_date",
+        "s_next_bill_date",
+        "s_remaining_bill_date",
+        "s_paid_at",
+        "s_paid_amount",
+        "s_pay_status",
+        "s_marketing",
+        "s_card_name",
+    )
+
+    batch = []
+    for row in rows.iterator(chunk_size=2000):
+        batch.append(
+            UserAccountSummary(
+                user_id=row["pk"],
+                plan_id=row["s_plan_id"],
+                start_date=row["s_start_date"],
+                end_date=row["s_end_date"],
+                next_bill_date=row["s_next_bill_date"],
+                remaining_bill_date=row["s_remaining_bill_date"],
+                latest_paid_at=row["s_paid_at"],
+                latest_paid_amount=row["s_paid_amount"],
+                latest_pay_status=row["s_pay_status"],
+                marketing_consent=bool(row["s_marketing"]),
+                card_name=row["s_card_name"],
+            )
+        )
+        if len(batch) >= 2000:
+            UserAccountSummary.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        UserAccountSummary.objects.bulk_create(batch)
+
+
+def clear(apps: Any, schema_editor: Any) -> None:
+    apps.get_model("user", "UserAccountSummary").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0016_useraccountsummary"),
+        ("subscription", "0011_partition_subhistories"),
+        ("payment", "0010_pays_ledger_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, clear),
+    ]
@@ -1,5 +1,3 @@
-import uuid
-
 from typing import Any, Optional
 
 from django.contrib.auth.models import (
@@ -10,6 +8,9 @@ from django.contrib.auth.models import (
 from django.core.validators import RegexValidator
 from django.db import models
 
+from dbre_BE.ids import uuid7
+from user.phone import to_display, to_e164
+
 
 class CustomUserManager(BaseUserManager):
     def create_user(
@@ -30,6 +31,13 @@ class CustomUserManager(BaseUserManager):
         extra_fields.setdefault("is_superuser", True)
         return self.create_user(email, password, **extra_fields)
 
+    def by_phone(self, phone: Optional[str]) -> models.QuerySet:
+        """표기와 관계없이 phone_e164 인덱스 동등 조건 하나로 조회"""
+        phone_e164 = to_e164(phone)
+        if phone_e164 is None:
+            return self.none()
+        return self.filter(phone_e164=phone_e164)
+
 
 class CustomUser(AbstractBaseUser, PermissionsMixin):
     phone_regex = RegexValidator(
@@ -37,7 +45,8 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         message="전화번호는 '010-1234-5678' 형식으로 입력해주세요.",
     )
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # 시간 순서 키 (기존 uuid4 키와 공존)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(unique=True, db_index=True)
     name = models.CharField(max_length=50)
     phone = models.CharField(
@@ -47,8 +56,14 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         blank=True,
         null=True,
     )
+    # 조회/유일성 기준 (+821012345678), 저장 시 phone 에서 계산
+    phone_e164 = models.CharField(
+        max_length=16, unique=True, null=True, blank=True, editable=False
+    )
     provider = models.CharField(max_length=20, null=True, blank=True, default=None)
     img_url = models.URLField(null=True, blank=True, default=None)
+    # 리사이즈된 프로필 이미지 {"small": {"webp": url, "jpeg": url, ...}, ...}
+    img_variants = models.JSONField(default=dict, blank=True)
     sub_status = models.CharField(
         max_length=20,
         choices=[
@@ -75,6 +90,15 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     class Meta:
         db_table = "user_users"
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        self.phone_e164 = to_e164(self.phone)
+        if self.phone_e164:
+            self.phone = to_display(self.phone)  # type: ignore[arg-type]
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "phone" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "phone_e164"}
+        super().save(*args, **kwargs)
+
 
 class Agreements(models.Model):
     id = models.AutoField(primary_key=True)  # BigIntegerField에서 AutoField로 변경
@@ -95,3 +119,38 @@ class WithdrawalReason(models.Model):  # 회원 탈퇴 사유
 
     class Meta:
         db_table = "user_withdrawal_reasons"
+
+
+class UserAccountSummary(models.Model):
+    """
+    사용자별 구독/결제 요약 (읽기 모델)
+
+    관리자 고객 목록과 프로필 조회가 사용자 PK 조인 하나로 읽도록 Subs/Pays/
+    Agreements/BillingKey 변경 시 같은 트랜잭션에서 갱신한다.
+    (user.services.account_summary)
+    """
+
+    user = models.OneToOneField(
+        CustomUser,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="account_summary",
+    )
+    # 최근 구독 (start_date 기준)
+    plan = models.ForeignKey(
+        "plan.Plans", on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+    start_date = models.DateTimeField(null=True)
+    end_date = models.DateTimeField(null=True)
+    next_bill_date = models.DateTimeField(null=True)
+    remaining_bill_date = models.DurationField(null=True)
+    # 최근 결제 (paid_at 기준)
+    latest_paid_at = models.DateTimeField(null=True)
+    latest_paid_amount = models.DecimalField(decimal_places=2, max_digits=10, null=True)
+    latest_pay_status = models.CharField(max_length=10, null=True)
+    marketing_consent = models.BooleanField(default=False)
+    card_name = models.CharField(max_length=20, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "user_account_summaries"
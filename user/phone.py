@@ -0,0 +1,62 @@
+"""
+휴대폰 번호 정규화
+
+가입/수정/조회/발송/캐시 키 등 전화번호를 다루는 모든 경로는 이 모듈을 사용한다.
+
+- to_e164: 조회와 유일성 기준 (+821012345678), CustomUser.phone_e164 에 저장
+- to_display: 화면 표기 및 phone 컬럼 저장 형식 (010-1234-5678)
+
+입력은 하이픈/공백/국가 코드 유무와 관계없이 같은 번호면 같은 값으로 정규화된다.
+"""
+
+import re
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# 국가 코드/선행 0 을 정리한 국내 휴대폰 번호 (01X + 7~8자리)
+MOBILE_RE = re.compile(r"^01[016789]\d{7,8}$")
+
+
+class InvalidPhoneNumber(ValueError):
+    pass
+
+
+def _national(phone: Optional[str]) -> Optional[str]:
+    """국내 표기 숫자열 (01012345678), 휴대폰 번호가 아니면 None"""
+    digits = re.sub(r"\D", "", phone or "")
+    if digits.startswith("82"):
+        digits = digits[2:]
+    if digits and not digits.startswith("0"):
+        digits = "0" + digits
+    return digits if MOBILE_RE.match(digits) else None
+
+
+def to_e164(phone: Optional[str]) -> Optional[str]:
+    national = _national(phone)
+    return f"+82{national[1:]}" if national else None
+
+
+def to_display(phone: str) -> str:
+    national = _national(phone)
+    if national is None:
+        raise InvalidPhoneNumber("올바른 휴대폰 번호 형식이 아닙니다.")
+    return f"{national[:3]}-{national[3:-4]}-{national[-4:]}"
+
+
+def phone_key(phone: str) -> str:
+    """캐시/제한 키용: 휴대폰 번호면 E.164, 아니면 숫자만 (표기 차이로 우회 불가)"""
+    return to_e164(phone) or re.sub(r"\D", "", phone)
+
+
+def duplicate_phones(rows: Iterable[Tuple[Any, Optional[str]]]) -> Dict[str, List[Any]]:
+    """
+    (id, phone) 목록(가입순)에서 표기만 다르고 같은 번호인 그룹
+    {E.164: [가장 먼저 가입한 id, 나머지 id...]}
+    """
+    groups: Dict[str, List[Any]] = {}
+    for user_id, phone in rows:
+        phone_e164 = to_e164(phone)
+        if phone_e164:
+            groups.setdefault(phone_e164, []).append(user_id)
+    return {key: ids for key, ids in groups.items() if len(ids) > 1}
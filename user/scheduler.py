@@ -0,0 +1,45 @@
+import atexit
+
+from datetime import datetime
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from django.conf import settings
+
+from user.services.login_events import flush_login_events
+from user.services.user_bloom import rebuild_if_stale
+from user.services.user_purge import run_scheduled_purge
+
+
+def start() -> None:
+    """
+    APScheduler 실행
+    (로그인 이벤트 write-behind flush, 가입 정보 Bloom filter 재생성, 탈퇴 사용자 정리)
+    """
+    scheduler = BackgroundScheduler()
+    scheduler.add_job(
+        flush_login_events,
+        trigger=IntervalTrigger(seconds=settings.LOGIN_BUFFER_FLUSH_INTERVAL),
+        max_instances=1,
+        coalesce=True,
+    )
+    # 필터가 없으면 웹 서버 기동 직후 생성, 이후 재생성 주기마다 교체 (워커 간 잠금으로 1회만 실행)
+    # 스케줄러는 웹 서버 프로세스에서만 뜨므로 migrate 등 관리 명령에서는 실행되지 않음
+    scheduler.add_job(
+        rebuild_if_stale,
+        trigger=IntervalTrigger(hours=1),
+        next_run_time=datetime.now(),
+        max_instances=1,
+        coalesce=True,
+    )
+    # USER_PURGE_WINDOW 시간대에만 실제로 정리
+    scheduler.add_job(
+        run_scheduled_purge,
+        trigger=IntervalTrigger(minutes=30),
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.start()
+
+    # 워커 종료 시 남은 버퍼 반영
+    atexit.register(flush_login_events)
@@ -1,17 +1,16 @@
 from datetime import datetime
 from typing import Dict, Optional, Union
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.validators import RegexValidator
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
-from payment.models import BillingKey
-from plan.models import Plans
-from subscription.models import Subs
-
-from .models import CustomUser
+from .models import CustomUser, UserAccountSummary
+from .services.user_bloom import email_taken, phone_taken
+from .tokens import RefreshToken, issue_token_pair
 from .utils import normalize_phone_number
 
 
@@ -66,12 +65,12 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return data
 
     def validate_email(self, value: str) -> str:
-        if CustomUser.objects.filter(email=value).exists():
+        if email_taken(value):
             raise serializers.ValidationError("이미 가입된 이메일입니다.")
         return value
 
     def validate_phone(self, value: str) -> str:
-        if CustomUser.objects.filter(phone=value).exists():
+        if phone_taken(value):
             raise serializers.ValidationError("이미 가입된 전화번호입니다.")
         return value
 
@@ -81,6 +80,8 @@ class EmailCheckSerializer(serializers.Serializer):
 
 
 class LoginSerializer(TokenObtainPairSerializer):
+    token_class = RefreshToken  # type: ignore[assignment]
+
     email = serializers.EmailField(
         required=True, help_text="로그인에 사용할 이메일 (예: user@example.com)"
     )
@@ -123,12 +124,13 @@ class LoginSerializer(TokenObtainPairSerializer):
             raise serializers.ValidationError("입력된 정보로 가입된 이력이 없습니다.")
 
         # 검증이 성공하면 토큰 발급
-        data = super().validate(attrs)
+        # (super().validate() 는 authenticate() 로 사용자 조회와 비밀번호 해시를 한 번 더 수행)
+        access_token, refresh_token = issue_token_pair(self.user)
 
         return {
             "message": "로그인이 완료되었습니다.",
-            "access_token": data["access"],
-            "refresh_token": data["refresh"],
+            "access_token": access_token,
+            "refresh_token": refresh_token,
         }
 
 
@@ -167,7 +169,7 @@ class PhoneVerificationRequestSerializer(serializers.Serializer):
                 raise serializers.ValidationError("올바른 휴대폰 번호 형식이 아닙니다.")
 
             # 전화번호 중복 체크
-            if CustomUser.objects.filter(phone=normalized).exists():
+            if phone_taken(normalized):
                 raise serializers.ValidationError(
                     "동일한 휴대폰번호로 가입된 계정이 있습니다."
                 )
@@ -218,6 +220,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "name",
             "phone",
             "img_url",
+            "img_variants",
             "sub_status",
             "subscription_info",
         ]
@@ -225,46 +228,25 @@ class UserProfileSerializer(serializers.ModelSerializer):
     def get_subscription_info(
         self, obj: CustomUser
     ) -> Optional[Dict[str, Optional[Union[datetime, int, str]]]]:
-        if obj.sub_status in ["active", "paused"]:
-            try:
-                subscription = Subs.objects.filter(user=obj).first()
-                if subscription:
-                    # UTC to KST (+9 hours)
-                    end_date = subscription.end_date if subscription.end_date else None
-                    next_bill_date = (
-                        subscription.next_bill_date
-                        if subscription.next_bill_date
-                        else None
-                    )
-
-                    # card_name: Optional[str] = None
-                    # card_number: Optional[str] = None
-                    billingkey = BillingKey.objects.filter(user=obj).first()
-                    # if billingkey is not None:
-                    #     card_name = billingkey.card_name
-                    #     card_number = billingkey.card_number
-
-                    payment_amount: Optional[int] = None
-                    plan = Plans.objects.filter(id=subscription.plan_id).first()
-                    if plan is not None:
-                        payment_amount = plan.price
-
-                    return {
-                        "plan_id": subscription.plan_id,
-                        "end_date": end_date,
-                        "remaining_days": (
-                            subscription.remaining_bill_date.days
-                            if subscription.remaining_bill_date
-                            else None
-                        ),
-                        # "card_name": card_name,
-                        # "card_number": card_number,
-                        "next_bill_date": next_bill_date,
-                        "payment_amount": payment_amount,
-                    }
-            except Subs.DoesNotExist:
-                return None
-        return None
+        if obj.sub_status not in ["active", "paused"]:
+            return None
+        # 구독/플랜 정보는 계정 요약에서 조회 한 번으로 읽음
+        summary = (
+            UserAccountSummary.objects.select_related("plan").filter(user=obj).first()
+        )
+        if summary is None or summary.start_date is None:  # 구독 이력 없음
+            return None
+        return {
+            "plan_id": summary.plan_id,
+            "end_date": summary.end_date,
+            "remaining_days": (
+                summary.remaining_bill_date.days
+                if summary.remaining_bill_date
+                else None
+            ),
+            "next_bill_date": summary.next_bill_date,
+            "payment_amount": summary.plan.price if summary.plan else None,
+        }
 
 
 class RefreshTokenSerializer(serializers.Serializer):
@@ -361,7 +343,34 @@ class PasswordChangeResponseSerializer(serializers.Serializer):
 
 class UserUpdateSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=50, required=False, allow_null=True)
-    image = serializers.ImageField(required=False, allow_null=True)
+
+
+class ProfileImageUploadRequestSerializer(serializers.Serializer):
+    content_type = serializers.ChoiceField(
+        choices=settings.PROFILE_IMAGE_CONTENT_TYPES,
+        help_text="업로드할 이미지의 Content-Type (예: image/png)",
+    )
+
+
+class ProfileImageUploadResponseSerializer(serializers.Serializer):
+    upload_url = serializers.URLField(
+        help_text="이미지를 multipart/form-data POST 로 업로드할 URL"
+    )
+    key = serializers.CharField(help_text="업로드 완료 후 확인 요청에 전달할 키")
+    fields = serializers.DictField(
+        child=serializers.CharField(),
+        help_text="폼에 그대로 포함할 필드 (file 필드는 마지막에 추가)",
+    )
+    expires_in = serializers.IntegerField(help_text="URL 유효 시간 (초)")
+
+
+class ProfileImageConfirmSerializer(serializers.Serializer):
+    key = serializers.CharField(max_length=255)
+
+
+class ProfileImageConfirmResponseSerializer(serializers.Serializer):
+    message = serializers.CharField()
+    img_url = serializers.URLField()
 
 
 class UserUpdateResponseSerializer(serializers.Serializer):
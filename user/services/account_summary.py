@@ -0,0 +1,103 @@
+"""
+사용자 구독/결제 요약(UserAccountSummary) 갱신
+
+Subs/Pays/Agreements/BillingKey 저장·삭제 시그널에서 같은 트랜잭션 안에 해당 사용자
+요약을 다시 계산한다. 요약 값은 사용자 한 명당 쿼리 한 번(서브쿼리)으로 계산하며,
+전체 재계산(rebuild)도 같은 쿼리를 배치로 사용한다.
+"""
+
+import logging
+
+from typing import Any, Dict, List
+
+from django.db import transaction
+from django.db.models import OuterRef, QuerySet, Subquery
+
+from dbre_BE.conditional import bump_table
+from payment.models import BillingKey, Pays
+from subscription.models import Subs
+from user.models import Agreements, CustomUser, UserAccountSummary
+
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FIELDS = [
+    "plan_id",
+    "start_date",
+    "end_date",
+    "next_bill_date",
+    "remaining_bill_date",
+    "latest_paid_at",
+    "latest_paid_amount",
+    "latest_pay_status",
+    "marketing_consent",
+    "card_name",
+]
+
+
+def _summary_rows(users: QuerySet) -> QuerySet:
+    latest_sub = Subs.objects.filter(user=OuterRef("pk")).order_by("-start_date", "-id")
+    latest_pay = Pays.objects.filter(user=OuterRef("pk")).order_by("-paid_at", "-id")
+    agreement = Agreements.objects.filter(user=OuterRef("pk")).order_by("-id")
+    billing_key = BillingKey.objects.filter(user=OuterRef("pk"))
+
+    def latest(queryset: QuerySet, field: str) -> Subquery:
+        return Subquery(queryset.values(field)[:1])
+
+    rows: QuerySet = users.annotate(
+        summary_plan_id=latest(latest_sub, "plan_id"),
+        summary_start_date=latest(latest_sub, "start_date"),
+        summary_end_date=latest(latest_sub, "end_date"),
+        summary_next_bill_date=latest(latest_sub, "next_bill_date"),
+        summary_remaining_bill_date=latest(latest_sub, "remaining_bill_date"),
+        summary_latest_paid_at=latest(latest_pay, "paid_at"),
+        summary_latest_paid_amount=latest(latest_pay, "amount"),
+        summary_latest_pay_status=latest(latest_pay, "status"),
+        summary_marketing_consent=latest(agreement, "marketing"),
+        summary_card_name=latest(billing_key, "card_name"),
+    ).values("pk", *(f"summary_{field}" for field in SUMMARY_FIELDS))
+    return rows
+
+
+def _to_defaults(row: Dict[str, Any]) -> Dict[str, Any]:
+    defaults = {field: row[f"summary_{field}"] for field in SUMMARY_FIELDS}
+    defaults["marketing_consent"] = bool(defaults["marketing_consent"])
+    return defaults
+
+
+def refresh_account_summary(user_id: Any) -> None:
+    """사용자 한 명의 요약 재계산 (호출한 쪽 트랜잭션 안에서 실행)"""
+    row = next(iter(_summary_rows(CustomUser.objects.filter(pk=user_id))), None)
+    if row is None:
+        return
+    UserAccountSummary.objects.update_or_create(
+        user_id=user_id, defaults=_to_defaults(row)
+    )
+
+
+def rebuild_account_summaries(batch_size: int = 1000) -> int:
+    """전체 사용자 요약 재계산 (배포 직후 채우기 / 정합성 복구용), 처리 수 반환"""
+    users = CustomUser.objects.order_by("pk")
+    last_pk = None
+    count = 0
+    while True:
+        chunk = users.filter(pk__gt=last_pk) if last_pk else users
+        rows: List[Dict[str, Any]] = list(_summary_rows(chunk)[:batch_size])
+        if not rows:
+            break
+        last_pk = rows[-1]["pk"]
+        with transaction.atomic():
+            UserAccountSummary.objects.bulk_create(
+                [
+                    UserAccountSummary(user_id=row["pk"], **_to_defaults(row))
+                    for row in rows
+                ],
+                update_conflicts=True,
+                unique_fields=["user"],
+                update_fields=[*SUMMARY_FIELDS, "updated_at"],
+            )
+            # upsert 는 post_save 를 거치지 않으므로 조건부 GET 버전을 직접 갱신
+            bump_table(UserAccountSummary, user_ids=[row["pk"] for row in rows])
+        count += len(rows)
+    logger.info(f"계정 요약 재계산 완료: {count}명")
+    return count
@@ -0,0 +1,165 @@
+import json
+import logging
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from dbre_BE.conditional import bump_table
+
+
+logger = logging.getLogger(__name__)
+
+# user_id → 마지막 로그인 시각 (같은 사용자의 연속 로그인은 하나로 합쳐짐)
+LAST_LOGIN_BUFFER = "login_buffer:last_login"
+# 관리자 로그인 로그 (JSON, 발생 순서대로)
+ADMIN_LOG_BUFFER = "login_buffer:admin_logs"
+
+
+def _key(name: str) -> str:
+    return cache.make_key(name)
+
+
+def record_last_login(user_id: Any, logged_in_at: Optional[datetime] = None) -> None:
+    """마지막 로그인 시각을 Redis 해시에 기록 (로그인 요청에서는 이 쓰기 1회만 수행)"""
+    logged_in_at = logged_in_at or timezone.now()
+    try:
+        get_redis_connection("default").hset(
+            _key(LAST_LOGIN_BUFFER), str(user_id), logged_in_at.isoformat()
+        )
+    except RedisError as e:
+        logger.warning(f"last_login 버퍼 기록 실패, DB에 직접 저장: {e}")
+        _write_last_logins({str(user_id): logged_in_at})
+
+
+def record_admin_login(user: Any, ip_address: str, user_agent: Optional[str]) -> None:
+    """관리자 로그인 로그를 Redis 리스트에 적재"""
+    event = {
+        "user_id": str(user.id),
+        "email": user.email,
+        "user_name": user.name,
+        "ip_address": ip_address,
+        "user_agent": (user_agent or "")[:255],
+        "login_datetime": timezone.now().isoformat(),
+    }
+    try:
+        get_redis_connection("default").rpush(_key(ADMIN_LOG_BUFFER), json.dumps(event))
+    except RedisError as e:
+        logger.warning(f"관리자 로그인 로그 버퍼 기록 실패, DB에 직접 저장: {e}")
+        _write_admin_logs([event])
+
+
+def _write_last_logins(last_logins: Dict[str, datetime]) -> None:
+    from user.models import CustomUser
+
+    CustomUser.objects.bulk_update(
+        [
+            CustomUser(id=user_id, last_login=logged_in_at)
+            for user_id, logged_in_at in last_logins.items()
+        ],
+        ["last_login"],
+        batch_size=settings.LOGIN_BUFFER_BATCH_SIZE,
+    )
+    bump_table(CustomUser, user_ids=last_logins)
+
+
+def _write_admin_logs(events: List[Dict[str, Any]]) -> None:
+    from admin_api.models import AdminLoginLog
+    from user.models import CustomUser
+
+    # 버퍼에 머무는 동안 삭제된 사용자는 FK 없이 기록
+    user_ids = {
+        str(user_id)
+        for user_id in CustomUser.objects.filter(
+            id__in={event["user_id"] for event in events}
+        ).values_list("id", flat=True)
+    }
+    AdminLoginLog.objects.bulk_create(
+        [
+            AdminLoginLog(
+                user_id=event["user_id"] if event["user_id"] in user_ids else None,
+                email=event["email"],
+                user_name=event["user_name"],
+                ip_address=event["ip_address"],
+                user_agent=event["user_agent"],
+                login_datetime=datetime.fromisoformat(event["login_datetime"]),
+            )
+            for event in events
+        ],
+        batch_size=settings.LOGIN_BUFFER_BATCH_SIZE,
+    )
+    bump_table(AdminLoginLog)
+
+
+def flush_last_logins() -> int:
+    """버퍼의 last_login 을 한 번에 bulk_update"""
+    redis_client = get_redis_connection("default")
+    key = _key(LAST_LOGIN_BUFFER)
+
+    # HGETALL + DEL 을 원자적으로 수행하여 동시에 도는 flusher 간 중복 방지
+    pipe = redis_client.pipeline(transaction=True)
+    pipe.hgetall(key)
+    pipe.delete(key)
+    raw, _ = pipe.execute()
+    if not raw:
+        return 0
+
+    last_logins = {
+        user_id.decode(): datetime.fromisoformat(value.decode())
+        for user_id, value in raw.items()
+    }
+    try:
+        _write_last_logins(last_logins)
+    except Exception:
+        # 실패 시 버퍼로 되돌림 (그 사이 들어온 최신 값은 유지)
+        pipe = redis_client.pipeline()
+        for user_id, value in raw.items():
+            pipe.hsetnx(key, user_id, value)
+        pipe.execute()
+        raise
+    return len(last_logins)
+
+
+def flush_admin_logs() -> int:
+    """버퍼의 관리자 로그인 로그를 batch 단위로 bulk_create"""
+    redis_client = get_redis_connection("default")
+    key = _key(ADMIN_LOG_BUFFER)
+    batch_size = settings.LOGIN_BUFFER_BATCH_SIZE
+    flushed = 0
+
+    while True:
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.lrange(key, 0, batch_size - 1)
+        pipe.ltrim(key, batch_size, -1)
+        raw, _ = pipe.execute()
+        if not raw:
+            break
+
+        try:
+            _write_admin_logs([json.loads(item) for item in raw])
+        except Exception:
+            redis_client.lpush(key, *reversed(raw))
+            raise
+        flushed += len(raw)
+        if len(raw) < batch_size:
+            break
+    return flushed
+
+
+def flush_login_events() -> None:
+    """Redis 버퍼를 DB 로 반영 (스케줄러 주기 실행 및 종료 시 호출)"""
+    try:
+        users = flush_last_logins()
+        logs = flush_admin_logs()
+    except Exception as e:
+        logger.error(f"로그인 이벤트 flush 실패: {e}")
+        return
+    if users or logs:
+        logger.info(
+            f"로그인 이벤트 flush 완료 (last_login {users}건, 관리자 로그 {logs}건)"
+        )
@@ -0,0 +1,189 @@
+"""
+Redis 기반 휴대폰 인증번호(OTP)
+
+인증번호는 HMAC 해시로만 저장하고 TTL/시도 횟수를 함께 관리하므로 확인은
+원격 호출 없이 Redis 왕복 한 번으로 끝난다. 발송은 settings.OTP_SMS_TRANSPORT
+로 지정한 transport(Twilio 문자 / 로컬 로그)를 사용하며, 번호별 재발송 간격과
+시간당 발송 횟수 제한도 여기서 처리한다.
+
+    send_code(phone)            # OTPError(재발송 제한) / SMSSendError(발송 실패)
+    verify_code(phone, code)    # OTPError(만료/불일치/시도 초과)
+
+Redis 장애 시 RedisError 가 그대로 전달되며 뷰에서 503 으로 응답한다.
+"""
+
+import hashlib
+import hmac
+import logging
+import secrets
+
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+from django_redis import get_redis_connection
+from requests import RequestException
+from rest_framework import status
+from twilio.base.exceptions import TwilioRestException
+
+from user.phone import InvalidPhoneNumber, phone_key
+from user.utils import format_phone_for_twilio, get_twilio_client
+
+
+logger = logging.getLogger(__name__)
+
+CODE_KEY = "otp:code:{digest}"  # hash: code(HMAC), attempts
+COOLDOWN_KEY = "otp:cooldown:{digest}"
+SENDS_KEY = "otp:sends:{digest}"
+
+# 인증번호가 있을 때만 시도 횟수 증가 (없는 키에 HINCRBY 로 빈 해시를 만들지 않음)
+ATTEMPT_SCRIPT = """
+local stored = redis.call('HGET', KEYS[1], 'code')
+if not stored then
+    return false
+end
+return {stored, redis.call('HINCRBY', KEYS[1], 'attempts', 1)}
+"""
+
+
+class OTPError(Exception):
+    def __init__(
+        self,
+        message: str,
+        status_code: int = status.HTTP_400_BAD_REQUEST,
+        retry_after: Optional[int] = None,
+    ) -> None:
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class SMSSendError(Exception):
+    pass
+
+
+class BaseSMSTransport(ABC):
+    """settings.OTP_SMS_TRANSPORT 로 지정하는 문자 발송 방식"""
+
+    @abstractmethod
+    def send(self, phone: str, body: str) -> None:
+        """발송 실패 시 SMSSendError"""
+
+
+class TwilioSMSTransport(BaseSMSTransport):
+    """Twilio Messaging 으로 문자 발송 (Verify 서비스 대신 자체 발급 번호 사용)"""
+
+    def send(self, phone: str, body: str) -> None:
+        try:
+            get_twilio_client().messages.create(
+                body=body,
+                from_=settings.TWILIO_PHONE_NUMBER,
+                to=format_phone_for_twilio(phone),
+            )
+        except (TwilioRestException, RequestException, InvalidPhoneNumber) as e:
+            raise SMSSendError(str(e)) from e
+
+
+class ConsoleSMSTransport(BaseSMSTransport):
+    """로컬/개발용: 문자 대신 로그로 출력"""
+
+    def send(self, phone: str, body: str) -> None:
+        logger.info(f"[SMS] {phone}: {body}")
+
+
+@lru_cache(maxsize=None)
+def get_transport() -> BaseSMSTransport:
+    transport: BaseSMSTransport = import_string(settings.OTP_SMS_TRANSPORT)()
+    return transport
+
+
+def _digest(phone: str) -> str:
+    # 표기 차이(하이픈/국가 코드 등)와 관계없이 같은 번호는 같은 키를 사용
+    return hashlib.sha256(phone_key(phone).encode()).hexdigest()[:32]
+
+
+def _hash_code(digest: str, code: str) -> str:
+    return hmac.new(
+        str(settings.SECRET_KEY).encode(), f"{digest}:{code}".encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def _key(template: str, digest: str) -> str:
+    return cache.make_key(template.format(digest=digest))
+
+
+def send_code(phone: str) -> None:
+    """새 인증번호를 발급/저장하고 문자로 발송 (이전 인증번호는 무효화)"""
+    digest = _digest(phone)
+    redis_client = get_redis_connection("default")
+
+    cooldown_key = _key(COOLDOWN_KEY, digest)
+    if not redis_client.set(cooldown_key, 1, nx=True, ex=settings.OTP_RESEND_INTERVAL):
+        retry_after = max(int(redis_client.ttl(cooldown_key)), 1)
+        raise OTPError(
+            f"{retry_after}초 후에 다시 요청해주세요.",
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            retry_after=retry_after,
+        )
+
+    sends_key = _key(SENDS_KEY, digest)
+    pipe = redis_client.pipeline(transaction=True)
+    pipe.set(sends_key, 0, nx=True, ex=60 * 60)
+    pipe.incr(sends_key)
+    pipe.ttl(sends_key)
+    _, sends, ttl = pipe.execute()
+    if sends > settings.OTP_MAX_SENDS_PER_HOUR:
+        raise OTPError(
+            "인증번호 요청 횟수를 초과했습니다. 잠시 후 다시 시도해주세요.",
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            retry_after=max(int(ttl), 1),
+        )
+
+    code = "".join(secrets.choice("0123456789") for _ in range(settings.OTP_LENGTH))
+    code_key = _key(CODE_KEY, digest)
+    pipe = redis_client.pipeline(transaction=True)
+    pipe.delete(code_key)
+    pipe.hset(code_key, mapping={"code": _hash_code(digest, code), "attempts": 0})
+    pipe.expire(code_key, settings.OTP_TTL)
+    pipe.execute()
+
+    try:
+        get_transport().send(phone, f"[dbre] 인증번호: {code}")
+    except SMSSendError:
+        # 발송되지 않은 인증번호는 폐기하고 바로 다시 요청할 수 있게 함
+        redis_client.delete(code_key, cooldown_key)
+        redis_client.decr(sends_key)
+        raise
+
+
+def verified_key(phone: str) -> str:
+    """인증 완료 표시 캐시 키 (가입/전화번호 저장 시 확인)"""
+    return f"phone_verified:{phone_key(phone)}"
+
+
+def verify_code(phone: str, code: str) -> None:
+    """인증번호 확인, 성공 시 인증번호 삭제 (1회용)"""
+    digest = _digest(phone)
+    code_key = _key(CODE_KEY, digest)
+    redis_client = get_redis_connection("default")
+
+    # 시도 횟수를 먼저 올려 동시 요청으로 제한을 넘지 못하게 함
+    result = redis_client.eval(ATTEMPT_SCRIPT, 1, code_key)
+    if result is None:
+        raise OTPError("인증번호가 만료되었습니다. 다시 요청해주세요.")
+    stored, attempts = result
+
+    if attempts > settings.OTP_MAX_ATTEMPTS:
+        redis_client.delete(code_key)
+        raise OTPError("인증 시도 횟수를 초과했습니다. 인증번호를 다시 요청해주세요.")
+
+    if not hmac.compare_digest(stored.decode(), _hash_code(digest, code)):
+        raise OTPError("잘못된 인증번호입니다.")
+
+    if not redis_client.delete(code_key):
+        # 같은 인증번호로 동시에 확인한 다른 요청이 먼저 사용함
+        raise OTPError("인증번호가 만료되었습니다. 다시 요청해주세요.")
@@ -0,0 +1,259 @@
+"""
+프로필 이미지 직접 업로드 (presigned POST) 및 리사이즈
+
+브라우저가 발급받은 POST 정책으로 NCP Object Storage 에 바로 업로드한다. 정책에
+크기 범위(content-length-range)/Content-Type/비공개 ACL 이 포함되어 있어 제한을
+넘는 업로드는 스토리지가 거부하고, 업로드된 객체는 확인 요청에서 메타데이터(HEAD)를
+검증한 뒤에만 공개로 바꾸고 img_url 을 기록한다. 이미지 바이트는 웹 워커를
+거치지 않으며, 리사이즈 이미지 생성과 이전 이미지 삭제는 백그라운드 프로세스
+풀에서 처리한다.
+"""
+
+import io
+import logging
+import mimetypes
+import posixpath
+import time
+import uuid
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import boto3
+
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.db import transaction
+from PIL import Image, ImageOps
+from rest_framework import serializers
+
+from dbre_BE.background import submit
+from user.models import CustomUser
+
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "profile-images"
+# 리사이즈 이미지는 키(파일명)가 매번 새로 생성되므로 영구 캐시 가능
+VARIANT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@lru_cache(maxsize=None)
+def get_s3_client() -> Any:
+    """프로세스 공용 S3 클라이언트 (boto3 클라이언트는 스레드 간 공유 가능)"""
+    return boto3.client(
+        "s3",
+        aws_access_key_id=settings.NCP_ACCESS_KEY,
+        aws_secret_access_key=settings.NCP_SECRET_KEY,
+        endpoint_url=settings.NCP_ENDPOINT_URL,
+        config=Config(
+            signature_version="s3v4",
+            connect_timeout=3,
+            read_timeout=10,
+            retries={"max_attempts": 3, "mode": "standard"},
+        ),
+    )
+
+
+def _user_prefix(user: CustomUser) -> str:
+    return f"{KEY_PREFIX}/{user.id}/"
+
+
+def key_from_url(img_url: Optional[str]) -> Optional[str]:
+    """버킷 이미지 URL → 객체 키 (외부 URL 이면 None)"""
+    if not img_url or not img_url.startswith(f"{settings.NCP_BUCKET_URL}/"):
+        return None
+    return img_url[len(settings.NCP_BUCKET_URL) + 1 :]
+
+
+def create_upload(user: CustomUser, content_type: str) -> Dict[str, Any]:
+    """업로드용 presigned POST 정책 발급 (크기/Content-Type/비공개 ACL 고정)"""
+    extension = (mimetypes.guess_extension(content_type) or ".img").lstrip(".")
+    key = f"{_user_prefix(user)}{uuid.uuid4()}.{extension}"
+    post = get_s3_client().generate_presigned_post(
+        Bucket=settings.NCP_BUCKET_NAME,
+        Key=key,
+        Fields={"Content-Type": content_type, "acl": "private"},
+        Conditions=[
+            {"Content-Type": content_type},
+            {"acl": "private"},
+            ["content-length-range", 1, settings.PROFILE_IMAGE_MAX_SIZE],
+        ],
+        ExpiresIn=settings.PROFILE_IMAGE_UPLOAD_EXPIRES,
+    )
+    return {
+        "upload_url": post["url"],
+        "key": key,
+        "fields": post["fields"],
+        "expires_in": settings.PROFILE_IMAGE_UPLOAD_EXPIRES,
+    }
+
+
+def confirm_upload(user: CustomUser, key: str) -> str:
+    """업로드된 객체를 확인하고 img_url 로 기록, 새 URL 반환"""
+    if not key.startswith(_user_prefix(user)) or ".." in key:
+        raise serializers.ValidationError("잘못된 이미지 키입니다.")
+
+    s3_client = get_s3_client()
+    try:
+        head = s3_client.head_object(Bucket=settings.NCP_BUCKET_NAME, Key=key)
+    except ClientError as e:
+        logger.warning(f"NCP head error ({key}): {str(e)}")
+        raise serializers.ValidationError("업로드된 이미지를 찾을 수 없습니다.")
+
+    # 정책으로 이미 제한되지만 공개 전 한 번 더 확인
+    if (
+        head.get("ContentLength", 0) > settings.PROFILE_IMAGE_MAX_SIZE
+        or head.get("ContentType") not in settings.PROFILE_IMAGE_CONTENT_TYPES
+    ):
+        schedule_delete(key)
+        raise serializers.ValidationError("허용되지 않는 이미지입니다.")
+
+    try:
+        s3_client.put_object_acl(
+            Bucket=settings.NCP_BUCKET_NAME, Key=key, ACL="public-read"
+        )
+    except ClientError as e:
+        logger.error(f"NCP acl error ({key}): {str(e)}")
+        raise serializers.ValidationError("이미지를 등록하지 못했습니다.")
+
+    # 이전 원본과 리사이즈 이미지는 커밋 후 함께 삭제
+    old_keys = [
+        old
+        for old in [key_from_url(user.img_url), *variant_keys(user.img_variants)]
+        if old and old != key
+    ]
+    user.img_url = f"{settings.NCP_BUCKET_URL}/{key}"
+    user.img_variants = {}
+    user.save(update_fields=["img_url", "img_variants"])
+
+    user_id = str(user.id)
+    transaction.on_commit(lambda: submit(process_profile_image, user_id, key))
+    if old_keys:
+        transaction.on_commit(lambda: schedule_delete(*old_keys))
+    return user.img_url
+
+
+def variant_keys(variants: Optional[Dict[str, Any]]) -> List[str]:
+    keys = []
+    for variant in (variants or {}).values():
+        for fmt in ("webp", "jpeg"):
+            key = key_from_url(variant.get(fmt))
+            if key:
+                keys.append(key)
+    return keys
+
+
+def _encode(image: Image.Image, fmt: str) -> bytes:
+    """EXIF/ICC 등 메타데이터 없이 인코딩 (save 에 exif 를 넘기지 않음)"""
+    buffer = io.BytesIO()
+    if fmt == "webp":
+        image.save(
+            buffer, "WEBP", quality=settings.PROFILE_IMAGE_WEBP_QUALITY, method=4
+        )
+    else:
+        image.convert("RGB").save(
+            buffer,
+            "JPEG",
+            quality=settings.PROFILE_IMAGE_JPEG_QUALITY,
+            optimize=True,
+            progressive=True,
+        )
+    return buffer.getvalue()
+
+
+def build_variants(data: bytes) -> Dict[str, Dict[str, Any]]:
+    """
+    원본을 한 번 디코딩해 큰 크기부터 차례로 축소하며 {이름: {포맷: bytes}} 생성
+    (작은 크기는 앞 단계 결과에서 축소하므로 원본 전체를 반복 리샘플링하지 않음)
+    """
+    sizes = sorted(settings.PROFILE_IMAGE_VARIANTS.items(), key=lambda x: -x[1])
+    with Image.open(io.BytesIO(data)) as source:
+        # JPEG 는 디코딩 단계에서 필요한 크기에 가깝게 축소 (DCT scaling)
+        source.draft("RGB", (sizes[0][1], sizes[0][1]))
+        # 회전 정보만 반영하고 EXIF 는 버림
+        image = ImageOps.exif_transpose(source) or source
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    variants: Dict[str, Dict[str, Any]] = {}
+    for name, size in sizes:
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+        variants[name] = {
+            "width": image.width,
+            "height": image.height,
+            "webp": _encode(image, "webp"),
+            "jpeg": _encode(image, "jpeg"),
+        }
+    return variants
+
+
+def process_profile_image(user_id: str, key: str) -> None:
+    """백그라운드 프로세스에서 실행: 리사이즈 이미지를 원본 옆에 저장하고 URL 기록"""
+    started = time.monotonic()
+    s3_client = get_s3_client()
+    try:
+        data = s3_client.get_object(Bucket=settings.NCP_BUCKET_NAME, Key=key)[
+            "Body"
+        ].read()
+        variants = build_variants(data)
+    except Exception as e:
+        # 손상/지원하지 않는 이미지는 원본만 사용
+        logger.error(f"프로필 이미지 리사이즈 실패 ({key}): {e}")
+        return
+
+    base, _ = posixpath.splitext(key)
+    uploaded: List[str] = []
+    recorded: Dict[str, Dict[str, Any]] = {}
+    for name, variant in variants.items():
+        recorded[name] = {"width": variant["width"], "height": variant["height"]}
+        for fmt, extension in (("webp", "webp"), ("jpeg", "jpg")):
+            variant_key = f"{base}_{name}.{extension}"
+            s3_client.put_object(
+                Bucket=settings.NCP_BUCKET_NAME,
+                Key=variant_key,
+                Body=variant[fmt],
+                ContentType=f"image/{fmt}",
+                CacheControl=VARIANT_CACHE_CONTROL,
+                ACL="public-read",
+            )
+            uploaded.append(variant_key)
+            recorded[name][fmt] = f"{settings.NCP_BUCKET_URL}/{variant_key}"
+
+    with transaction.atomic():
+        user = (
+            CustomUser.objects.select_for_update()
+            .filter(id=user_id, img_url=f"{settings.NCP_BUCKET_URL}/{key}")
+            .first()
+        )
+        if user is None:
+            # 처리 중 다른 이미지로 바뀌었거나 탈퇴한 경우 생성한 이미지 폐기
+            transaction.on_commit(lambda: delete_objects(*uploaded))
+            return
+        user.img_variants = recorded
+        user.save(update_fields=["img_variants"])
+
+    original_size = len(data)
+    small_size = len(variants["small"]["webp"]) if "small" in variants else 0
+    logger.info(
+        f"프로필 이미지 리사이즈 완료 ({key}): 원본 {original_size}B, "
+        f"small.webp {small_size}B, {time.monotonic() - started:.2f}초"
+    )
+
+
+def delete_objects(*keys: str) -> None:
+    """백그라운드 프로세스에서 실행 (모듈 최상위 함수)"""
+    if not keys:
+        return
+    try:
+        get_s3_client().delete_objects(
+            Bucket=settings.NCP_BUCKET_NAME,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+    except ClientError as e:
+        logger.error(f"NCP delete error: {str(e)}")
+
+
+def schedule_delete(*keys: str) -> None:
+    submit(delete_objects, *keys)
@@ -0,0 +1,191 @@
+"""
+가입된 이메일/전화번호 Bloom filter (Redis 비트맵)
+
+회원가입 폼의 중복 확인은 대부분 "사용 가능" 응답이므로, 필터에 없다고 확실한
+값은 DB 조회 없이 바로 응답하고 있을 수도 있는 값만 인덱스 조회로 확인한다.
+필터는 사용자 저장 시 값을 추가하고(삭제/변경 전 값은 오탐으로만 남음)
+rebuild_user_bloom 명령 또는 스케줄러가 주기적으로 새로 만든다.
+
+필터가 준비되지 않았거나 Redis 장애 시에는 항상 DB 로 확인한다 (미탐 없음).
+"""
+
+import hashlib
+import logging
+import time
+
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import LockError, RedisError
+
+from user.models import CustomUser
+from user.phone import phone_key
+
+
+logger = logging.getLogger(__name__)
+
+# 값 정규화 방식이 바뀌면 버전을 올려 이전 필터를 쓰지 않게 함 (재생성 전까지 DB 조회)
+FILTER_KEY = "user_bloom:v2"
+BUILDING_KEY = "user_bloom:v2:building"
+BUILT_AT_KEY = "user_bloom:v2:built_at"
+LOCK_KEY = "user_bloom:lock"
+
+# 재생성 중에 가입한 사용자가 새 필터에서 빠지지 않도록 두 필터에 함께 기록
+ADD_SCRIPT = """
+for i = 1, #ARGV do
+    redis.call('SETBIT', KEYS[1], ARGV[i], 1)
+end
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    for i = 1, #ARGV do
+        redis.call('SETBIT', KEYS[2], ARGV[i], 1)
+    end
+end
+return 1
+"""
+
+
+def _key(name: str) -> str:
+    return cache.make_key(name)
+
+
+def normalize_email(email: str) -> str:
+    # 대소문자를 합쳐도 오탐만 늘 뿐 미탐은 생기지 않음
+    return email.strip().lower()
+
+
+def normalize_phone(phone: str) -> str:
+    return phone_key(phone)
+
+
+def _offsets(kind: str, value: str) -> List[int]:
+    """double hashing 으로 k 개의 비트 위치 계산"""
+    digest = hashlib.sha256(f"{kind}:{value}".encode()).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:16], "big") | 1
+    size = settings.USER_BLOOM_BITS
+    return [(h1 + i * h2) % size for i in range(settings.USER_BLOOM_HASHES)]
+
+
+def _user_offsets(email: Optional[str], phone: Optional[str]) -> List[int]:
+    offsets = []
+    if email:
+        offsets += _offsets("email", normalize_email(email))
+    if phone:
+        offsets += _offsets("phone", normalize_phone(phone))
+    return offsets
+
+
+def add_user(email: Optional[str], phone: Optional[str]) -> None:
+    offsets = _user_offsets(email, phone)
+    if not offsets:
+        return
+    try:
+        get_redis_connection("default").eval(
+            ADD_SCRIPT, 2, _key(FILTER_KEY), _key(BUILDING_KEY), *offsets
+        )
+    except RedisError as e:
+        # 필터에 빠진 값은 미탐이 되므로 준비 표시를 지워 재생성 전까지 DB 로 확인
+        logger.error(f"가입 정보 Bloom filter 갱신 실패: {e}")
+        _invalidate()
+
+
+def _invalidate() -> None:
+    try:
+        get_redis_connection("default").delete(_key(BUILT_AT_KEY))
+    except RedisError:
+        pass
+
+
+def might_contain(kind: str, value: str) -> bool:
+    """False 면 확실히 없음, True 면 있을 수 있음 (필터 미준비/장애 포함)"""
+    value = normalize_email(value) if kind == "email" else normalize_phone(value)
+    try:
+        pipe = get_redis_connection("default").pipeline(transaction=False)
+        pipe.exists(_key(BUILT_AT_KEY))
+        for offset in _offsets(kind, value):
+            pipe.getbit(_key(FILTER_KEY), offset)
+        ready, *bits = pipe.execute()
+    except RedisError as e:
+        logger.warning(f"가입 정보 Bloom filter 조회 실패, DB 조회로 대체: {e}")
+        return True
+    return not ready or all(bits)
+
+
+def email_taken(email: str) -> bool:
+    if not might_contain("email", email):
+        return False
+    return CustomUser.objects.filter(email=email).exists()
+
+
+def phone_taken(phone: str) -> bool:
+    if not might_contain("phone", phone):
+        return False
+    return CustomUser.objects.by_phone(phone).exists()
+
+
+def _iter_user_values(batch_size: int) -> Iterable[List[int]]:
+    queryset = CustomUser.objects.order_by("pk").values_list("pk", "email", "phone")
+    last_pk = None
+    while True:
+        chunk = queryset.filter(pk__gt=last_pk) if last_pk else queryset
+        rows = list(chunk[:batch_size])
+        if not rows:
+            return
+        last_pk = rows[-1][0]
+        yield [
+            offset for _, email, phone in rows for offset in _user_offsets(email, phone)
+        ]
+
+
+def rebuild(batch_size: int = 5000) -> int:
+    """필터를 새로 만들어 교체, 반영한 사용자 수 반환 (동시 실행 방지)"""
+    redis_client = get_redis_connection("default")
+    lock = redis_client.lock(_key(LOCK_KEY), timeout=600, blocking_timeout=0)
+    if not lock.acquire():
+        logger.info("가입 정보 Bloom filter 재생성이 이미 진행 중입니다.")
+        return 0
+
+    building = _key(BUILDING_KEY)
+    started = time.monotonic()
+    count = 0
+    try:
+        redis_client.delete(building)
+        # 빈 비트맵을 미리 만들어 두어 재생성 중 가입도 함께 기록되게 함
+        redis_client.setbit(building, settings.USER_BLOOM_BITS - 1, 0)
+        for offsets in _iter_user_values(batch_size):
+            pipe = redis_client.pipeline(transaction=False)
+            for offset in offsets:
+                pipe.setbit(building, offset, 1)
+            pipe.execute()
+            count += len(offsets) // settings.USER_BLOOM_HASHES
+
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.rename(building, _key(FILTER_KEY))
+        pipe.set(_key(BUILT_AT_KEY), int(time.time()))
+        pipe.execute()
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            pass
+
+    logger.info(
+        f"가입 정보 Bloom filter 재생성 완료: 값 {count}개, "
+        f"{time.monotonic() - started:.1f}초"
+    )
+    return count
+
+
+def rebuild_if_stale() -> None:
+    """스케줄러용: 필터가 없거나 재생성 주기가 지난 경우에만 재생성"""
+    try:
+        built_at = get_redis_connection("default").get(_key(BUILT_AT_KEY))
+        if (
+            built_at is None
+            or time.time() - int(built_at) > settings.USER_BLOOM_REBUILD_INTERVAL
+        ):
+            rebuild()
+    except RedisError as e:
+        logger.error(f"가입 정보 Bloom filter 재생성 실패: {e}")
@@ -0,0 +1,182 @@
+"""
+탈퇴 확정 사용자 정리
+
+관리자가 탈퇴를 확정(is_deletion_confirmed)하고 보관 기간이 지난 사용자를 작은
+배치로 나누어 삭제한다. 배치마다 짧은 트랜잭션 하나에서 관련 테이블을 집합 단위
+UPDATE/DELETE 로 처리하므로 잠금 시간이 배치 크기로 제한되고, 중간에 멈춰도
+처리된 배치는 이미 커밋되어 있어 다시 실행하면 남은 사용자부터 이어서 처리된다.
+
+- 결제/구독 이력, 탈퇴 사유, 관리자 로그인 로그: 사용자 연결만 끊고 보관 (익명화)
+- 그 외 사용자 소유 데이터(리뷰, 작업 요청, 구독, 빌링키, 약관 동의, 토큰 등): 삭제
+"""
+
+import datetime
+import logging
+import time
+
+from typing import Any, Callable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connection, models, transaction
+from django.utils.timezone import now
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from admin_api.models import AdminLoginLog
+from dbre_BE.conditional import bump_table
+from payment.models import BillingKey, Pays
+from reviews.models import Review
+from subscription.models import SubHistories, Subs, SubsCohortActivity, SubsCohortMember
+from tally.models import Tally
+from user.models import Agreements, CustomUser, WithdrawalReason
+from user.services.profile_images import delete_objects, key_from_url, variant_keys
+
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY = "user_purge:lock"
+
+# 사용자 연결만 끊고 보관: (모델, 필드)
+DETACH = [
+    (Pays, "user"),
+    (SubHistories, "user"),
+    (AdminLoginLog, "user"),
+    (WithdrawalReason, "user"),
+]
+# 삭제 순서 (FK 를 참조하는 쪽 먼저): (모델, 사용자 조건 lookup)
+DELETE = [
+    (Review, "user_id__in"),
+    (Tally, "user_id__in"),
+    (BlacklistedToken, "token__user_id__in"),
+    (OutstandingToken, "user_id__in"),
+    (SubsCohortActivity, "user_id__in"),
+    (SubsCohortMember, "user_id__in"),
+    (Subs, "user_id__in"),
+    (BillingKey, "user_id__in"),
+    (Agreements, "user_id__in"),
+]
+
+
+def purge_candidates(cutoff: datetime.datetime) -> models.QuerySet:
+    return CustomUser.objects.filter(
+        is_deletion_confirmed=True, deleted_at__lt=cutoff, is_staff=False
+    )
+
+
+def _purge_batch(user_ids: List[Any]) -> List[str]:
+    """배치 하나를 한 트랜잭션에서 정리하고 삭제할 이미지 키 반환"""
+    image_keys: List[str] = []
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            # 사용자 트래픽이 잡은 행 잠금을 오래 기다리지 않고 다음 실행으로 미룸
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET LOCAL lock_timeout = %s",
+                    [f"{settings.USER_PURGE_LOCK_TIMEOUT}ms"],
+                )
+
+        for img_url, img_variants in CustomUser.objects.filter(
+            pk__in=user_ids
+        ).values_list("img_url", "img_variants"):
+            image_keys += [
+                key
+                for key in [key_from_url(img_url), *variant_keys(img_variants)]
+                if key
+            ]
+
+        # 보관 대상 이력이 삭제될 구독을 가리키지 않도록 먼저 연결 해제
+        Pays.objects.filter(subs__user_id__in=user_ids).update(subs=None)
+        SubHistories.objects.filter(sub__user_id__in=user_ids).update(sub=None)
+        for model, field in DETACH:
+            model._default_manager.filter(**{f"{field}_id__in": user_ids}).update(
+                **{field: None}
+            )
+
+        for model, lookup in DELETE:
+            # Collector 는 행마다 시그널/연쇄 조회를 하므로 단일 DELETE 문으로 삭제
+            queryset = model._default_manager.filter(**{lookup: user_ids})
+            queryset._raw_delete(queryset.db)
+
+        # 남은 관계(allauth, 권한 M2M 등)는 Collector 로 처리 (대량 테이블은 이미 비어 있음)
+        CustomUser.objects.filter(pk__in=user_ids).delete()
+
+    for model, _ in [*DETACH, *DELETE]:
+        bump_table(model, user_ids=user_ids)
+    return image_keys
+
+
+def purge_deleted_users(
+    retention_days: int,
+    batch_size: int = 100,
+    pause: float = 0.5,
+    should_stop: Optional[Callable[[], bool]] = None,
+    dry_run: bool = False,
+) -> int:
+    """보관 기간이 지난 탈퇴 확정 사용자 정리, 처리한 사용자 수 반환"""
+    cutoff = now() - datetime.timedelta(days=retention_days)
+    candidates = purge_candidates(cutoff)
+    if dry_run:
+        return candidates.count()
+
+    purged = 0
+    while not (should_stop and should_stop()):
+        user_ids = list(
+            candidates.order_by("pk").values_list("pk", flat=True)[:batch_size]
+        )
+        if not user_ids:
+            break
+        started = time.monotonic()
+        try:
+            image_keys = _purge_batch(user_ids)
+        except DatabaseError as e:
+            # 잠금 대기 초과 등: 이미 처리한 배치는 커밋되었으므로 다음 실행에서 이어서 처리
+            logger.warning(f"탈퇴 사용자 정리 중단 ({purged}명 처리 후): {e}")
+            break
+
+        if image_keys:
+            delete_objects(*image_keys)
+        purged += len(user_ids)
+        logger.info(
+            f"탈퇴 사용자 {len(user_ids)}명 정리 ({time.monotonic() - started:.2f}초, "
+            f"누적 {purged}명)"
+        )
+        if pause:
+            time.sleep(pause)
+    return purged
+
+
+def _in_purge_window() -> bool:
+    start, end = settings.USER_PURGE_WINDOW
+    return start <= datetime.datetime.now().hour < end
+
+
+def run_scheduled_purge() -> None:
+    """스케줄러용: 한산한 시간대에만 실행하고 시간대를 벗어나면 중단 (워커 간 잠금)"""
+    if not _in_purge_window():
+        return
+    try:
+        lock = get_redis_connection("default").lock(
+            cache.make_key(LOCK_KEY), timeout=60 * 60, blocking_timeout=0
+        )
+        if not lock.acquire():
+            return
+    except RedisError as e:
+        logger.error(f"탈퇴 사용자 정리 잠금 실패: {e}")
+        return
+    try:
+        purge_deleted_users(
+            settings.USER_PURGE_RETENTION_DAYS,
+            batch_size=settings.USER_PURGE_BATCH_SIZE,
+            pause=settings.USER_PURGE_PAUSE,
+            should_stop=lambda: not _in_purge_window(),
+        )
+    finally:
+        try:
+            lock.release()
+        except RedisError:
+            pass
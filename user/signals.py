@@ -3,16 +3,62 @@ from typing import Any
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth.signals import user_logged_in
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from django.utils import timezone
+
+from payment.models import BillingKey, Pays
+from subscription.models import Subs
+from user.authentication import invalidate_users
+from user.models import Agreements
+from user.services.account_summary import refresh_account_summary
+from user.services.login_events import record_last_login
+from user.services.user_bloom import add_user
 
 
 UserModel = get_user_model()
 
+# django.contrib.auth 가 등록한 동기 UPDATE 수신기 대신 버퍼 기록 사용
+user_logged_in.disconnect(dispatch_uid="update_last_login")
+
 
 @receiver(user_logged_in)
 def update_last_login(
     sender: type[AbstractUser], user: AbstractUser, request: Any, **kwargs: Any
 ) -> None:
-    user.last_login = timezone.now()
-    user.save(update_fields=["last_login"])
+    record_last_login(user.pk)
+
+
+@receiver(post_save, sender=UserModel)
+@receiver(post_delete, sender=UserModel)
+def invalidate_auth_cache(
+    sender: type[AbstractUser], instance: Any, **kwargs: Any
+) -> None:
+    """프로필/상태/비밀번호 변경 및 삭제 시 인증 캐시 무효화"""
+    invalidate_users([instance.pk])
+
+
+@receiver(post_save, sender=UserModel)
+def add_to_user_bloom(sender: type[AbstractUser], instance: Any, **kwargs: Any) -> None:
+    """가입/변경된 이메일·전화번호를 중복 확인 Bloom filter 에 추가"""
+    email, phone = instance.email, instance.phone
+    add_user(email, phone)
+    # 필터 재생성이 커밋 전 행을 놓치지 않도록 커밋 후 한 번 더 기록
+    transaction.on_commit(lambda: add_user(email, phone))
+
+
+@receiver([post_save, post_delete], sender=Subs)
+@receiver([post_save, post_delete], sender=Pays)
+@receiver([post_save, post_delete], sender=Agreements)
+@receiver([post_save, post_delete], sender=BillingKey)
+def update_account_summary(sender: type[Any], instance: Any, **kwargs: Any) -> None:
+    """구독/결제/약관 동의/빌링키 변경 시 같은 트랜잭션에서 계정 요약 갱신"""
+    origin = kwargs.get("origin")
+    if isinstance(origin, UserModel) or (
+        isinstance(origin, QuerySet) and origin.model is UserModel
+    ):
+        # 사용자 삭제에 따른 연쇄 삭제 (요약도 함께 삭제되므로 다시 만들지 않음)
+        return
+    if instance.user_id:
+        refresh_account_summary(instance.user_id)
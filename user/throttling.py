@@ -0,0 +1,158 @@
+"""
+Redis sliding-window 요청 제한
+
+인증/OTP/비밀번호 재설정처럼 요청마다 외부 발송(Twilio, SMTP)이나 비밀번호
+해시가 일어나는 뷰에 선언적으로 적용한다. DRF 스로틀은 핸들러 실행 전에
+평가되므로 제한된 요청은 DB 조회/해시/발송 없이 429 + Retry-After 로 거절된다.
+
+    class RequestVerificationView(APIView):
+        throttle_scope = "otp"
+        throttle_field = "phone"
+        throttle_classes = SLIDING_WINDOW_THROTTLES
+
+settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"] 의 "{scope}_ip",
+"{scope}_identity", "{scope}_global" 항목이 있는 것만 적용된다.
+"""
+
+import hashlib
+import logging
+import re
+import time
+import uuid
+
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+from rest_framework.views import APIView
+
+from user.phone import phone_key
+
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"s": 1, "m": 60, "h": 60 * 60, "d": 60 * 60 * 24}
+RATE_PATTERN = re.compile(r"^(\d+)/(\d*)([smhd])")
+THROTTLED_ATTR = "_sliding_window_throttled"
+
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """'5/min', '3/10m', '100/h' → (요청 수, 구간 초)"""
+    match = RATE_PATTERN.match(rate)
+    if not match:
+        raise ValueError(f"잘못된 요청 제한 형식입니다: {rate}")
+    count, multiplier, unit = match.groups()
+    return int(count), int(multiplier or 1) * PERIODS[unit]
+
+
+class SlidingWindowThrottle(BaseThrottle, ABC):
+    """sorted set 에 요청 시각을 기록하는 sliding-window 제한 (키 종류는 하위 클래스)"""
+
+    kind = ""
+
+    def __init__(self) -> None:
+        self.retry_after: Optional[float] = None
+
+    @abstractmethod
+    def get_identity(self, request: Request, view: APIView) -> Optional[str]:
+        """제한 키로 쓸 값 (None 이면 제한하지 않음)"""
+
+    def allow_request(self, request: Request, view: APIView) -> bool:
+        if getattr(request, THROTTLED_ATTR, False):
+            return True
+        scope = getattr(view, "throttle_scope", None)
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(f"{scope}_{self.kind}")
+        if not scope or not rate:
+            return True
+        identity = self.get_identity(request, view)
+        if identity is None:
+            return True
+
+        limit, window = parse_rate(rate)
+        digest = hashlib.sha256(identity.encode()).hexdigest()[:32]
+        key = cache.make_key(f"throttle:{scope}:{self.kind}:{digest}")
+        try:
+            allowed = self._hit(key, limit, window)
+        except RedisError as e:
+            # 제한 저장소 장애로 서비스 전체를 막지 않음
+            logger.warning(f"요청 제한 확인 실패 ({scope}_{self.kind}): {e}")
+            return True
+        if not allowed:
+            setattr(request, THROTTLED_ATTR, True)
+        return allowed
+
+    def _hit(self, key: str, limit: int, window: int) -> bool:
+        redis_client = get_redis_connection("default")
+        now = time.time()
+        member = f"{now}:{uuid.uuid4().hex}"
+
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.zremrangebyscore(key, 0, now - window)
+        pipe.zadd(key, {member: now})
+        pipe.zcard(key)
+        pipe.expire(key, window)
+        _, _, count, _ = pipe.execute()
+        if count <= limit:
+            return True
+
+        # 거절된 요청은 구간에 포함하지 않음 (재시도 폭주 시에도 창이 밀리지 않게)
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.zrem(key, member)
+        pipe.zrange(key, 0, 0, withscores=True)
+        _, oldest = pipe.execute()
+        self.retry_after = max(oldest[0][1] + window - now, 1) if oldest else window
+        return False
+
+    def wait(self) -> Optional[float]:
+        return self.retry_after
+
+
+class IPSlidingWindowThrottle(SlidingWindowThrottle):
+    kind = "ip"
+
+    def get_identity(self, request: Request, view: APIView) -> Optional[str]:
+        ident: str = self.get_ident(request)
+        return ident
+
+
+class IdentitySlidingWindowThrottle(SlidingWindowThrottle):
+    """요청 본문의 view.throttle_field (email/phone) 값 기준"""
+
+    kind = "identity"
+
+    def get_identity(self, request: Request, view: APIView) -> Optional[str]:
+        field = getattr(view, "throttle_field", None)
+        if not field:
+            return None
+        try:
+            value = request.data.get(field)
+        except AttributeError:
+            return None
+        if not isinstance(value, str) or not value.strip():
+            return None
+        if field == "phone":
+            # 하이픈/공백/국가 코드 등 표기 차이로 제한을 우회하지 못하도록 정규화
+            return phone_key(value)
+        return value.strip().lower()
+
+
+class GlobalSlidingWindowThrottle(SlidingWindowThrottle):
+    """scope 전체 (유료 외부 발송 총량 상한)"""
+
+    kind = "global"
+
+    def get_identity(self, request: Request, view: APIView) -> Optional[str]:
+        return "all"
+
+
+# 순서대로 평가: 앞에서 거절되면 뒤 카운터는 올리지 않음 (한 IP 가 전체 한도를 소진하지 못하게)
+SLIDING_WINDOW_THROTTLES: List[type[BaseThrottle]] = [
+    IPSlidingWindowThrottle,
+    IdentitySlidingWindowThrottle,
+    GlobalSlidingWindowThrottle,
+]
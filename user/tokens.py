@@ -0,0 +1,201 @@
+"""
+Redis 기반 리프레시 토큰 블랙리스트
+
+simplejwt 의 token_blacklist 앱은 발급/블랙리스트마다 OutstandingToken,
+BlacklistedToken 행을 쌓고 정리하지 않는다. 여기서는 jti 를 키로 토큰의
+남은 수명만큼 TTL 을 주어 Redis 에 저장하므로 항목이 스스로 만료된다.
+"""
+
+import logging
+import time
+
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from django_redis import get_redis_connection
+from redis.exceptions import LockError, RedisError
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenBackendError, TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+
+logger = logging.getLogger(__name__)
+
+BLACKLIST_KEY = "token_blacklist:{jti}"
+# 회전 결과 (grace window 동안 같은 리프레시 토큰의 중복 요청에 그대로 반환)
+ROTATION_RESULT_KEY = "token_refresh:result:{jti}"
+ROTATION_LOCK_KEY = "token_refresh:lock:{jti}"
+# 새 jti → 회전 전 jti (로그아웃 시 이전 토큰의 회전 결과도 삭제하기 위함)
+ROTATION_PREVIOUS_KEY = "token_refresh:previous:{jti}"
+
+
+class TokenRefreshInProgress(Exception):
+    """같은 리프레시 토큰의 회전이 대기 시간 안에 끝나지 않음 (잠시 후 재시도)"""
+
+    retry_after = 1
+
+
+def blacklist_jti(jti: str, exp: int) -> bool:
+    """jti 를 만료 시각까지 블랙리스트에 등록 (이미 만료된 토큰은 무시)"""
+    ttl = int(exp) - int(time.time())
+    if ttl <= 0:
+        return False
+    cache.set(BLACKLIST_KEY.format(jti=jti), 1, timeout=ttl)
+    return True
+
+
+def blacklist_many(entries: Dict[str, int]) -> int:
+    """{jti: exp} 일괄 등록 (기존 테이블 이전용), 등록 건수 반환"""
+    now = int(time.time())
+    registered = 0
+    # TTL 이 토큰마다 다르므로 만료 시각이 같은 것끼리 묶어 set_many
+    by_ttl: Dict[int, Dict[str, int]] = {}
+    for jti, exp in entries.items():
+        ttl = int(exp) - now
+        if ttl > 0:
+            by_ttl.setdefault(ttl, {})[BLACKLIST_KEY.format(jti=jti)] = 1
+    for ttl, values in by_ttl.items():
+        cache.set_many(values, timeout=ttl)
+        registered += len(values)
+    return registered
+
+
+def is_blacklisted(jti: str) -> bool:
+    return bool(cache.get(BLACKLIST_KEY.format(jti=jti)))
+
+
+class RefreshToken(tokens.Token):
+    """
+    simplejwt RefreshToken 과 동일하지만 블랙리스트를 Redis 에서 확인/등록하고
+    발급 시 OutstandingToken 을 만들지 않는다
+    """
+
+    token_type = "refresh"
+    lifetime = api_settings.REFRESH_TOKEN_LIFETIME
+    no_copy_claims = tokens.RefreshToken.no_copy_claims
+    access_token_class = tokens.AccessToken
+
+    @property
+    def access_token(self) -> tokens.AccessToken:
+        """리프레시 토큰의 claim 을 복사한 액세스 토큰 (만료 기준 시각도 동일)"""
+        access = self.access_token_class()
+        access.set_exp(from_time=self.current_time)
+        for claim, value in self.payload.items():
+            if claim not in self.no_copy_claims:
+                access[claim] = value
+        return access
+
+    @classmethod
+    def for_rotation(cls, raw_token: str) -> "RefreshToken":
+        """서명/만료/타입만 검증 (블랙리스트는 single-flight 잠금 안에서 확인)"""
+        token = cls(raw_token, verify=False)  # type: ignore[arg-type]
+        try:
+            token.payload = token.get_token_backend().decode(
+                raw_token, verify=True  # type: ignore[arg-type]
+            )
+        except TokenBackendError:
+            raise TokenError(_("Token is invalid or expired"))
+        tokens.Token.verify(token)
+        return token
+
+    def verify(self, *args: Any, **kwargs: Any) -> None:
+        self.check_blacklist()
+        super().verify(*args, **kwargs)
+
+    def check_blacklist(self) -> None:
+        jti = self.payload[api_settings.JTI_CLAIM]
+        try:
+            blacklisted = is_blacklisted(jti)
+        except RedisError as e:
+            # 블랙리스트를 확인할 수 없으면 로그아웃된 토큰일 수 있으므로 거부
+            logger.error(f"토큰 블랙리스트 조회 실패: {e}")
+            raise TokenError(_("Token is blacklisted"))
+        if blacklisted:
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> bool:
+        return blacklist_jti(self.payload[api_settings.JTI_CLAIM], self.payload["exp"])
+
+    def rotate(self) -> None:
+        """ROTATE_REFRESH_TOKENS 설정에 따라 이 토큰을 새 jti/만료 시각으로 교체"""
+        if not api_settings.ROTATE_REFRESH_TOKENS:
+            return
+        if api_settings.BLACKLIST_AFTER_ROTATION:
+            self.blacklist()
+        self.set_jti()
+        self.set_exp()
+        self.set_iat()
+
+
+def forget_rotation(jti: str) -> None:
+    """
+    로그아웃 시 grace window 에 남은 회전 결과 삭제
+    (회전 전 리프레시 토큰의 중복 요청으로 로그아웃된 토큰 쌍을 다시 받지 못하게 함)
+    """
+    previous = cache.get(ROTATION_PREVIOUS_KEY.format(jti=jti))
+    keys = [ROTATION_RESULT_KEY.format(jti=jti), ROTATION_PREVIOUS_KEY.format(jti=jti)]
+    if previous:
+        keys.append(ROTATION_RESULT_KEY.format(jti=previous))
+    cache.delete_many(keys)
+
+
+def issue_token_pair(user: Any) -> Tuple[str, str]:
+    """검증이 끝난 사용자에게 (access, refresh) 발급 (authenticate() 재실행 없음)"""
+    refresh = RefreshToken.for_user(user)
+    return str(refresh.access_token), str(refresh)
+
+
+def refresh_single_flight(raw_token: str) -> Tuple[str, str]:
+    """
+    리프레시 토큰 jti 단위 single-flight 회전, (access, refresh) 반환
+    여러 탭이 동시에 갱신해도 한 요청만 회전하고 나머지는 잠금을 기다렸다가
+    같은 새 토큰 쌍을 받는다. 회전 직후 grace window 동안의 중복 요청도
+    서명/블랙리스트 기록 없이 캐시된 쌍을 받는다.
+    """
+    token = RefreshToken.for_rotation(raw_token)
+    jti = token[api_settings.JTI_CLAIM]
+    result_key = ROTATION_RESULT_KEY.format(jti=jti)
+
+    cached: Optional[Tuple[str, str]] = cache.get(result_key)
+    if cached is not None:
+        return cached
+
+    lock = get_redis_connection("default").lock(
+        cache.make_key(ROTATION_LOCK_KEY.format(jti=jti)),
+        timeout=settings.TOKEN_REFRESH_LOCK_TIMEOUT,
+        blocking_timeout=settings.TOKEN_REFRESH_WAIT_SECONDS,
+    )
+    if not lock.acquire():
+        # 대기 시간 안에 회전이 끝나지 않은 경우 결과가 있으면 사용
+        cached = cache.get(result_key)
+        if cached is not None:
+            return cached
+        # 유효한 토큰의 동시 요청이므로 로그아웃(401) 대신 재시도하도록 함
+        raise TokenRefreshInProgress()
+
+    try:
+        # 잠금을 기다리는 동안 다른 요청이 회전을 끝냈을 수 있음
+        cached = cache.get(result_key)
+        if cached is not None:
+            return cached
+
+        token.check_blacklist()
+        access_token = str(token.access_token)
+        token.rotate()
+        pair = (access_token, str(token))
+        cache.set_many(
+            {
+                result_key: pair,
+                ROTATION_PREVIOUS_KEY.format(jti=token[api_settings.JTI_CLAIM]): jti,
+            },
+            timeout=settings.TOKEN_REFRESH_GRACE_SECONDS,
+        )
+        return pair
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            # 잠금 만료 후 해제 시도 (다른 요청이 이미 획득했을 수 있음)
+            logger.warning(f"리프레시 토큰 잠금 해제 실패 (jti={jti})")
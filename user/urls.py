@@ -3,6 +3,8 @@ from django.urls import path
 from user.views.authenticated_views import (
     LogoutView,
     PasswordChangeView,
+    ProfileImageConfirmView,
+    ProfileImageUploadView,
     SavePhoneNumberView,
     UserView,
 )
@@ -32,6 +34,16 @@ user_patterns = [
     path("verify-phone/", VerifyPhoneView.as_view(), name="verify_phone"),
     path("g-phone/", SavePhoneNumberView.as_view(), name="g-phone"),
     path("", UserView.as_view(), name="user-profile"),
+    path(
+        "profile-image/upload-url/",
+        ProfileImageUploadView.as_view(),
+        name="profile-image-upload-url",
+    ),
+    path(
+        "profile-image/confirm/",
+        ProfileImageConfirmView.as_view(),
+        name="profile-image-confirm",
+    ),
     path("refresh_token/", TokenRefreshView.as_view(), name="refresh-token"),
     path("find-email/", UserPhoneCheckView.as_view(), name="find-email"),
     path("password/reset/", PasswordResetView.as_view(), name="password_reset"),
@@ -1,11 +1,13 @@
 import time
 
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Dict, Optional, TypeVar, cast
 
-import requests
-
 from django.conf import settings
+from twilio.rest import Client
+
+from dbre_BE.http_client import InstrumentedTwilioHttpClient, request
+from user.phone import InvalidPhoneNumber, to_display, to_e164
 
 
 def get_google_access_token(code: str, redirect_uri: str) -> Optional[str]:
@@ -17,42 +19,38 @@ def get_google_access_token(code: str, redirect_uri: str) -> Optional[str]:
         "redirect_uri": redirect_uri,
         "grant_type": "authorization_code",
     }
-    response = requests.post(token_url, data=data)
+    response = request("google", "POST", token_url, data=data)
     return cast(Optional[str], response.json().get("access_token"))
 
 
 def get_google_user_info(access_token: str) -> Dict[str, Any]:
     user_info_url = "https://www.googleapis.com/oauth2/v2/userinfo"
     headers = {"Authorization": f"Bearer {access_token}"}
-    response = requests.get(user_info_url, headers=headers)
+    response = request("google", "GET", user_info_url, headers=headers)
     return cast(Dict[str, Any], response.json())
 
 
-def normalize_phone_number(phone: str) -> str:
-    """전화번호를 010-xxxx-xxxx 형식으로 정규화"""
-    # 숫자만 추출
-    cleaned = "".join(char for char in phone if char.isdigit())
+@lru_cache(maxsize=None)
+def get_twilio_client() -> Client:
+    """프로세스 공용 Twilio 클라이언트 (요청마다 생성하지 않고 연결 풀 재사용)"""
+    return Client(
+        settings.TWILIO_ACCOUNT_SID,
+        settings.TWILIO_AUTH_TOKEN,
+        http_client=InstrumentedTwilioHttpClient(),
+    )
 
-    # 국가 코드(82) 제거
-    if cleaned.startswith("82"):
-        cleaned = cleaned[2:]
 
-    # 앞의 0이 없는 경우 추가
-    if not cleaned.startswith("0"):
-        cleaned = "0" + cleaned
-
-    # xxx-xxxx-xxxx 형식으로 변환
-    return f"{cleaned[:3]}-{cleaned[3:7]}-{cleaned[7:]}"
+def normalize_phone_number(phone: str) -> str:
+    """전화번호를 010-xxxx-xxxx 형식으로 정규화 (InvalidPhoneNumber)"""
+    return to_display(phone)
 
 
-# 디버깅을 위해 로그 추가
 def format_phone_for_twilio(phone: str) -> str:
-    print(f"Original phone: {phone}")  # 입력된 원본 번호
-    formatted = phone.replace("-", "")
-    cleaned = "".join(char for char in formatted if char.isdigit())
-    result = f"+82{cleaned[1:]}" if cleaned.startswith("0") else f"+82{cleaned}"
-    print(f"Formatted phone: {result}")  # 변환된 번호
-    return result
+    """Twilio 발송용 E.164 형식 (+821012345678)"""
+    phone_e164 = to_e164(phone)
+    if phone_e164 is None:
+        raise InvalidPhoneNumber("올바른 휴대폰 번호 형식이 아닙니다.")
+    return phone_e164
 
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -1,12 +1,8 @@
 import logging
 import uuid
 
-import boto3
-
-from botocore.exceptions import ClientError
 from django.conf import settings
 from django.core.cache import cache
-from django.core.files.uploadedfile import UploadedFile
 from django.utils import timezone
 from drf_spectacular.utils import OpenApiResponse, extend_schema
 from rest_framework import serializers, status
@@ -17,20 +13,29 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.settings import api_settings
 
+from dbre_BE.conditional import conditional_get
+from user.authentication import bump_user_version
 from user.models import Agreements, CustomUser, WithdrawalReason
 from user.serializers import (
     LogoutSerializer,
     PasswordChangeResponseSerializer,
     PasswordChangeSerializer,
     PhoneNumberSerializer,
+    ProfileImageConfirmResponseSerializer,
+    ProfileImageConfirmSerializer,
+    ProfileImageUploadRequestSerializer,
+    ProfileImageUploadResponseSerializer,
     TokenResponseSerializer,
     UserProfileSerializer,
     UserUpdateResponseSerializer,
     UserUpdateSerializer,
     WithdrawalReasonSerializer,
 )
+from user.services.otp import verified_key
+from user.services.profile_images import confirm_upload, create_upload
+from user.tokens import RefreshToken, forget_rotation
 from user.utils import normalize_phone_number
 
 
@@ -48,10 +53,14 @@ class LogoutView(GenericAPIView):
             serializer.is_valid(raise_exception=True)
 
             refresh_token = serializer.validated_data["refresh_token"]
-            RefreshToken(refresh_token).blacklist()
+            token = RefreshToken(refresh_token)
+            token.blacklist()
+            forget_rotation(token[api_settings.JTI_CLAIM])
 
             # Redis에서 토큰 삭제
             cache.delete(f"user_token:{request.user.id}")
+            # 인증 캐시 무효화
+            bump_user_version(request.user.pk)
 
             response = Response(
                 {"message": "로그아웃이 완료되었습니다."}, status=status.HTTP_200_OK
@@ -94,7 +103,7 @@ class SavePhoneNumberView(APIView):
             )
 
             # 전화번호 중복 검사
-            if CustomUser.objects.filter(phone=phone).exists():
+            if CustomUser.objects.by_phone(phone).exists():
                 # 현재 사용자의 계정 삭제
                 request.user.delete()
 
@@ -110,7 +119,7 @@ class SavePhoneNumberView(APIView):
                 )
 
             # 인증된 전화번호인지 확인
-            if not cache.get(f"phone_verified:{phone}"):
+            if not cache.get(verified_key(phone)):
                 return Response(
                     {"error": "인증되지 않은 전화번호입니다."},
                     status=status.HTTP_400_BAD_REQUEST,
@@ -134,6 +143,65 @@ class SavePhoneNumberView(APIView):
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
+class ProfileImageUploadView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        tags=["user"],
+        summary="프로필 이미지 업로드 URL 발급",
+        description="버킷에 직접 업로드할 수 있는 presigned POST 정책을 발급합니다. "
+        "응답의 fields 와 file 을 multipart/form-data 로 upload_url 에 POST 한 뒤 "
+        "key 로 확인 요청을 보냅니다. 확인 전까지 이미지는 비공개입니다.",
+        request=ProfileImageUploadRequestSerializer,
+        responses={
+            200: ProfileImageUploadResponseSerializer,
+            400: OpenApiResponse(description="허용되지 않는 이미지 형식"),
+            401: OpenApiResponse(description="인증 실패"),
+        },
+    )
+    def post(self, request: Request) -> Response:
+        serializer = ProfileImageUploadRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        upload = create_upload(request.user, serializer.validated_data["content_type"])
+        return Response(upload, status=status.HTTP_200_OK)
+
+
+class ProfileImageConfirmView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        tags=["user"],
+        summary="프로필 이미지 업로드 확인",
+        description="직접 업로드한 이미지를 확인하고 프로필 이미지로 등록합니다. "
+        "이전 이미지는 백그라운드에서 삭제됩니다.",
+        request=ProfileImageConfirmSerializer,
+        responses={
+            200: ProfileImageConfirmResponseSerializer,
+            400: OpenApiResponse(description="잘못된 키 또는 업로드되지 않은 이미지"),
+            401: OpenApiResponse(description="인증 실패"),
+        },
+    )
+    def post(self, request: Request) -> Response:
+        serializer = ProfileImageConfirmSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            img_url = confirm_upload(request.user, serializer.validated_data["key"])
+        except serializers.ValidationError as e:
+            return Response(
+                {"message": e.detail[0] if isinstance(e.detail, list) else e.detail},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {"message": "프로필 이미지가 변경되었습니다.", "img_url": img_url},
+            status=status.HTTP_200_OK,
+        )
+
+
 class UserView(APIView):
     permission_classes = [IsAuthenticated]
     parser_classes = (MultiPartParser, FormParser, JSONParser)
@@ -149,64 +217,16 @@ class UserView(APIView):
             401: OpenApiResponse(description="인증되지 않은 사용자"),
         },
     )
+    @conditional_get(per_user=True)
     def get(self, request: Request) -> Response:
         user = request.user
         serializer = UserProfileSerializer(user)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
-    def _is_ncp_image(self, img_url: str | None) -> bool:
-        """이미지 URL이 NCP 버킷의 이미지인지 확인"""
-        if not img_url:
-            return False
-        return settings.NCP_BUCKET_URL in img_url
-
-    def _upload_to_ncp(self, image_file: UploadedFile, key_prefix: str) -> str:
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=settings.NCP_ACCESS_KEY,
-            aws_secret_access_key=settings.NCP_SECRET_KEY,
-            endpoint_url=settings.NCP_ENDPOINT_URL,
-        )
-
-        if not image_file.name:
-            raise serializers.ValidationError("파일 이름이 없습니다.")
-
-        file_extension = image_file.name.split(".")[-1]
-        key = f"{key_prefix}/{uuid.uuid4()}.{file_extension}"
-
-        try:
-            s3_client.upload_fileobj(
-                image_file,
-                settings.NCP_BUCKET_NAME,
-                key,
-                ExtraArgs={"ACL": "public-read"},
-            )
-            return f"{settings.NCP_BUCKET_URL}/{key}"
-        except ClientError as e:
-            logger.error(f"NCP upload error: {str(e)}")
-            raise serializers.ValidationError("이미지 업로드에 실패했습니다.")
-
-    def _delete_from_ncp(self, img_url: str | None) -> None:
-        if not img_url:
-            return
-
-        try:
-            s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=settings.NCP_ACCESS_KEY,
-                aws_secret_access_key=settings.NCP_SECRET_KEY,
-                endpoint_url=settings.NCP_ENDPOINT_URL,
-            )
-
-            key = img_url.replace(f"{settings.NCP_BUCKET_URL}/", "")
-            s3_client.delete_object(Bucket=settings.NCP_BUCKET_NAME, Key=key)
-        except ClientError as e:
-            logger.error(f"NCP delete error: {str(e)}")
-
     @extend_schema(
         tags=["user"],
         summary="사용자 정보 수정",
-        description="사용자의 이름과 프로필 이미지를 수정합니다.",
+        description="사용자의 이름을 수정합니다. 프로필 이미지는 업로드 URL 발급/확인 API를 사용합니다.",
         request=UserUpdateSerializer,
         responses={
             200: UserUpdateResponseSerializer,
@@ -219,26 +239,21 @@ class UserView(APIView):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+        if "image" in request.FILES:
+            # 이미지는 업로드 URL 발급 → 버킷 직접 업로드 → 확인 요청으로 변경
+            return Response(
+                {
+                    "message": "프로필 이미지는 업로드 URL을 발급받아 직접 업로드해주세요."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         user = request.user
-        old_img_url = user.img_url
 
         try:
             if "name" in serializer.validated_data:
                 user.name = serializer.validated_data["name"]
 
-            if "image" in serializer.validated_data:
-                if serializer.validated_data["image"] is not None:
-                    # 새 이미지가 제공된 경우에만 업로드 및 업데이트
-                    new_img_url = self._upload_to_ncp(
-                        serializer.validated_data["image"], "profile-images"
-                    )
-                    user.img_url = new_img_url
-
-                    # 기존 이미지가 있다면 삭제
-                    if old_img_url and self._is_ncp_image(old_img_url):
-                        self._delete_from_ncp(old_img_url)
-                # image가 None인 경우 아무 작업도 하지 않음 (기존 이미지 유지)
-
             user.save()
 
             return Response(
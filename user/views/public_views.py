@@ -7,11 +7,9 @@ from urllib.parse import urlencode
 from django.conf import settings
 from django.contrib.auth import user_logged_in
 from django.core.cache import cache
-from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.crypto import get_random_string
-from django_redis import get_redis_connection
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     OpenApiExample,
@@ -21,6 +19,7 @@ from drf_spectacular.utils import (
     extend_schema_view,
     inline_serializer,
 )
+from redis.exceptions import RedisError
 from rest_framework import serializers, status
 from rest_framework.generics import CreateAPIView, GenericAPIView
 from rest_framework.renderers import JSONRenderer
@@ -28,11 +27,9 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
-from twilio.base.exceptions import TwilioRestException
-from twilio.rest import Client
 
+from dbre_BE.mail_outbox import enqueue_email
 from term.models import Terms
 from user.models import Agreements, CustomUser
 from user.serializers import (
@@ -51,12 +48,17 @@ from user.serializers import (
     TokenResponseSerializer,
     UserRegistrationSerializer,
 )
-from user.utils import (
-    format_phone_for_twilio,
-    get_google_access_token,
-    get_google_user_info,
-    measure_time,
+from user.services.otp import (
+    OTPError,
+    SMSSendError,
+    send_code,
+    verified_key,
+    verify_code,
 )
+from user.services.user_bloom import email_taken, might_contain
+from user.throttling import SLIDING_WINDOW_THROTTLES
+from user.tokens import RefreshToken, TokenRefreshInProgress, refresh_single_flight
+from user.utils import get_google_access_token, get_google_user_info, measure_time
 
 
 logger = logging.getLogger(__name__)
@@ -81,9 +83,7 @@ class UserRegistrationView(CreateAPIView):
         serializer.is_valid(raise_exception=True)
 
         # Cache에서 전화번호 인증 여부 확인
-        phone_verified = cache.get(
-            f'phone_verified:{serializer.validated_data["phone"]}'
-        )
+        phone_verified = cache.get(verified_key(serializer.validated_data["phone"]))
 
         if not phone_verified:
             return Response(
@@ -141,6 +141,9 @@ class UserRegistrationView(CreateAPIView):
     )
 )
 class EmailCheckView(GenericAPIView):
+    throttle_scope = "email_check"
+    throttle_field = "email"
+    throttle_classes = SLIDING_WINDOW_THROTTLES
     serializer_class = EmailCheckSerializer
 
     def post(self, request: EmailCheckSerializer) -> Response:
@@ -148,9 +151,9 @@ class EmailCheckView(GenericAPIView):
         serializer.is_valid(raise_exception=True)
 
         email = serializer.validated_data["email"]
-        exists = CustomUser.objects.filter(email=email).exists()
 
-        if exists:
+        # Bloom filter 에 없으면 DB 조회 없이 가입 가능으로 응답
+        if email_taken(email):
             return Response(
                 {"available": False, "message": "이미 가입된 이메일입니다."},
                 status=status.HTTP_200_OK,
@@ -163,6 +166,9 @@ class EmailCheckView(GenericAPIView):
 
 
 class LoginView(TokenObtainPairView):
+    throttle_scope = "login"
+    throttle_field = "email"
+    throttle_classes = SLIDING_WINDOW_THROTTLES
     serializer_class = LoginSerializer  # type: ignore
 
     @extend_schema(
@@ -414,6 +420,9 @@ class GoogleCallbackView(GenericAPIView):
 
 
 class RequestVerificationView(APIView):
+    throttle_scope = "otp"
+    throttle_field = "phone"
+    throttle_classes = SLIDING_WINDOW_THROTTLES
     serializer_class = PhoneVerificationRequestSerializer
 
     @extend_schema(
@@ -463,29 +472,34 @@ class RequestVerificationView(APIView):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         phone = serializer.validated_data["phone"]
-        formatted_phone = format_phone_for_twilio(phone)
 
         try:
-            client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
-            client.verify.v2.services(
-                settings.TWILIO_VERIFY_SERVICE_SID
-            ).verifications.create(
-                to=formatted_phone, channel="sms", locale="ko"  # 한국어 메시지 설정
+            send_code(phone)
+        except OTPError as e:
+            response = Response({"error": e.message}, status=e.status_code)
+            if e.retry_after:
+                response["Retry-After"] = str(e.retry_after)
+            return response
+        except SMSSendError as e:
+            logger.warning(f"인증번호 문자 발송 실패: {e}")
+            return Response(
+                {"error": "인증번호 발송에 실패했습니다. 잠시 후 다시 시도해주세요."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
-
-            return Response({"message": "인증번호가 발송되었습니다."})
-        except TwilioRestException as e:
-            print(f"Twilio Error: {str(e)}")
-            error_message = "인증번호 발송에 실패했습니다. 잠시 후 다시 시도해주세요."
-            if "60238" in str(e):  # Verify 서비스 블록 에러
-                error_message = "Verify 서비스 블록 에러입니다. 관리자에게 문의해주세요"
-
+        except RedisError as e:
+            logger.error(f"인증번호 저장소 오류: {e}")
             return Response(
-                {"error": error_message}, status=status.HTTP_400_BAD_REQUEST
+                {"error": "인증번호 발송에 실패했습니다. 잠시 후 다시 시도해주세요."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
 
+        return Response({"message": "인증번호가 발송되었습니다."})
+
 
 class VerifyPhoneView(APIView):
+    throttle_scope = "otp_verify"
+    throttle_field = "phone"
+    throttle_classes = SLIDING_WINDOW_THROTTLES
     serializer_class = PhoneVerificationConfirmSerializer
 
     @extend_schema(
@@ -517,28 +531,22 @@ class VerifyPhoneView(APIView):
 
         phone = serializer.validated_data["phone"]
         code = serializer.validated_data["code"]
-        formatted_phone = format_phone_for_twilio(phone)
 
+        # Redis 에 저장된 해시와 비교 (외부 호출 없음)
         try:
-            client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
-            verification_check = client.verify.v2.services(
-                settings.TWILIO_VERIFY_SERVICE_SID
-            ).verification_checks.create(to=formatted_phone, code=code)
-
-            if verification_check.status == "approved":
-                cache.set(f"phone_verified:{phone}", "true", timeout=300)
-                return Response(
-                    {"message": "인증이 완료되었습니다."}, status=status.HTTP_200_OK
-                )
-            else:
-                return Response(
-                    {"error": "잘못된 인증번호입니다."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-        except TwilioRestException as e:
+            verify_code(phone, code)
+            cache.set(verified_key(phone), "true", timeout=300)
+        except OTPError as e:
+            return Response({"error": e.message}, status=e.status_code)
+        except RedisError as e:
+            logger.error(f"인증번호 저장소 오류: {e}")
             return Response(
-                {"error": f"인증 실패: {str(e)}"}, status=status.HTTP_400_BAD_REQUEST
+                {"error": "인증을 처리하지 못했습니다. 잠시 후 다시 시도해주세요."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
+        return Response(
+            {"message": "인증이 완료되었습니다."}, status=status.HTTP_200_OK
+        )
 
 
 class TokenRefreshView(GenericAPIView):
@@ -561,18 +569,15 @@ class TokenRefreshView(GenericAPIView):
         },
     )
     def post(self, request: Request) -> Response:
-        # Redis를 이용한 동시성 제어
-        redis_client = get_redis_connection("default")
-
         try:
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
             refresh_token = serializer.validated_data["refresh_token"]
-            token = RefreshToken(refresh_token)
 
-            # 새로운 액세스 토큰과 리프레시 토큰 생성
-            access_token = str(token.access_token)
-            new_refresh_token = str(token)
+            # 같은 리프레시 토큰의 동시 요청은 한 번만 회전하고 같은 토큰 쌍을 공유
+            # (이전 리프레시 토큰은 Redis 블랙리스트에 남은 수명 동안만 등록)
+            access_token, new_refresh_token = refresh_single_flight(refresh_token)
+            token = RefreshToken(new_refresh_token, verify=False)  # type: ignore[arg-type]
 
             # Redis에 새로운 토큰 정보 업데이트
             user_id = token.payload.get("user_id")
@@ -598,6 +603,13 @@ class TokenRefreshView(GenericAPIView):
 
             return response
 
+        except TokenRefreshInProgress as e:
+            response = Response(
+                {"error": "토큰 갱신이 진행 중입니다. 잠시 후 다시 시도해주세요."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+            response["Retry-After"] = str(e.retry_after)
+            return response
         except TokenError:
             return Response(
                 {"error": "유효하지 않은 리프레시 토큰입니다."},
@@ -612,6 +624,10 @@ class TokenRefreshView(GenericAPIView):
 
 
 class UserPhoneCheckView(APIView):
+    throttle_scope = "phone_check"
+    throttle_field = "phone"
+    throttle_classes = SLIDING_WINDOW_THROTTLES
+
     @extend_schema(
         tags=["user"],
         summary="휴대폰 번호로 계정 확인(계정찾기)",
@@ -634,7 +650,9 @@ class UserPhoneCheckView(APIView):
         phone = serializer.validated_data["phone"]
 
         try:
-            user = CustomUser.objects.get(phone=phone)
+            if not might_contain("phone", phone):
+                raise CustomUser.DoesNotExist
+            user = CustomUser.objects.by_phone(phone).get()
 
             if not user.is_active:
                 return Response(
@@ -662,6 +680,9 @@ class UserPhoneCheckView(APIView):
 
 
 class PasswordResetView(APIView):
+    throttle_scope = "password_reset"
+    throttle_field = "email"
+    throttle_classes = SLIDING_WINDOW_THROTTLES
     serializer_class = PasswordResetRequestSerializer
 
     @extend_schema(
@@ -707,15 +728,8 @@ class PasswordResetView(APIView):
                 {"user": user, "temp_password": temp_password},
             )
 
-            # 이메일 발송
-            send_mail(
-                subject=subject,
-                message="",
-                from_email=settings.EMAIL_HOST_USER,
-                recipient_list=[email],
-                html_message=html_message,
-                fail_silently=False,
-            )
+            # 이메일 발송 (outbox 에 적재, send_mail_outbox 프로세스가 발송)
+            enqueue_email(subject=subject, to=[email], html_message=html_message)
 
             return Response(
                 {"message": "임시 비밀번호가 이메일로 발송되었습니다."},